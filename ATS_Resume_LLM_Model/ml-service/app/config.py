@@ -0,0 +1,69 @@
+"""
+Service Configuration
+Tunables read from the environment with defaults suitable for local use
+"""
+
+import os
+from pathlib import Path
+
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment"""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+class Settings:
+    """Runtime settings for the ML service"""
+
+    # Parsed resume cache
+    PARSE_CACHE_MAX_ENTRIES = _env_int("PARSE_CACHE_MAX_ENTRIES", 2048)
+    PARSE_CACHE_MAX_BYTES = _env_int("PARSE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+    # Corpus-fitted TF-IDF artifact used by the matcher
+    TFIDF_MODEL_PATH = os.getenv("TFIDF_MODEL_PATH", str(SERVICE_ROOT / "models" / "tfidf"))
+
+    # Persistent candidate store (empty keeps the candidate index in memory only)
+    CANDIDATE_STORE_PATH = os.getenv(
+        "CANDIDATE_STORE_PATH", str(SERVICE_ROOT / "data" / "candidates")
+    )
+
+    # Job weight profiles and cached per-job component scores (empty keeps them in memory)
+    JOB_SCORES_PATH = os.getenv("JOB_SCORES_PATH", str(SERVICE_ROOT / "data" / "job_scores"))
+
+    # Live resume scoring: quiet period before re-scoring edits, and the
+    # longest an edit waits during continuous typing
+    LIVE_DEBOUNCE_MS = _env_int("LIVE_DEBOUNCE_MS", 150)
+    LIVE_MAX_DELAY_MS = _env_int("LIVE_MAX_DELAY_MS", 1000)
+
+    # Background screening batches (SQLite queue, resumes per checkpoint)
+    BATCH_QUEUE_PATH = os.getenv("BATCH_QUEUE_PATH", str(SERVICE_ROOT / "data" / "batches.sqlite3"))
+    BATCH_CHUNK_SIZE = _env_int("BATCH_CHUNK_SIZE", 256)
+
+    # Batch worker processes (0 runs batches inline)
+    WORKER_PROCESSES = _env_int("WORKER_PROCESSES", os.cpu_count() or 1)
+    WORKER_CHUNK_SIZE = _env_int("WORKER_CHUNK_SIZE", 16)
+
+    # Request admission for CPU-bound handlers
+    CPU_MAX_IN_FLIGHT = _env_int("CPU_MAX_IN_FLIGHT", 4)
+    CPU_MAX_QUEUE_DEPTH = _env_int("CPU_MAX_QUEUE_DEPTH", 32)
+    CPU_RETRY_AFTER_SECONDS = _env_int("CPU_RETRY_AFTER_SECONDS", 1)
+
+    # Threads for running independent analysis stages of one request
+    # concurrently (0 runs them in order on the request's executor thread)
+    PIPELINE_THREADS = _env_int("PIPELINE_THREADS", 0)
+
+    # fast_json responses: smallest body gzipped for clients that accept
+    # it, and the gzip level (1 fastest .. 9 smallest)
+    RESPONSE_GZIP_MIN_BYTES = _env_int("RESPONSE_GZIP_MIN_BYTES", 1024)
+    RESPONSE_GZIP_LEVEL = _env_int("RESPONSE_GZIP_LEVEL", 1)
+
+    # Binary bulk ingest: largest msgpack frame or Arrow IPC message
+    # buffered while decoding
+    BULK_MAX_FRAME_BYTES = _env_int("BULK_MAX_FRAME_BYTES", 32 * 1024 * 1024)
+
+
+settings = Settings()
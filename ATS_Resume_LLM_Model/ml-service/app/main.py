@@ -5,7 +5,12 @@ FastAPI application for resume parsing, JD matching, and ATS scoring
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import resume, matching, scoring, suggestions
+from app.routers import resume, matching, scoring, suggestions, jobs, candidates, batches
+from app.services.batch_queue import batch_runner
+from app.services.candidate_index import candidate_index
+from app.services.executor import cpu_executor
+from app.services.pipeline import analysis_pipeline
+from app.services.worker_pool import worker_pool
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -30,6 +35,30 @@ app.include_router(resume.router, prefix="/api/resume", tags=["Resume"])
 app.include_router(matching.router, prefix="/api/matching", tags=["Matching"])
 app.include_router(scoring.router, prefix="/api/scoring", tags=["Scoring"])
 app.include_router(suggestions.router, prefix="/api/suggestions", tags=["Suggestions"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["Jobs"])
+app.include_router(candidates.router, prefix="/api/candidates", tags=["Candidates"])
+app.include_router(batches.router, prefix="/api/batches", tags=["Batches"])
+
+
+@app.on_event("startup")
+async def load_candidates():
+    """Rebuild the candidate index from the persistent store"""
+    candidate_index.load()
+
+
+@app.on_event("startup")
+async def start_batch_runner():
+    """Resume unfinished screening batches in the background"""
+    batch_runner.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_workers():
+    """Stop batch worker processes and executor threads"""
+    await batch_runner.stop()
+    worker_pool.shutdown()
+    cpu_executor.shutdown()
+    analysis_pipeline.shutdown()
 
 
 @app.get("/", tags=["Health"])
@@ -52,5 +81,6 @@ async def health_check():
             "jd_matcher": "operational",
             "ats_scorer": "operational",
             "suggestion_engine": "operational"
-        }
+        },
+        "load": cpu_executor.stats()
     }
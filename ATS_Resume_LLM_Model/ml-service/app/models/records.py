@@ -0,0 +1,122 @@
+"""
+Resume Records
+Compact slotted forms of the parsed resume models for batch and ranking paths
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
+from app.models.schemas import ParsedResume
+
+
+class SkillVocabulary:
+    """Interns skill names to small integer ids shared by every record in a process"""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, name: str) -> int:
+        """Id of a skill name, assigned on first sight"""
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(name)
+                if skill_id is None:
+                    self.names.append(name)
+                    skill_id = self._ids[name] = len(self.names) - 1
+        return skill_id
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+skill_vocabulary = SkillVocabulary()
+
+
+@dataclass(slots=True)
+class SkillRecord:
+    """Skill with its name interned in skill_vocabulary"""
+    skill_id: int
+    category: str = "technical"
+    proficiency: Optional[str] = None
+
+    @classmethod
+    def named(cls, name: str, category: str = "technical", proficiency: Optional[str] = None) -> "SkillRecord":
+        return cls(skill_vocabulary.intern(name), category, proficiency)
+
+    @property
+    def name(self) -> str:
+        return skill_vocabulary.names[self.skill_id]
+
+    def __reduce__(self):
+        # Ids are per process, so records cross process boundaries by name
+        return SkillRecord.named, (self.name, self.category, self.proficiency)
+
+
+@dataclass(slots=True)
+class EducationRecord:
+    """Education history entry"""
+    degree: str
+    field: str
+    institution: str
+    year: Optional[int] = None
+    gpa: Optional[float] = None
+
+
+@dataclass(slots=True)
+class ExperienceRecord:
+    """Work experience entry"""
+    title: str
+    company: str
+    duration: str
+    years: float
+    description: Optional[str] = None
+    skills_used: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class CertificationRecord:
+    """Certification entry"""
+    name: str
+    issuer: str
+    year: Optional[int] = None
+    valid: bool = True
+
+
+@dataclass(slots=True)
+class ResumeRecord:
+    """
+    Parsed resume without pydantic validation or per-instance dicts
+
+    Has the attributes of ParsedResume, so matching and scoring accept
+    either; to_model() gives the ParsedResume a response serializes.
+    """
+    candidate_id: str
+    anonymized_name: str
+    skills: List[SkillRecord] = field(default_factory=list)
+    education: List[EducationRecord] = field(default_factory=list)
+    experience: List[ExperienceRecord] = field(default_factory=list)
+    certifications: List[CertificationRecord] = field(default_factory=list)
+    total_experience_years: float = 0.0
+    primary_role: Optional[str] = None
+    summary: Optional[str] = None
+    original_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+
+    def to_model(self) -> ParsedResume:
+        """Validated ParsedResume with the same values"""
+        return ParsedResume.model_validate(self, from_attributes=True)
+
+
+# Either form of a parsed resume
+Resume = Union[ParsedResume, ResumeRecord]
+
+
+def as_parsed_resume(resume: Resume) -> ParsedResume:
+    """The ParsedResume of a resume in either form"""
+    return resume.to_model() if isinstance(resume, ResumeRecord) else resume
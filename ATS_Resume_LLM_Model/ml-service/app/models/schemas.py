@@ -2,8 +2,8 @@
 Pydantic Models for ATS Resume Checker ML Service
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Literal, Optional, Dict
 from enum import Enum
 
 
@@ -85,6 +85,37 @@ class JobDescription(BaseModel):
     department: Optional[str] = None
 
 
+class MatchWeights(BaseModel):
+    """Match score weights (defaults are MatcherService.MATCH_WEIGHTS)"""
+    semantic: float = Field(default=0.25, ge=0)
+    skills: float = Field(default=0.40, ge=0)
+    experience: float = Field(default=0.20, ge=0)
+    education: float = Field(default=0.15, ge=0)
+
+
+class ATSWeights(BaseModel):
+    """ATS component weights (defaults are ScorerService.WEIGHTS)"""
+    skills: float = Field(default=0.40, ge=0)
+    experience: float = Field(default=0.30, ge=0)
+    education: float = Field(default=0.15, ge=0)
+    keywords: float = Field(default=0.10, ge=0)
+    format: float = Field(default=0.05, ge=0)
+
+
+class WeightProfile(BaseModel):
+    """Per-job scoring weights and ATS recommendation thresholds"""
+    match_weights: MatchWeights = MatchWeights()
+    ats_weights: ATSWeights = ATSWeights()
+    hire_threshold: float = Field(default=80, ge=0, le=100)
+    review_threshold: float = Field(default=60, ge=0, le=100)
+
+    @model_validator(mode="after")
+    def check_thresholds(self) -> "WeightProfile":
+        if self.review_threshold > self.hire_threshold:
+            raise ValueError("review_threshold must not exceed hire_threshold")
+        return self
+
+
 class MatchResult(BaseModel):
     """JD-Resume matching result"""
     match_score: float = Field(..., ge=0, le=100)
@@ -131,6 +162,36 @@ class Suggestion(BaseModel):
     title: str
     description: str
     action_items: List[str] = []
+    action_gains: List[float] = []  # estimated ATS points per action item
+    estimated_gain: Optional[float] = None  # ATS points with all action items applied
+
+
+class ResumeEdit(BaseModel):
+    """Hypothetical resume edit scored by the delta scorer"""
+    kind: Literal["skill", "keyword", "summary", "certification", "experience"]
+    value: str = ""  # skill, keyword, summary text, certification name or role text
+
+
+class EditImpact(BaseModel):
+    """Estimated scores after a resume edit and the gain over the current resume"""
+    edit: ResumeEdit
+    ats_score: float
+    ats_score_gain: float
+    match_score: Optional[float] = None
+    match_score_gain: Optional[float] = None
+
+
+# ParsedResume fields a fields= selector can name
+ResumeField = Literal[
+    "candidate_id", "anonymized_name", "skills", "education", "experience",
+    "certifications", "total_experience_years", "primary_role", "summary",
+    "original_name", "email", "phone", "location"
+]
+
+# Analysis outputs a fields= selector can name, besides ParsedResume fields
+AnalysisField = Literal[
+    ResumeField, "parsed_resume", "ats_score", "match_result", "keyword_gaps", "suggestions"
+]
 
 
 class ResumeAnalysisRequest(BaseModel):
@@ -139,6 +200,8 @@ class ResumeAnalysisRequest(BaseModel):
     job_description: Optional[str] = None
     job_id: Optional[str] = None
     anonymize: bool = True
+    # Only these outputs and parsed resume fields (everything if None)
+    fields: Optional[List[AnalysisField]] = None
 
 
 class ResumeAnalysisResponse(BaseModel):
@@ -0,0 +1,81 @@
+"""
+Fast JSON Responses
+orjson-encoded responses for large batch and ranking results, gzipped when the client accepts it
+"""
+
+import gzip
+from typing import Any, Mapping, Optional
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.config import settings
+
+
+def _default(obj: Any) -> Any:
+    """Encode what orjson has no native support for"""
+    if isinstance(obj, BaseModel):
+        # Field values as they are; orjson encodes nested models and enums
+        return obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header value allows a gzip response"""
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response encoded with orjson instead of jsonable_encoder and json
+
+    Content is encoded as given: dicts, lists, scalars, enums, dataclasses,
+    NumPy values and pydantic models (by field value, so models must not
+    rely on aliases or custom serializers, as none here do). With compress
+    set, bodies of at least RESPONSE_GZIP_MIN_BYTES are gzipped.
+    """
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        compress: bool = False
+    ):
+        """
+        Args:
+            content: Response body before encoding
+            status_code: HTTP status
+            headers: Extra response headers
+            compress: Whether the client accepts gzip (see accepts_gzip)
+        """
+        self.compress = compress
+        self.compressed = False
+        super().__init__(content, status_code, headers)
+
+    def render(self, content: Any) -> bytes:
+        body = orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+        if self.compress and len(body) >= settings.RESPONSE_GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=settings.RESPONSE_GZIP_LEVEL)
+            self.compressed = True
+        return body
+
+    def init_headers(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        # The encoding depends on the request's Accept-Encoding
+        headers = {**(headers or {}), "vary": "Accept-Encoding"}
+        if self.compressed:
+            headers["content-encoding"] = "gzip"
+        super().init_headers(headers)
@@ -0,0 +1,126 @@
+"""
+Batches Router - API endpoints for background screening batches
+"""
+
+import asyncio
+import json
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from typing import AsyncIterator, List, Literal, Optional
+
+from app.services.batch_queue import FINISHED_STATES, batch_queue, batch_runner
+from app.services.job_registry import job_registry
+from app.models.schemas import JobDescription
+
+router = APIRouter()
+
+# Seconds between progress events on /{batch_id}/events
+PROGRESS_INTERVAL = 1.0
+
+
+class SubmitBatchRequest(BaseModel):
+    resume_texts: List[str]
+    candidate_ids: Optional[List[Optional[str]]] = None
+    job_description: Optional[JobDescription] = None
+    job_id: Optional[str] = None
+
+
+@router.post("", status_code=202)
+async def submit_batch(request: SubmitBatchRequest):
+    """Queue resumes to be parsed, matched and scored against a job"""
+    if request.job_id:
+        compiled = job_registry.get(request.job_id)
+        if compiled is None:
+            raise HTTPException(status_code=404, detail=f"Job {request.job_id} not found")
+        job = compiled.job
+    elif request.job_description is not None:
+        job = request.job_description
+    else:
+        raise HTTPException(status_code=400, detail="Provide job_id or job_description")
+    if request.candidate_ids and len(request.candidate_ids) > len(request.resume_texts):
+        raise HTTPException(status_code=400, detail="More candidate_ids than resume_texts")
+
+    try:
+        batch_id = await asyncio.to_thread(
+            batch_queue.submit, request.resume_texts, job, request.candidate_ids
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    batch_runner.notify()
+    return {"success": True, "batch": await asyncio.to_thread(batch_queue.get, batch_id)}
+
+
+@router.get("")
+async def list_batches(limit: int = Query(default=100, ge=1, le=1000)):
+    """Most recent batches"""
+    return {"success": True, "batches": await asyncio.to_thread(batch_queue.list, limit)}
+
+
+@router.get("/{batch_id}")
+async def get_batch(batch_id: str):
+    """Status and progress of a batch"""
+    batch = await asyncio.to_thread(batch_queue.get, batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return {"success": True, "batch": batch}
+
+
+@router.get("/{batch_id}/events")
+async def batch_events(batch_id: str):
+    """Server-sent progress events until the batch finishes"""
+    if await asyncio.to_thread(batch_queue.get, batch_id) is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return StreamingResponse(_progress_events(batch_id), media_type="text/event-stream")
+
+
+async def _progress_events(batch_id: str) -> AsyncIterator[str]:
+    """One "progress" event per change, then a final "done" event"""
+    last = None
+    while True:
+        batch = await asyncio.to_thread(batch_queue.get, batch_id)
+        if batch is None:
+            return
+        state = (batch["status"], batch["processed"])
+        if state != last:
+            last = state
+            event = "done" if batch["status"] in FINISHED_STATES else "progress"
+            yield f"event: {event}\ndata: {json.dumps(batch, separators=(',', ':'))}\n\n"
+            if event == "done":
+                return
+        await asyncio.sleep(PROGRESS_INTERVAL)
+
+
+@router.get("/{batch_id}/results")
+async def batch_results(
+    batch_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    order: Literal["score", "input"] = "score"
+):
+    """A page of finished results, best first or in input order"""
+    batch = await asyncio.to_thread(batch_queue.get, batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return {
+        "success": True,
+        "batch": batch,
+        "results": await asyncio.to_thread(batch_queue.results, batch_id, offset, limit, order)
+    }
+
+
+@router.post("/{batch_id}/cancel")
+async def cancel_batch(batch_id: str):
+    """Stop a queued or running batch; finished results are kept"""
+    if not await asyncio.to_thread(batch_queue.cancel, batch_id):
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return {"success": True, "batch": await asyncio.to_thread(batch_queue.get, batch_id)}
+
+
+@router.delete("/{batch_id}")
+async def delete_batch(batch_id: str):
+    """Remove a batch and its results"""
+    if not await asyncio.to_thread(batch_queue.delete, batch_id):
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return {"success": True, "batch_id": batch_id}
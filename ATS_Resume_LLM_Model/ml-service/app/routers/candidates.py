@@ -0,0 +1,220 @@
+"""
+Candidates Router - API endpoints for the indexed candidate pool
+"""
+
+import asyncio
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from pydantic import BaseModel, Field
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from app.services.bulk_ingest import BulkFormatError, IngestRecord, decode_records
+from app.services.candidate_index import candidate_index, last_occurrences
+from app.services.executor import cpu_executor
+from app.services.job_registry import job_registry
+from app.services.matcher import matcher_service
+from app.services.worker_pool import worker_pool, parse_resume_chunk
+from app.models.schemas import JobDescription
+from app.routers.matching import candidate_ranking
+
+router = APIRouter()
+
+# Records per bulk ingest window, in worker chunks per worker
+BULK_WINDOW_CHUNKS = 4
+
+
+class CandidateInput(BaseModel):
+    resume_text: str
+    candidate_id: Optional[str] = None
+
+
+class AddCandidatesRequest(BaseModel):
+    candidates: List[CandidateInput]
+
+
+class SearchRequest(BaseModel):
+    job_description: Optional[JobDescription] = None
+    job_id: Optional[str] = None
+    top_k: int = Field(default=10, ge=1)
+    skill_query: Optional[str] = None
+
+
+class FilterRequest(BaseModel):
+    skill_query: str
+    limit: int = Field(default=100, ge=0)
+
+
+def _require_model() -> None:
+    if matcher_service.model is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Candidate index requires a fitted TF-IDF model (TFIDF_MODEL_PATH)"
+        )
+
+
+async def _add_to_index(candidates: Sequence[Tuple[Optional[str], str]]) -> List[str]:
+    """
+    Parse (candidate id or None, resume text) pairs in the worker pool and index them
+
+    A candidate id given more than once is parsed and added once, from its last record.
+    """
+    candidates = [candidates[i] for i in last_occurrences([c for c, _ in candidates])]
+    async with cpu_executor.slot():
+        parsed = await worker_pool.map(parse_resume_chunk, candidates)
+    entries = [
+        (p["id"] or p["parsed_resume"].candidate_id, p["parsed_resume"])
+        for p in parsed
+    ]
+    vectors = matcher_service.stack_rows(
+        [p["resume_vector"] for p in parsed], matcher_service.model.n_features
+    )
+    await cpu_executor.run(candidate_index.add, entries, vectors)
+    # Generated ids repeat for identical resume texts
+    return list(dict.fromkeys(candidate_id for candidate_id, _ in entries))
+
+
+@router.post("", status_code=201)
+async def add_candidates(request: AddCandidatesRequest):
+    """Parse resumes and add them to the candidate index"""
+    _require_model()
+    try:
+        candidate_ids = await _add_to_index(
+            [(c.candidate_id, c.resume_text) for c in request.candidates]
+        )
+        return {"success": True, "candidate_ids": candidate_ids, "total": len(candidate_index)}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/bulk", status_code=201)
+async def bulk_add_candidates(request: Request):
+    """
+    Add a binary stream of resume records to the candidate index
+
+    The body is a length-prefixed msgpack stream (application/x-msgpack)
+    or an Arrow IPC stream (application/vnd.apache.arrow.stream) of
+    records with resume_text and an optional candidate_id, see
+    bulk_ingest. Records are decoded as the body arrives and indexed one
+    window at a time while the next window is read, so memory holds about
+    two windows whatever the batch size. Windows are indexed as they
+    complete: if a later record is malformed, the 400 reports how many
+    candidates before it were added. A candidate id repeated in the
+    stream is replaced by its last record, and listed once.
+    """
+    _require_model()
+    try:
+        records = decode_records(request.headers.get("content-type"), request.stream())
+    except BulkFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+
+    # Ordered set: a later window may replace an id an earlier one added
+    candidate_ids: Dict[str, None] = {}
+    pending: Optional[asyncio.Future] = None
+    try:
+        async for window in _record_windows(records):
+            if pending is not None:
+                candidate_ids.update(dict.fromkeys(await pending))
+            pending = asyncio.ensure_future(_add_to_index(window))
+        if pending is not None:
+            candidate_ids.update(dict.fromkeys(await pending))
+            pending = None
+        return {"success": True, "candidate_ids": list(candidate_ids), "total": len(candidate_index)}
+    except BulkFormatError as e:
+        if pending is not None:
+            candidate_ids.update(dict.fromkeys(await pending))
+            pending = None
+        raise HTTPException(
+            status_code=400, detail=f"{e}; {len(candidate_ids)} candidates before it were added"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def _record_windows(records: AsyncIterator[IngestRecord]) -> AsyncIterator[List[IngestRecord]]:
+    """Decoded records grouped into windows of a few worker chunks per worker"""
+    size = worker_pool.chunk_size * BULK_WINDOW_CHUNKS * max(1, worker_pool.max_workers)
+    window: List[IngestRecord] = []
+    async for record in records:
+        window.append(record)
+        if len(window) == size:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
+@router.delete("/{candidate_id}")
+async def delete_candidate(candidate_id: str, background_tasks: BackgroundTasks):
+    """Remove a candidate from the index, compacting it after the response if due"""
+    if not await cpu_executor.run(candidate_index.delete, candidate_id):
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    if candidate_index.needs_compaction:
+        background_tasks.add_task(_compact_index)
+    return {"success": True, "candidate_id": candidate_id}
+
+
+def _compact_index() -> None:
+    # Runs on a threadpool thread; an earlier scheduled run may have compacted already
+    if candidate_index.needs_compaction:
+        candidate_index.compact()
+
+
+@router.get("/stats")
+async def index_stats():
+    """Candidate index size"""
+    return {"success": True, "stats": candidate_index.stats()}
+
+
+@router.post("/filter")
+async def filter_candidates(request: FilterRequest):
+    """Candidates matching a boolean skill query, e.g. python AND (aws OR gcp)"""
+    try:
+        matches = await cpu_executor.run(candidate_index.filter, request.skill_query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"success": True, "total": len(matches), "candidate_ids": matches[:request.limit]}
+
+
+@router.post("/search")
+async def search_candidates(request: SearchRequest):
+    """Top-k indexed candidates for a registered or inline job"""
+    _require_model()
+    try:
+        if request.job_id:
+            job = job_registry.get(request.job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail=f"Job {request.job_id} not found")
+        elif request.job_description is not None:
+            job = matcher_service.compile_job(request.job_description)
+        else:
+            raise HTTPException(status_code=400, detail="Provide job_id or job_description")
+
+        try:
+            ranked = await cpu_executor.run(
+                candidate_index.search, job, request.top_k, request.skill_query
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        rankings = [
+            candidate_ranking(
+                c["id"], c["parsed_resume"], c["rank"],
+                c["match_result"].match_score, c["match_result"].skill_match_percentage
+            )
+            for c in ranked
+        ]
+        return {"success": True, "total": len(candidate_index), "rankings": rankings}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,244 @@
+"""
+Jobs Router - API endpoints for the job registry
+"""
+
+import time
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+
+from app.services.candidate_index import candidate_index
+from app.services.executor import cpu_executor
+from app.services.job_registry import job_registry
+from app.services.job_scores import job_scores
+from app.services.matcher import CompiledJob, matcher_service
+from app.services.resume_parser import resume_parser
+from app.models.records import Resume
+from app.models.schemas import (
+    JobDescription, MatchResult, RecommendationStatus, WeightProfile
+)
+
+router = APIRouter()
+
+
+class JobResponse(BaseModel):
+    success: bool
+    job: JobDescription
+
+
+class JobListResponse(BaseModel):
+    success: bool
+    jobs: List[JobDescription]
+
+
+class ProfileResponse(BaseModel):
+    success: bool
+    job_id: str
+    profile: WeightProfile
+
+
+class RankingRequest(BaseModel):
+    profile: Optional[WeightProfile] = None
+    top_k: int = Field(default=10, ge=1)
+    offset: int = Field(default=0, ge=0)
+    rank_by: Literal["match", "ats"] = "match"
+
+
+class RankedCandidate(BaseModel):
+    candidate_id: str
+    name: Optional[str] = None
+    rank: int
+    match_score: float
+    ats_score: float
+    recommendation: RecommendationStatus
+
+
+class RankingResponse(BaseModel):
+    success: bool
+    job_id: str
+    profile: WeightProfile
+    total: int
+    rankings: List[RankedCandidate]
+    timing_ms: Dict[str, float]
+
+
+class RecommendRequest(BaseModel):
+    resume_text: Optional[str] = None
+    candidate_id: Optional[str] = None
+    top_k: int = Field(default=10, ge=1)
+
+
+class JobRecommendation(BaseModel):
+    rank: int
+    job: JobDescription
+    match_result: MatchResult
+
+
+class RecommendResponse(BaseModel):
+    success: bool
+    total: int
+    recommendations: List[JobRecommendation]
+
+
+@router.get("", response_model=JobListResponse)
+async def list_jobs():
+    """List registered jobs"""
+    return JobListResponse(success=True, jobs=job_registry.list_jobs())
+
+
+@router.post("", response_model=JobResponse, status_code=201)
+async def create_job(job: JobDescription):
+    """Register a job and precompute its matching artifacts"""
+    try:
+        compiled = job_registry.create(job)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return JobResponse(success=True, job=compiled.job)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """Get a registered job"""
+    compiled = job_registry.get(job_id)
+    if compiled is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(success=True, job=compiled.job)
+
+
+@router.put("/{job_id}", response_model=JobResponse)
+async def update_job(job_id: str, job: JobDescription):
+    """Replace a registered job and recompute its artifacts"""
+    try:
+        compiled = job_registry.update(job_id, job)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(success=True, job=compiled.job)
+
+
+@router.delete("/{job_id}")
+async def delete_job(job_id: str):
+    """Remove a registered job"""
+    try:
+        job_registry.delete(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
+    job_scores.forget(job_id)
+    return {"success": True, "job_id": job_id}
+
+
+@router.get("/{job_id}/profile", response_model=ProfileResponse)
+async def get_job_profile(job_id: str):
+    """Weight profile of a registered job"""
+    if job_registry.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return ProfileResponse(success=True, job_id=job_id, profile=job_scores.profile(job_id))
+
+
+@router.put("/{job_id}/profile", response_model=RankingResponse)
+async def set_job_profile(
+    job_id: str,
+    profile: WeightProfile,
+    top_k: int = Query(default=10, ge=1),
+    rank_by: Literal["match", "ats"] = "match"
+):
+    """Save a job's weight profile and return the pool re-ranked under it"""
+    compiled = job_registry.get(job_id)
+    if compiled is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    job_scores.set_profile(job_id, profile)
+    return await _job_ranking(compiled, RankingRequest(top_k=top_k, rank_by=rank_by))
+
+
+@router.post("/{job_id}/ranking", response_model=RankingResponse)
+async def rank_job_candidates(job_id: str, request: RankingRequest):
+    """
+    Rank the candidate pool for a job under its profile (or a one-off override)
+
+    Component scores are cached per job and pool, so only the first ranking
+    after the job or pool changes scores candidates; later ones re-weight.
+    """
+    compiled = job_registry.get(job_id)
+    if compiled is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return await _job_ranking(compiled, request)
+
+
+async def _job_ranking(compiled: CompiledJob, request: RankingRequest) -> RankingResponse:
+    if matcher_service.model is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Job rankings require a fitted TF-IDF model (TFIDF_MODEL_PATH)"
+        )
+    try:
+        return await cpu_executor.run(_rank_job_candidates, compiled, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _rank_job_candidates(compiled: CompiledJob, request: RankingRequest) -> RankingResponse:
+    """Load or compute the job's score table and re-weight it on an executor thread"""
+    profile = request.profile or job_scores.profile(compiled.job_id)
+    start = time.perf_counter()
+    table = job_scores.table(compiled)
+    loaded = time.perf_counter()
+    ranked = job_scores.rank(table, profile, request.top_k, request.offset, request.rank_by)
+    done = time.perf_counter()
+    return RankingResponse(
+        success=True,
+        job_id=compiled.job_id,
+        profile=profile,
+        total=len(table),
+        rankings=ranked,
+        timing_ms={
+            "components": round((loaded - start) * 1000, 3),
+            "rank": round((done - loaded) * 1000, 3),
+        }
+    )
+
+
+@router.post("/recommend", response_model=RecommendResponse)
+async def recommend_jobs(request: RecommendRequest):
+    """Best-matching registered jobs for a resume or an indexed candidate"""
+    if matcher_service.model is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Job recommendations require a fitted TF-IDF model (TFIDF_MODEL_PATH)"
+        )
+    if request.candidate_id:
+        parsed = candidate_index.get(request.candidate_id)
+        if parsed is None:
+            raise HTTPException(status_code=404, detail="Candidate not found")
+    elif request.resume_text is None:
+        raise HTTPException(status_code=400, detail="Provide resume_text or candidate_id")
+    else:
+        parsed = None
+    try:
+        return await cpu_executor.run(
+            _recommend_jobs, request.resume_text, parsed, request.top_k
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _recommend_jobs(
+    resume_text: Optional[str],
+    parsed: Optional[Resume],
+    top_k: int
+) -> RecommendResponse:
+    """Parse if needed and query the job index on an executor thread"""
+    if parsed is None:
+        parsed = resume_parser.parse_resume(resume_text)
+    ranked = job_registry.recommend(parsed, top_k)
+    return RecommendResponse(
+        success=True,
+        total=len(job_registry.index),
+        recommendations=[
+            JobRecommendation(rank=r["rank"], job=r["job"].job, match_result=r["match_result"])
+            for r in ranked
+        ]
+    )
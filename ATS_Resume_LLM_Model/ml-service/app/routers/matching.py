@@ -2,20 +2,41 @@
 Matching Router - API endpoints for JD-Resume matching
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
+import asyncio
+import heapq
+import json
 
-from app.services.matcher import matcher_service
-from app.services.resume_parser import resume_parser
-from app.models.schemas import JobDescription, MatchResult, KeywordGap, CandidateRanking
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Tuple
+
+import numpy as np
+
+from app.services.matcher import CompiledJob, matcher_service
+from app.services.candidate_index import candidate_index
+from app.services.job_registry import job_registry
+from app.services.executor import cpu_executor
+from app.services.pipeline import analysis_pipeline
+from app.services.worker_pool import worker_pool, parse_resume_chunk
+from app.models.records import Resume
+from app.models.schemas import (
+    JobDescription, MatchResult, KeywordGap, CandidateRanking
+)
+from app.responses import FastJSONResponse, accepts_gzip
 
 router = APIRouter()
 
+# Summary size for streamed rankings when top_k is not given
+STREAM_SUMMARY_TOP_K = 10
+# Worker chunks per streamed window (per worker process)
+STREAM_WINDOW_CHUNKS = 4
+
 
 class MatchRequest(BaseModel):
     resume_text: str
-    job_description: JobDescription
+    job_description: Optional[JobDescription] = None
+    job_id: Optional[str] = None
 
 
 class MatchResponse(BaseModel):
@@ -25,76 +46,386 @@ class MatchResponse(BaseModel):
 
 
 class RankCandidatesRequest(BaseModel):
-    resume_texts: List[str]
-    job_description: JobDescription
+    resume_texts: List[str] = []
+    candidate_ids: List[str] = []
+    job_description: Optional[JobDescription] = None
+    job_id: Optional[str] = None
+    top_k: Optional[int] = Field(default=None, ge=1)
+    offset: int = Field(default=0, ge=0)
+    stream: Optional[Literal["ndjson", "sse"]] = None
+    # Encode the response with orjson (gzipped if accepted)
+    fast_json: bool = False
+
+
+class MatrixRequest(BaseModel):
+    resume_texts: List[str] = []
+    candidate_ids: List[str] = []
+    job_descriptions: List[JobDescription] = []
+    job_ids: List[str] = []
+    top_k: Optional[int] = Field(default=None, ge=1)
+
+
+def _resolve_job(
+    job_id: Optional[str],
+    job_description: Optional[JobDescription]
+) -> CompiledJob:
+    """Look up a registered job or compile an inline job description"""
+    if job_id:
+        compiled = job_registry.get(job_id)
+        if compiled is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return compiled
+    if job_description is None:
+        raise HTTPException(status_code=400, detail="Provide job_id or job_description")
+    return matcher_service.compile_job(job_description)
 
 
 @router.post("/match", response_model=MatchResponse)
 async def match_resume_to_job(request: MatchRequest):
     """Match a resume against a job description"""
     try:
-        parsed = resume_parser.parse_resume(request.resume_text)
-        match_result = matcher_service.match_resume_to_job(
-            parsed, request.job_description
-        )
-        keyword_gaps = matcher_service.analyze_keyword_gaps(
-            request.resume_text,
-            request.job_description.description
-        )
-        
-        return MatchResponse(
-            success=True,
-            match_result=match_result,
-            keyword_gaps=keyword_gaps
-        )
+        job = _resolve_job(request.job_id, request.job_description)
+        return await cpu_executor.run(_match_resume_to_job, request.resume_text, job)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _match_resume_to_job(resume_text: str, job: CompiledJob) -> MatchResponse:
+    """Parse and match synchronously on an executor thread"""
+    result = analysis_pipeline.run(["match_result", "keyword_gaps"], resume_text, job)
+    
+    return MatchResponse(
+        success=True,
+        match_result=result["match_result"],
+        keyword_gaps=result["keyword_gaps"]
+    )
+
+
 @router.post("/keywords")
 async def analyze_keywords(resume_text: str, jd_text: str):
     """Analyze keyword gaps between resume and JD"""
     try:
-        gaps = matcher_service.analyze_keyword_gaps(resume_text, jd_text)
+        gaps = await cpu_executor.run(
+            matcher_service.analyze_keyword_gaps, resume_text, jd_text
+        )
         return {"success": True, "keyword_gaps": gaps}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/rank")
-async def rank_candidates(request: RankCandidatesRequest):
-    """Rank multiple candidates for a job"""
+async def rank_candidates(
+    request: RankCandidatesRequest,
+    accept_encoding: Optional[str] = Header(default=None)
+):
+    """
+    Rank multiple candidates for a job
+
+    Stored candidates given by candidate_ids are ranked from the candidate
+    index without re-parsing; resume_texts are parsed and ranked with them.
+    With stream set, results are streamed instead, see _stream_rankings.
+    With fast_json, rankings are plain dicts encoded by FastJSONResponse.
+    """
     try:
-        candidates = []
-        for i, text in enumerate(request.resume_texts):
-            parsed = resume_parser.parse_resume(text)
-            candidates.append({
-                "id": f"CAND-{i+1:03d}",
-                "parsed_resume": parsed
-            })
-        
-        ranked = matcher_service.rank_candidates(
-            candidates, request.job_description
-        )
+        # The JD is compiled once for the whole ranking
+        job = _resolve_job(request.job_id, request.job_description)
+        if not request.resume_texts and not request.candidate_ids:
+            raise HTTPException(status_code=400, detail="Provide resume_texts or candidate_ids")
+        missing = [c for c in request.candidate_ids if c not in candidate_index]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Candidate {missing[0]} not found")
+
+        if request.stream:
+            return await _stream_rankings(request, job)
+        if not request.resume_texts and job.vector is not None:
+            page_end = len(request.candidate_ids) if request.top_k is None \
+                else request.offset + request.top_k
+            ranked = await cpu_executor.run(
+                candidate_index.search, job, page_end, None, request.candidate_ids
+            )
+            ranked = ranked[request.offset:]
+            total = len(set(request.candidate_ids))
+        else:
+            candidates = [
+                (f"CAND-{i+1:03d}", text)
+                for i, text in enumerate(request.resume_texts)
+            ]
+            
+            # Parsing runs in worker processes; scoring is one vectorized pass
+            async with cpu_executor.slot():
+                parsed = await worker_pool.map(parse_resume_chunk, candidates)
+            parsed = [
+                {"id": candidate_id, "parsed_resume": candidate_index.get(candidate_id)}
+                for candidate_id in request.candidate_ids
+            ] + parsed
+            ranked = await cpu_executor.run(
+                matcher_service.rank_candidates,
+                parsed, job, top_k=request.top_k, offset=request.offset
+            )
+            total = len(parsed)
         
-        rankings = []
-        for c in ranked:
-            rankings.append(CandidateRanking(
-                candidate_id=c["id"],
-                name=c["parsed_resume"].anonymized_name,
-                rank=c["rank"],
-                ats_score=c["match_result"].match_score,
-                match_score=c["match_result"].skill_match_percentage,
-                recommendation=c["match_result"].match_score >= 80 and "Hire" or 
-                              (c["match_result"].match_score >= 60 and "Review" or "Reject"),
-                top_skills=[s.name for s in c["parsed_resume"].skills[:5]],
-                experience_years=c["parsed_resume"].total_experience_years
-            ))
+        ranking = _ranking_fields if request.fast_json else candidate_ranking
+        rankings = [
+            ranking(
+                c["id"], c["parsed_resume"], c["rank"],
+                c["match_result"].match_score, c["match_result"].skill_match_percentage
+            )
+            for c in ranked
+        ]
         
-        return {"success": True, "rankings": rankings}
+        if request.fast_json:
+            return FastJSONResponse(
+                {"success": True, "total": total, "rankings": rankings},
+                compress=accepts_gzip(accept_encoding)
+            )
+        return {"success": True, "total": total, "rankings": rankings}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _ranking_fields(
+    candidate_id: str,
+    parsed: Resume,
+    rank: int,
+    match_score: float,
+    skill_match_percentage: float
+) -> Dict[str, Any]:
+    """CandidateRanking fields for one scored candidate, unvalidated"""
+    return {
+        "candidate_id": candidate_id,
+        "name": parsed.anonymized_name,
+        "rank": rank,
+        "ats_score": match_score,
+        "match_score": skill_match_percentage,
+        "recommendation": match_score >= 80 and "Hire" or
+                          (match_score >= 60 and "Review" or "Reject"),
+        "top_skills": [s.name for s in parsed.skills[:5]],
+        "experience_years": parsed.total_experience_years,
+    }
+
+
+def candidate_ranking(
+    candidate_id: str,
+    parsed: Resume,
+    rank: int,
+    match_score: float,
+    skill_match_percentage: float
+) -> CandidateRanking:
+    """Ranking entry for one scored candidate"""
+    return CandidateRanking(**_ranking_fields(
+        candidate_id, parsed, rank, match_score, skill_match_percentage
+    ))
+
+
+async def _stream_rankings(request: RankCandidatesRequest, job: CompiledJob) -> StreamingResponse:
+    """
+    Stream per-candidate results as windows are scored, then a top-k summary
+
+    Candidates are parsed and scored one window (a few chunks per worker)
+    at a time, so memory holds two windows plus the summary heap. The first
+    window is scored before the response starts, so overload (429) and
+    errors up to that point still get a status code; later errors are
+    sent as an "error" event. Scores equal the non-streamed ranking, with
+    or without the corpus TF-IDF model, whatever the window size.
+
+    Events (NDJSON lines with a "type", or SSE events named by type):
+        candidate: CandidateRanking fields without rank, plus input index
+        summary: total and the ranked page [offset, offset + top_k)
+        error: detail
+    """
+    windows = _scored_windows(request, job)
+    try:
+        first = await windows.__anext__()
+    except BaseException:
+        await windows.aclose()
+        raise
+    events = _ranking_events(
+        first, windows, request.offset, request.top_k or STREAM_SUMMARY_TOP_K
+    )
+    if request.stream == "sse":
+        lines = (
+            f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+            async for event, data in events
+        )
+        return StreamingResponse(lines, media_type="text/event-stream")
+    lines = (
+        json.dumps({"type": event, **data}, separators=(",", ":")) + "\n"
+        async for event, data in events
+    )
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+async def _scored_windows(
+    request: RankCandidatesRequest,
+    job: CompiledJob
+) -> AsyncIterator[List[Tuple[str, Resume, float, float]]]:
+    """Parse and score candidates (stored ids first) one window at a time"""
+    window = worker_pool.chunk_size * STREAM_WINDOW_CHUNKS * max(1, worker_pool.max_workers)
+    ids = request.candidate_ids
+    for start in range(0, len(ids), window):
+        parsed = [
+            {"id": candidate_id, "parsed_resume": candidate_index.get(candidate_id)}
+            for candidate_id in ids[start:start + window]
+        ]
+        yield await cpu_executor.run(_score_window, parsed, job)
+
+    texts = request.resume_texts
+
+    async def parse(start: int) -> List[Dict]:
+        async with cpu_executor.slot():
+            return await worker_pool.map(parse_resume_chunk, [
+                (f"CAND-{i+1:03d}", text)
+                for i, text in enumerate(texts[start:start + window], start=start)
+            ])
+
+    # The next window is parsed while the current one is scored and sent
+    pending = asyncio.ensure_future(parse(0)) if texts else None
+    try:
+        for start in range(0, len(texts), window):
+            parsed = await pending
+            pending = None
+            if start + window < len(texts):
+                pending = asyncio.ensure_future(parse(start + window))
+            yield await cpu_executor.run(_score_window, parsed, job)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _score_window(
+    parsed: List[Dict],
+    job: CompiledJob
+) -> List[Tuple[str, Resume, float, float]]:
+    """(candidate id, parsed resume, match score, skill match %) per candidate"""
+    components = matcher_service.batch_components(
+        [c["parsed_resume"] for c in parsed], job, [c.get("resume_vector") for c in parsed]
+    )
+    scores = np.round(components["match_score"], 2).tolist()
+    skill_match = components["skill_match_pct"].tolist()
+    return [
+        (c["id"], c["parsed_resume"], score, round(pct, 2))
+        for c, score, pct in zip(parsed, scores, skill_match)
+    ]
+
+
+async def _ranking_events(
+    first: List[Tuple[str, Resume, float, float]],
+    windows: AsyncIterator[List[Tuple[str, Resume, float, float]]],
+    offset: int,
+    top_k: int
+) -> AsyncIterator[Tuple[str, Dict]]:
+    """Candidate events per scored window, then the summary page"""
+    # Min-heap of the best offset + top_k; ties keep input order like top_indices
+    heap: List[Tuple[float, int, CandidateRanking]] = []
+    total = 0
+    try:
+        window = first
+        while True:
+            for candidate_id, parsed, score, pct in window:
+                ranking = candidate_ranking(candidate_id, parsed, 0, score, pct)
+                yield "candidate", {
+                    "index": total, **ranking.model_dump(mode="json", exclude={"rank"})
+                }
+                entry = (score, -total, ranking)
+                if len(heap) < offset + top_k:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+                total += 1
+            try:
+                window = await windows.__anext__()
+            except StopAsyncIteration:
+                break
+    except Exception as e:
+        yield "error", {"detail": str(e)}
+        return
+    finally:
+        await windows.aclose()
+
+    page = sorted(heap, key=lambda entry: entry[:2], reverse=True)[offset:]
+    rankings = [
+        ranking.model_copy(update={"rank": offset + position + 1}).model_dump(mode="json")
+        for position, (_, _, ranking) in enumerate(page)
+    ]
+    yield "summary", {"total": total, "rankings": rankings}
+
+
+@router.post("/matrix")
+async def score_matrix(request: MatrixRequest):
+    """
+    Score N resumes against M jobs in one pass
+
+    Streams NDJSON: a header line with candidate_ids and job_ids, then
+    either one array of scores per candidate (in job order) or, with
+    top_k, one {"job_id", "top": [[candidate_id, score], ...]} per job.
+    """
+    try:
+        jobs = [_resolve_job(job_id, None) for job_id in request.job_ids]
+        jobs += [matcher_service.compile_job(jd) for jd in request.job_descriptions]
+        if not jobs:
+            raise HTTPException(status_code=400, detail="Provide job_ids or job_descriptions")
+
+        ids, resumes, vectors = [], [], []
+        for candidate_id in request.candidate_ids:
+            parsed = candidate_index.get(candidate_id)
+            if parsed is None:
+                raise HTTPException(status_code=404, detail=f"Candidate {candidate_id} not found")
+            ids.append(candidate_id)
+            resumes.append(parsed)
+            vectors.append(None)
+
+        # Each resume is parsed (and vectorized) once, in the worker pool
+        async with cpu_executor.slot():
+            parsed = await worker_pool.map(parse_resume_chunk, [
+                (f"CAND-{i+1:03d}", text) for i, text in enumerate(request.resume_texts)
+            ])
+        for candidate in parsed:
+            ids.append(candidate["id"])
+            resumes.append(candidate["parsed_resume"])
+            vectors.append(candidate.get("resume_vector"))
+        if not resumes:
+            raise HTTPException(status_code=400, detail="Provide resume_texts or candidate_ids")
+
+        scores = await cpu_executor.run(matcher_service.score_matrix, resumes, jobs, vectors)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    job_ids = [job.job_id for job in jobs]
+    return StreamingResponse(
+        _matrix_lines(ids, job_ids, scores, request.top_k),
+        media_type="application/x-ndjson"
+    )
+
+
+def _matrix_lines(
+    candidate_ids: List[str],
+    job_ids: List[str],
+    scores: np.ndarray,
+    top_k: Optional[int]
+) -> Iterator[str]:
+    """Serialize a score matrix as compact NDJSON lines"""
+    yield json.dumps(
+        {"candidate_ids": candidate_ids, "job_ids": job_ids}, separators=(",", ":")
+    ) + "\n"
+    if top_k is None:
+        for row in scores:
+            yield json.dumps(row.tolist(), separators=(",", ":")) + "\n"
+        return
+    for column, job_id in enumerate(job_ids):
+        top = matcher_service.top_indices(scores[:, column], top_k)
+        yield json.dumps({
+            "job_id": job_id,
+            "top": [[candidate_ids[i], scores[i, column]] for i in top.tolist()]
+        }, separators=(",", ":")) + "\n"
+
 
 # Sample job descriptions
 SAMPLE_JOBS = [
@@ -129,6 +460,10 @@ SAMPLE_JOBS = [
 ]
 
 
+for _job in SAMPLE_JOBS:
+    job_registry.upsert(_job)
+
+
 @router.get("/sample-jobs")
 async def get_sample_jobs():
     """Get sample job descriptions"""
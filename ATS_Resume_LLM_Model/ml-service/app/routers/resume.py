@@ -2,26 +2,37 @@
 Resume Router - API endpoints for resume parsing and analysis
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Optional
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+from starlette.websockets import WebSocketState
+from typing import Any, Dict, List, Literal, Optional, Union
+import asyncio
 import time
 
+from app.config import settings
+from app.services.executor import cpu_executor
+from app.services.job_registry import job_registry
+from app.services.live_session import Debouncer, LiveScoringSession, TextChange
+from app.services.pipeline import analysis_pipeline
 from app.services.resume_parser import resume_parser
-from app.services.scorer import scorer_service
-from app.services.matcher import matcher_service
-from app.services.suggestions import suggestions_service
+from app.services.matcher import CompiledJob
 from app.models.schemas import (
     ParsedResume, ResumeAnalysisRequest, ResumeAnalysisResponse,
-    JobDescription
+    JobDescription, ResumeField
 )
 
 router = APIRouter()
 
+# Pipeline outputs of a full analysis
+ANALYSIS_OUTPUTS = ("parsed_resume", "ats_score", "match_result", "keyword_gaps", "suggestions")
+
 
 class ResumeParseRequest(BaseModel):
     resume_text: str
     anonymize: bool = True
+    # Only these parsed resume fields (all if None)
+    fields: Optional[List[ResumeField]] = None
 
 
 class ResumeParseResponse(BaseModel):
@@ -30,82 +41,289 @@ class ResumeParseResponse(BaseModel):
     processing_time_ms: float
 
 
+class LiveChange(BaseModel):
+    start: int
+    end: int
+    text: str = ""
+
+
+class LiveMessage(BaseModel):
+    type: Literal["init", "edit", "job", "flush"]
+    version: int = 0
+    text: str = ""
+    changes: List[LiveChange] = []
+    anonymize: bool = True
+    job_id: Optional[str] = None
+    job_description: Optional[str] = None
+
+
 @router.post("/parse", response_model=ResumeParseResponse)
 async def parse_resume(request: ResumeParseRequest):
-    """Parse a resume and extract structured information"""
+    """
+    Parse a resume and extract structured information
+    
+    With fields, only the extractors those fields need run and
+    parsed_resume holds just those fields.
+    """
     start_time = time.time()
     
     try:
-        parsed = resume_parser.parse_resume(
-            request.resume_text, 
-            anonymize=request.anonymize
+        result = await cpu_executor.run(
+            analysis_pipeline.run,
+            ["parsed_resume"],
+            request.resume_text,
+            anonymize=request.anonymize,
+            resume_fields=request.fields
         )
         
         processing_time = (time.time() - start_time) * 1000
         
+        if request.fields is not None:
+            return JSONResponse({
+                "success": True,
+                "parsed_resume": _project(result["parsed_resume"], request.fields),
+                "processing_time_ms": round(processing_time, 2)
+            })
         return ResumeParseResponse(
             success=True,
-            parsed_resume=parsed,
+            parsed_resume=result["parsed_resume"],
             processing_time_ms=round(processing_time, 2)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/analyze", response_model=ResumeAnalysisResponse)
 async def analyze_resume(request: ResumeAnalysisRequest):
-    """Full resume analysis with scoring and suggestions"""
+    """
+    Full resume analysis with scoring and suggestions
+    
+    fields may name analysis outputs (parsed_resume, ats_score,
+    match_result, keyword_gaps, suggestions) and parsed resume fields;
+    the response then holds only those, and only the stages and
+    extractors they depend on run. Parsed resume fields are returned
+    under parsed_resume.
+    """
     start_time = time.time()
     
     try:
-        # Parse resume
-        parsed = resume_parser.parse_resume(
-            request.resume_text,
-            anonymize=request.anonymize
-        )
-        
-        # Create job description if provided
-        job_description = None
-        match_result = None
-        
-        if request.job_description:
-            job_description = JobDescription(
-                job_id="JD-TEMP",
-                title="Target Position",
-                description=request.job_description,
-                required_skills=[],
-                min_experience_years=0
-            )
-            match_result = matcher_service.match_resume_to_job(parsed, job_description)
-        
-        # Calculate ATS score
-        ats_score = scorer_service.calculate_ats_score(
-            parsed, job_description, match_result
+        return await cpu_executor.run(_analyze_resume, request, start_time)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _analyze_resume(
+    request: ResumeAnalysisRequest,
+    start_time: float
+) -> Union[ResumeAnalysisResponse, JSONResponse]:
+    """Run the full analysis synchronously on an executor thread"""
+    job_description = None
+    if request.job_description:
+        job_description = JobDescription(
+            job_id="JD-TEMP",
+            title="Target Position",
+            description=request.job_description,
+            required_skills=[],
+            min_experience_years=0
         )
-        
-        # Analyze keyword gaps
-        keyword_gaps = matcher_service.analyze_keyword_gaps(
+    
+    if request.fields is None:
+        # Parse, match, score, keyword gaps and suggestions share one pass
+        result = analysis_pipeline.run(
+            ANALYSIS_OUTPUTS,
             request.resume_text,
-            request.job_description or ""
-        )
-        
-        # Generate suggestions
-        suggestions = suggestions_service.generate_suggestions(
-            parsed, job_description, keyword_gaps, match_result
+            job_description,
+            anonymize=request.anonymize
         )
         
         processing_time = (time.time() - start_time) * 1000
         
         return ResumeAnalysisResponse(
-            parsed_resume=parsed,
-            ats_score=ats_score,
-            match_result=match_result,
-            keyword_gaps=keyword_gaps,
-            suggestions=suggestions,
+            **{name: result[name] for name in ANALYSIS_OUTPUTS},
             processing_time_ms=round(processing_time, 2)
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    outputs = [name for name in ANALYSIS_OUTPUTS if name in request.fields]
+    resume_fields = [name for name in request.fields if name not in ANALYSIS_OUTPUTS]
+    if resume_fields and "parsed_resume" not in outputs:
+        outputs.append("parsed_resume")
+    result = analysis_pipeline.run(
+        outputs,
+        request.resume_text,
+        job_description,
+        anonymize=request.anonymize,
+        resume_fields=None if "parsed_resume" in request.fields else resume_fields
+    )
+    
+    body = {}
+    for name in outputs:
+        value = result[name]
+        if name == "parsed_resume":
+            body[name] = _project(value, None if "parsed_resume" in request.fields else resume_fields)
+        elif name == "suggestions":
+            body[name] = [suggestion.model_dump(mode="json") for suggestion in value]
+        else:
+            body[name] = value.model_dump(mode="json") if value is not None else None
+    body["processing_time_ms"] = round((time.time() - start_time) * 1000, 2)
+    return JSONResponse(body)
+
+
+def _project(parsed: ParsedResume, fields: Optional[List[str]]) -> Dict[str, Any]:
+    """JSON form of a parsed resume, limited to fields if given"""
+    return parsed.model_dump(mode="json", include=set(fields) if fields is not None else None)
+
+
+@router.websocket("/live")
+async def live_resume(websocket: WebSocket):
+    """
+    Incremental parsing and scoring for the resume builder
+    
+    Client messages:
+        {"type": "init", "text", "version"?, "anonymize"?, "job_id" | "job_description"?}
+        {"type": "edit", "version", "changes": [{"start", "end", "text"}]}
+        {"type": "job", "job_id" | "job_description"}   (neither: ATS only)
+        {"type": "flush"}
+    
+    Change offsets are code points into the text as left by the previous
+    change. Edits are debounced and coalesced; each "update" message holds
+    only what changed (parsed fields, scores and their deltas, added,
+    updated and removed suggestions) and the latest version it reflects.
+    An "error" message with "resync": true asks for a new "init". If the
+    update task fails, the socket is closed with code 1011.
+    """
+    await websocket.accept()
+    session = LiveScoringSession()
+    debouncer = Debouncer(settings.LIVE_DEBOUNCE_MS / 1000, settings.LIVE_MAX_DELAY_MS / 1000)
+    wakeup = asyncio.Event()
+    updates = asyncio.create_task(_live_updates(websocket, session, debouncer, wakeup))
+    loop = asyncio.get_running_loop()
+    failure = None
+    try:
+        while True:
+            try:
+                data = await _receive_or_stopped(websocket, updates)
+                if data is None:
+                    break
+                message = LiveMessage.model_validate(data)
+            except (ValidationError, ValueError) as e:
+                await websocket.send_json({"type": "error", "detail": str(e), "resync": False})
+                continue
+            
+            try:
+                if message.type == "init":
+                    session.resume.anonymize = message.anonymize
+                    session.reset(message.text, message.version)
+                    if message.job_id or message.job_description:
+                        session.set_job(_live_job(message))
+                    debouncer.flush()
+                elif message.type == "edit":
+                    session.queue(
+                        [TextChange(c.start, c.end, c.text) for c in message.changes],
+                        message.version
+                    )
+                    debouncer.touch(loop.time())
+                elif message.type == "job":
+                    session.set_job(_live_job(message))
+                    debouncer.flush()
+                else:
+                    debouncer.flush()
+            except HTTPException as e:
+                await websocket.send_json({"type": "error", "detail": e.detail, "resync": False})
+                continue
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "detail": str(e), "resync": True})
+                continue
+            wakeup.set()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        updates.cancel()
+        try:
+            await updates
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            failure = e
+    if failure is not None and websocket.client_state == WebSocketState.CONNECTED:
+        await websocket.close(
+            code=status.WS_1011_INTERNAL_ERROR, reason=f"Live updates failed: {failure}"[:120]
+        )
+
+
+async def _receive_or_stopped(websocket: WebSocket, updates: asyncio.Task) -> Optional[Any]:
+    """Next client JSON message, or None if the update task stopped first"""
+    receive = asyncio.ensure_future(websocket.receive_json())
+    await asyncio.wait((receive, updates), return_when=asyncio.FIRST_COMPLETED)
+    if receive.done():
+        return receive.result()
+    receive.cancel()
+    try:
+        await receive
+    except (asyncio.CancelledError, WebSocketDisconnect):
+        pass
+    return None
+
+
+def _live_job(message: LiveMessage) -> Optional[Union[JobDescription, CompiledJob]]:
+    """Job for a live session message (None scores ATS only)"""
+    if message.job_id:
+        compiled = job_registry.get(message.job_id)
+        if compiled is None:
+            raise HTTPException(status_code=404, detail=f"Job {message.job_id} not found")
+        return compiled
+    if message.job_description:
+        return JobDescription(
+            job_id="JD-TEMP",
+            title="Target Position",
+            description=message.job_description,
+            required_skills=[],
+            min_experience_years=0
+        )
+    return None
+
+
+async def _live_updates(
+    websocket: WebSocket,
+    session: LiveScoringSession,
+    debouncer: Debouncer,
+    wakeup: asyncio.Event
+) -> None:
+    """Run one session update per debounce window and push the result"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await wakeup.wait()
+        delay = debouncer.remaining(loop.time())
+        if delay > 0:
+            await asyncio.sleep(delay)
+            continue
+        wakeup.clear()
+        debouncer.reset()
+        try:
+            message = await cpu_executor.run(session.update)
+        except HTTPException as e:
+            # Saturated: keep the edits queued and try again later
+            debouncer.touch(loop.time())
+            wakeup.set()
+            retry = e.headers.get("Retry-After", 1) if e.headers else 1
+            await asyncio.sleep(float(retry))
+            continue
+        except Exception as e:
+            await websocket.send_json({"type": "error", "detail": str(e), "resync": True})
+            continue
+        if message is not None:
+            await websocket.send_json(message)
+
+
+@router.get("/cache/stats")
+async def get_parse_cache_stats():
+    """Get parse cache hit/miss/eviction counters"""
+    if resume_parser.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **resume_parser.cache.stats()}
 
 
 # Sample resumes for testing
@@ -2,14 +2,18 @@
 Scoring Router - API endpoints for ATS scoring
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.services.scorer import scorer_service
-from app.services.resume_parser import resume_parser
-from app.services.matcher import matcher_service
-from app.models.schemas import ATSScore, JobDescription
+from app.services.candidate_index import candidate_index
+from app.services.executor import cpu_executor
+from app.services.pipeline import analysis_pipeline
+from app.services.worker_pool import worker_pool, score_resume_chunk
+from app.models.records import as_parsed_resume
+from app.models.schemas import ATSScore, JobDescription, ResumeField
+from app.responses import FastJSONResponse, accepts_gzip
 
 router = APIRouter()
 
@@ -25,54 +29,89 @@ class ScoreResponse(BaseModel):
 
 
 class BatchScoreRequest(BaseModel):
-    resume_texts: List[str]
+    resume_texts: List[str] = []
+    candidate_ids: List[str] = []
     job_description: Optional[str] = None
+    # Parsed resume fields to return with each score
+    fields: Optional[List[ResumeField]] = None
+    # Encode the response with orjson (gzipped if accepted)
+    fast_json: bool = False
 
 
 @router.post("/score", response_model=ScoreResponse)
 async def calculate_ats_score(request: ScoreRequest):
     """Calculate ATS score for a resume"""
     try:
-        parsed = resume_parser.parse_resume(request.resume_text)
-        
-        jd = None
-        match_result = None
-        if request.job_description:
-            jd = JobDescription(
-                job_id="TEMP",
-                title="Target",
-                description=request.job_description,
-                required_skills=[],
-                min_experience_years=0
-            )
-            match_result = matcher_service.match_resume_to_job(parsed, jd)
-        
-        score = scorer_service.calculate_ats_score(parsed, jd, match_result)
+        score = await cpu_executor.run(_calculate_ats_score, request)
         
         return ScoreResponse(success=True, ats_score=score)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _calculate_ats_score(request: ScoreRequest) -> ATSScore:
+    """Parse, match and score synchronously on an executor thread"""
+    jd = None
+    if request.job_description:
+        jd = JobDescription(
+            job_id="TEMP",
+            title="Target",
+            description=request.job_description,
+            required_skills=[],
+            min_experience_years=0
+        )
+    
+    return analysis_pipeline.run(["ats_score"], request.resume_text, jd)["ats_score"]
+
+
 @router.post("/batch")
-async def batch_score(request: BatchScoreRequest):
-    """Calculate ATS scores for multiple resumes"""
+async def batch_score(
+    request: BatchScoreRequest,
+    accept_encoding: Optional[str] = Header(default=None)
+):
+    """
+    Calculate ATS scores for multiple resumes
+
+    Stored candidates (candidate_ids) are scored from their persisted
+    component scores without re-parsing, ahead of any resume_texts.
+    Resume texts only run the extractors scoring and fields need; with
+    fields, each score carries those fields under parsed_resume. With
+    fast_json, the same body is encoded by FastJSONResponse.
+    """
     try:
-        scores = []
-        for text in request.resume_texts:
-            parsed = resume_parser.parse_resume(text)
-            score = scorer_service.calculate_ats_score(parsed)
-            scores.append({
-                "candidate_id": parsed.candidate_id,
-                "name": parsed.anonymized_name,
-                "ats_score": score
-            })
+        missing = [c for c in request.candidate_ids if c not in candidate_index]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Candidate {missing[0]} not found")
+        scores = candidate_index.ats_scores(request.candidate_ids)
+        if request.fields is not None and scores:
+            await cpu_executor.run(_attach_stored_fields, scores, request.fields)
+        if request.resume_texts:
+            async with cpu_executor.slot():
+                scores += await worker_pool.map(
+                    score_resume_chunk, request.resume_texts, request.fields
+                )
         
+        if request.fast_json:
+            return FastJSONResponse(
+                {"success": True, "scores": scores}, compress=accepts_gzip(accept_encoding)
+            )
         return {"success": True, "scores": scores}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _attach_stored_fields(scores: List[Dict], fields: List[str]) -> None:
+    """Add the requested fields of stored candidates' parsed resumes to their scores"""
+    include = set(fields)
+    for score in scores:
+        resume = candidate_index.get(score["candidate_id"])
+        score["parsed_resume"] = as_parsed_resume(resume).model_dump(mode="json", include=include)
+
+
 @router.get("/thresholds")
 async def get_thresholds():
     """Get scoring thresholds"""
@@ -2,14 +2,20 @@
 Suggestions Router - API endpoints for resume improvement suggestions
 """
 
+import time
+
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional, Union
 
-from app.services.suggestions import suggestions_service
-from app.services.resume_parser import resume_parser
-from app.services.matcher import matcher_service
-from app.models.schemas import Suggestion, JobDescription
+from app.services.delta_scorer import delta_scorer
+from app.services.executor import cpu_executor
+from app.services.job_registry import job_registry
+from app.services.matcher import CompiledJob
+from app.services.pipeline import analysis_pipeline
+from app.models.schemas import (
+    ATSScore, EditImpact, JobDescription, MatchResult, ResumeEdit, Suggestion
+)
 
 router = APIRouter()
 
@@ -31,32 +37,27 @@ class RewriteRequest(BaseModel):
     style: str = "professional"
 
 
+class ImpactRequest(BaseModel):
+    resume_text: str
+    job_description: Optional[str] = None
+    job_id: Optional[str] = None
+    edits: Optional[List[ResumeEdit]] = None
+    top_k: int = Field(default=20, ge=1)
+
+
+class ImpactResponse(BaseModel):
+    success: bool
+    match_result: Optional[MatchResult] = None
+    ats_score: ATSScore
+    impacts: List[EditImpact]
+    timing_ms: float
+
+
 @router.post("/generate", response_model=SuggestionsResponse)
 async def generate_suggestions(request: SuggestionsRequest):
     """Generate resume improvement suggestions"""
     try:
-        parsed = resume_parser.parse_resume(request.resume_text)
-        
-        jd = None
-        keyword_gaps = None
-        match_result = None
-        
-        if request.job_description:
-            jd = JobDescription(
-                job_id="TEMP",
-                title="Target",
-                description=request.job_description,
-                required_skills=[],
-                min_experience_years=0
-            )
-            keyword_gaps = matcher_service.analyze_keyword_gaps(
-                request.resume_text, request.job_description
-            )
-            match_result = matcher_service.match_resume_to_job(parsed, jd)
-        
-        suggestions = suggestions_service.generate_suggestions(
-            parsed, jd, keyword_gaps, match_result
-        )
+        suggestions = await cpu_executor.run(_generate_suggestions, request)
         
         # Determine priority
         high_priority = len([s for s in suggestions if s.priority == "high"])
@@ -67,23 +68,97 @@ async def generate_suggestions(request: SuggestionsRequest):
             suggestions=suggestions,
             improvement_priority=priority
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _generate_suggestions(request: SuggestionsRequest) -> List[Suggestion]:
+    """Parse, match and build suggestions synchronously on an executor thread"""
+    job = _target_job(request.job_description) if request.job_description else None
+    return analysis_pipeline.run(["suggestions"], request.resume_text, job)["suggestions"]
+
+
+def _target_job(job_description: str) -> JobDescription:
+    """Temporary job for an inline job description"""
+    return JobDescription(
+        job_id="TEMP",
+        title="Target",
+        description=job_description,
+        required_skills=[],
+        min_experience_years=0
+    )
+
+
 @router.post("/rewrite")
 async def rewrite_resume(request: RewriteRequest):
     """Generate rewritten resume sections"""
     try:
-        result = suggestions_service.generate_rewrite_suggestions(
+        result = await cpu_executor.run(
+            analysis_pipeline.run,
+            ["rewrite"],
             request.resume_text,
-            request.job_description
+            _target_job(request.job_description)
         )
-        return {"success": True, **result}
+        return {"success": True, **result["rewrite"]}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/impact", response_model=ImpactResponse)
+async def edit_impact(request: ImpactRequest):
+    """
+    Estimated score gain of each candidate edit, best first
+    
+    Without explicit edits, scores the job's missing skills and keywords
+    and the summary, certification and experience entries the resume lacks.
+    """
+    if request.job_id:
+        job = job_registry.get(request.job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job {request.job_id} not found")
+    elif request.job_description:
+        job = _target_job(request.job_description)
+    else:
+        job = None
+    try:
+        return await cpu_executor.run(_edit_impact, request, job)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _edit_impact(
+    request: ImpactRequest,
+    job: Optional[Union[JobDescription, CompiledJob]]
+) -> ImpactResponse:
+    """Parse once, then rank edits from the cached intermediates"""
+    outputs = ["edit_state"]
+    if job is not None and request.edits is None:
+        outputs.append("keyword_gaps")
+    timings = {}
+    result = analysis_pipeline.run(outputs, request.resume_text, job, timings=timings)
+    state = result["edit_state"]
+    
+    start = time.perf_counter()
+    edits = request.edits
+    if edits is None:
+        edits = delta_scorer.candidate_edits(state, result.get("keyword_gaps"))
+    impacts = delta_scorer.rank_edits(state, edits)[:request.top_k]
+    match_result, ats_score = delta_scorer.project(state)
+    return ImpactResponse(
+        success=True,
+        match_result=match_result,
+        ats_score=ats_score,
+        impacts=impacts,
+        timing_ms=round(timings["edit_state"] + (time.perf_counter() - start) * 1000, 3)
+    )
+
+
 @router.get("/templates")
 async def get_ats_templates():
     """Get ATS-safe resume templates"""
@@ -0,0 +1,333 @@
+"""
+Batch Queue Service
+SQLite-backed queue of screening batches processed chunk by chunk in the background
+"""
+
+import asyncio
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.models.schemas import JobDescription
+from app.services.executor import cpu_executor
+from app.services.worker_pool import WorkerPool, screen_resume_chunk, worker_pool
+
+
+# Batch states; queued and running batches are picked up again after a restart
+QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED = (
+    "queued", "running", "completed", "failed", "cancelled"
+)
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    job TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    processed INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    batch_id TEXT NOT NULL,
+    chunk INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    items TEXT,
+    done INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (batch_id, chunk)
+);
+CREATE TABLE IF NOT EXISTS results (
+    batch_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    score REAL NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (batch_id, position)
+);
+CREATE INDEX IF NOT EXISTS results_by_score ON results (batch_id, score DESC, position);
+"""
+
+
+class BatchQueue:
+    """
+    Persistent queue of screening batches
+
+    A batch is split into chunks at submission. Each finished chunk's
+    results are committed together with its done flag, so a restart
+    resumes from the first unfinished chunk without redoing work.
+    """
+
+    def __init__(self, path: str, chunk_size: int):
+        """
+        Open (or create) the queue database
+
+        Args:
+            path: SQLite database file
+            chunk_size: Resumes per checkpointed chunk
+        """
+        self.path = Path(path)
+        self.chunk_size = max(1, chunk_size)
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.path)) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA)
+            self._ready = True
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def submit(
+        self,
+        resume_texts: Sequence[str],
+        job: JobDescription,
+        candidate_ids: Optional[Sequence[Optional[str]]] = None
+    ) -> str:
+        """
+        Queue a batch of resumes to screen against a job
+
+        Args:
+            resume_texts: Resumes to parse, match and score
+            job: Job description, stored with the batch
+            candidate_ids: Optional ids per resume (default CAND-001, ...)
+
+        Returns:
+            The batch id
+        """
+        batch_id = uuid.uuid4().hex
+        ids = list(candidate_ids or [])
+        ids += [None] * (len(resume_texts) - len(ids))
+        items = [
+            (candidate_id or f"CAND-{i+1:03d}", text)
+            for i, (candidate_id, text) in enumerate(zip(ids, resume_texts))
+        ]
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO batches (id, status, job, total, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (batch_id, QUEUED, job.model_dump_json(), len(items), now, now)
+            )
+            conn.executemany(
+                "INSERT INTO chunks (batch_id, chunk, start, items) VALUES (?, ?, ?, ?)",
+                [
+                    (batch_id, chunk, start, json.dumps(items[start:start + self.chunk_size]))
+                    for chunk, start in enumerate(range(0, len(items), self.chunk_size))
+                ]
+            )
+            if not items:
+                conn.execute("UPDATE batches SET status = ? WHERE id = ?", (COMPLETED, batch_id))
+        return batch_id
+
+    def get(self, batch_id: str) -> Optional[Dict]:
+        """Status and progress of a batch, or None"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT id, status, total, processed, error, created_at, updated_at "
+                "FROM batches WHERE id = ?", (batch_id,)
+            ).fetchone()
+        return None if row is None else dict(row)
+
+    def list(self, limit: int = 100) -> List[Dict]:
+        """Most recent batches first"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT id, status, total, processed, error, created_at, updated_at "
+                "FROM batches ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def next_chunk(self) -> Optional[Tuple[str, int, int, List, str]]:
+        """
+        Oldest unfinished chunk of the oldest active batch
+
+        Returns:
+            (batch id, chunk, start position, [(candidate id, text), ...],
+            job JSON), or None when the queue is idle
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT c.batch_id, c.chunk, c.start, c.items, b.job "
+                "FROM batches b JOIN chunks c ON c.batch_id = b.id "
+                "WHERE b.status IN (?, ?) AND c.done = 0 "
+                "ORDER BY b.created_at, c.chunk LIMIT 1",
+                (QUEUED, RUNNING)
+            ).fetchone()
+            if row is None:
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE batches SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                    (RUNNING, time.time(), row["batch_id"], QUEUED)
+                )
+        items = [tuple(item) for item in json.loads(row["items"])]
+        return row["batch_id"], row["chunk"], row["start"], items, row["job"]
+
+    def complete_chunk(self, batch_id: str, chunk: int, start: int, results: List[Dict]) -> None:
+        """Store a chunk's results and checkpoint it in one transaction"""
+        with closing(self._connect()) as conn, conn:
+            updated = conn.execute(
+                "UPDATE chunks SET done = 1, items = NULL "
+                "WHERE batch_id = ? AND chunk = ? AND done = 0",
+                (batch_id, chunk)
+            ).rowcount
+            if not updated:
+                return
+            conn.executemany(
+                "INSERT OR REPLACE INTO results (batch_id, position, score, result) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (batch_id, start + offset, result["match_score"], json.dumps(result))
+                    for offset, result in enumerate(results)
+                ]
+            )
+            remaining = conn.execute(
+                "SELECT COUNT(*) FROM chunks WHERE batch_id = ? AND done = 0", (batch_id,)
+            ).fetchone()[0]
+            conn.execute(
+                "UPDATE batches SET processed = processed + ?, updated_at = ?, "
+                "status = CASE WHEN ? = 0 AND status = ? THEN ? ELSE status END "
+                "WHERE id = ?",
+                (len(results), time.time(), remaining, RUNNING, COMPLETED, batch_id)
+            )
+
+    def fail(self, batch_id: str, error: str) -> None:
+        """Mark a batch failed; finished chunks keep their results"""
+        self._finish(batch_id, FAILED, error)
+
+    def cancel(self, batch_id: str) -> bool:
+        """Stop an unfinished batch; returns False if it does not exist"""
+        if self.get(batch_id) is None:
+            return False
+        self._finish(batch_id, CANCELLED, None)
+        return True
+
+    def _finish(self, batch_id: str, status: str, error: Optional[str]) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE batches SET status = ?, error = ?, updated_at = ? "
+                "WHERE id = ? AND status IN (?, ?)",
+                (status, error, time.time(), batch_id, QUEUED, RUNNING)
+            )
+            conn.execute("UPDATE chunks SET items = NULL WHERE batch_id = ?", (batch_id,))
+
+    def delete(self, batch_id: str) -> bool:
+        """Remove a batch and its results; returns False if it does not exist"""
+        with closing(self._connect()) as conn, conn:
+            deleted = conn.execute("DELETE FROM batches WHERE id = ?", (batch_id,)).rowcount
+            conn.execute("DELETE FROM chunks WHERE batch_id = ?", (batch_id,))
+            conn.execute("DELETE FROM results WHERE batch_id = ?", (batch_id,))
+        return bool(deleted)
+
+    def results(
+        self,
+        batch_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        order: str = "score"
+    ) -> List[Dict]:
+        """
+        A page of finished results
+
+        Args:
+            batch_id: Batch id
+            offset: Results to skip
+            limit: Page size
+            order: "score" (best first, ties in input order) or "input"
+
+        Returns:
+            Results with their input position and, for score order, rank
+        """
+        order_by = "score DESC, position" if order == "score" else "position"
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT position, result FROM results WHERE batch_id = ? "
+                f"ORDER BY {order_by} LIMIT ? OFFSET ?",
+                (batch_id, limit, offset)
+            ).fetchall()
+        page = []
+        for i, row in enumerate(rows):
+            result = {"position": row["position"], **json.loads(row["result"])}
+            if order == "score":
+                result["rank"] = offset + i + 1
+            page.append(result)
+        return page
+
+
+class BatchRunner:
+    """Background task feeding queued chunks to the worker pool"""
+
+    def __init__(self, queue: BatchQueue, pool: WorkerPool, idle_seconds: float = 1.0):
+        """
+        Configure the runner; start() launches it on the running event loop
+
+        Args:
+            queue: Batch queue to drain
+            pool: Worker processes that parse, match and score
+            idle_seconds: Poll interval while the queue is empty
+        """
+        self.queue = queue
+        self.pool = pool
+        self.idle_seconds = idle_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        """Start draining the queue, resuming any unfinished batches"""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def notify(self) -> None:
+        """Wake the runner after a submission"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Cancel the runner; the chunk in progress is redone after restart"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            chunk = await asyncio.to_thread(self.queue.next_chunk)
+            if chunk is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.idle_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            batch_id, index, start, items, job_json = chunk
+            try:
+                # Background chunks share admission with interactive requests
+                async with cpu_executor.slot():
+                    results = await self.pool.map(screen_resume_chunk, items, job_json)
+            except HTTPException as e:
+                await asyncio.sleep(float(e.headers.get("Retry-After", 1)) if e.headers else 1)
+                continue
+            except Exception as e:
+                await asyncio.to_thread(self.queue.fail, batch_id, str(e))
+                continue
+            await asyncio.to_thread(self.queue.complete_chunk, batch_id, index, start, results)
+
+
+batch_queue = BatchQueue(settings.BATCH_QUEUE_PATH, settings.BATCH_CHUNK_SIZE)
+batch_runner = BatchRunner(batch_queue, worker_pool)
@@ -0,0 +1,208 @@
+"""
+Bulk Ingest Service
+Incremental decoders for binary streams of resume records (length-prefixed msgpack, Arrow IPC)
+"""
+
+import struct
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+
+from app.config import settings
+
+# Optional: only needed for the formats that use them
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# (candidate id or None, resume text), as parse_resume_chunk takes them
+IngestRecord = Tuple[Optional[str], str]
+
+_CONTINUATION = b"\xff\xff\xff\xff"
+
+
+class BulkFormatError(ValueError):
+    """A bulk ingest body is malformed or in an unsupported format"""
+
+
+def _checked_size(size: int) -> int:
+    if size > settings.BULK_MAX_FRAME_BYTES:
+        raise BulkFormatError(
+            f"Frame of {size} bytes exceeds BULK_MAX_FRAME_BYTES ({settings.BULK_MAX_FRAME_BYTES})"
+        )
+    return size
+
+
+def _record(index: int, candidate_id: Any, resume_text: Any) -> IngestRecord:
+    if not isinstance(resume_text, str):
+        raise BulkFormatError(f"Record {index}: resume_text must be a string")
+    if candidate_id is not None and not isinstance(candidate_id, str):
+        raise BulkFormatError(f"Record {index}: candidate_id must be a string or null")
+    return candidate_id, resume_text
+
+
+async def msgpack_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[IngestRecord]:
+    """
+    Records of a length-prefixed msgpack stream, as soon as each frame is complete
+
+    Each frame is a 4-byte big-endian length followed by a msgpack map
+    with resume_text and an optional candidate_id. Only the current
+    partial frame is buffered.
+
+    Raises:
+        BulkFormatError: On a malformed, oversized or truncated frame
+    """
+    buffer = bytearray()
+    index = 0
+    async for chunk in chunks:
+        buffer += chunk
+        offset = 0
+        while len(buffer) - offset >= 4:
+            size = _checked_size(int.from_bytes(buffer[offset:offset + 4], "big"))
+            end = offset + 4 + size
+            if len(buffer) < end:
+                break
+            try:
+                item = msgpack.unpackb(bytes(buffer[offset + 4:end]), raw=False)
+            except Exception as e:
+                raise BulkFormatError(f"Record {index}: invalid msgpack ({e!r})")
+            if not isinstance(item, dict):
+                raise BulkFormatError(f"Record {index}: expected a map")
+            yield _record(index, item.get("candidate_id"), item.get("resume_text"))
+            index += 1
+            offset = end
+        del buffer[:offset]
+    if buffer:
+        raise BulkFormatError(f"Truncated msgpack frame after record {index}")
+
+
+def _body_length(metadata: bytes) -> int:
+    """bodyLength of a flatbuffer IPC Message (field 3 of the root table, 0 if absent)"""
+    table = struct.unpack_from("<I", metadata, 0)[0]
+    vtable = table - struct.unpack_from("<i", metadata, table)[0]
+    vtable_size = struct.unpack_from("<H", metadata, vtable)[0]
+    if vtable_size <= 10:
+        return 0
+    field = struct.unpack_from("<H", metadata, vtable + 10)[0]
+    return struct.unpack_from("<q", metadata, table + field)[0] if field else 0
+
+
+def _arrow_messages(buffer: bytearray) -> Iterator[Tuple[int, Optional[bytes]]]:
+    """
+    (end offset, encapsulated message) for each complete message in buffer
+
+    The message is None at the end-of-stream marker.
+    """
+    offset = 0
+    while True:
+        # Current streams prefix 0xFFFFFFFF before the metadata length; older ones do not
+        prefix = 8 if buffer[offset:offset + 4] == _CONTINUATION else 4
+        if len(buffer) - offset < prefix:
+            return
+        size = struct.unpack_from("<i", buffer, offset + prefix - 4)[0]
+        if size == 0:
+            yield offset + prefix, None
+            return
+        if size < 0:
+            raise BulkFormatError("Invalid Arrow IPC message length")
+        metadata_end = offset + prefix + _checked_size(size)
+        if len(buffer) < metadata_end:
+            return
+        try:
+            body = _checked_size(_body_length(bytes(buffer[offset + prefix:metadata_end])))
+        except struct.error:
+            raise BulkFormatError("Invalid Arrow IPC message metadata")
+        end = metadata_end + body
+        if len(buffer) < end:
+            return
+        yield end, bytes(buffer[offset:end])
+        offset = end
+
+
+async def arrow_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[IngestRecord]:
+    """
+    Records of an Arrow IPC stream, one record batch at a time
+
+    The schema needs a string resume_text column and may have a string
+    candidate_id column. Each record batch is decoded as soon as its
+    message is complete, so only one batch is buffered.
+
+    Raises:
+        BulkFormatError: On a malformed stream, missing column, dictionary
+            batches, or wrong column types
+    """
+    buffer = bytearray()
+    schema = None
+    index = 0
+    finished = False
+    async for chunk in chunks:
+        if finished:
+            continue
+        buffer += chunk
+        consumed = 0
+        for consumed, data in _arrow_messages(buffer):
+            if data is None:
+                finished = True
+                break
+            try:
+                message = pyarrow.ipc.read_message(pyarrow.py_buffer(data))
+                if message.type == "schema":
+                    schema = pyarrow.ipc.read_schema(message)
+                    if "resume_text" not in schema.names:
+                        raise BulkFormatError("Arrow schema has no resume_text column")
+                    continue
+                if message.type != "record batch" or schema is None:
+                    raise BulkFormatError(f"Unsupported Arrow IPC message: {message.type}")
+                batch = pyarrow.ipc.read_record_batch(message, schema)
+            except pyarrow.ArrowException as e:
+                raise BulkFormatError(f"Invalid Arrow IPC stream ({e})")
+            texts = batch.column(schema.get_field_index("resume_text")).to_pylist()
+            ids = (
+                batch.column(schema.get_field_index("candidate_id")).to_pylist()
+                if "candidate_id" in schema.names else [None] * len(texts)
+            )
+            for candidate_id, text in zip(ids, texts):
+                yield _record(index, candidate_id, text)
+                index += 1
+        del buffer[:consumed]
+    if not finished and (buffer or schema is None):
+        raise BulkFormatError("Truncated Arrow IPC stream")
+
+
+# Decoder and the package it needs, per media type
+DECODERS: Dict[str, Tuple[Callable[..., AsyncIterator[IngestRecord]], str]] = {
+    MSGPACK_MEDIA_TYPE: (msgpack_records, "msgpack"),
+    "application/msgpack": (msgpack_records, "msgpack"),
+    "application/vnd.msgpack": (msgpack_records, "msgpack"),
+    ARROW_MEDIA_TYPE: (arrow_records, "pyarrow"),
+}
+
+
+def decode_records(content_type: Optional[str], chunks: AsyncIterator[bytes]) -> AsyncIterator[IngestRecord]:
+    """
+    Incremental record decoder for a request body
+
+    Args:
+        content_type: Content-Type of the body (parameters are ignored)
+        chunks: Body chunks as they arrive
+
+    Raises:
+        BulkFormatError: If the media type is not supported, or its
+            package is not installed
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in DECODERS:
+        raise BulkFormatError(
+            f"Unsupported media type {media_type or 'none'}; use one of {', '.join(sorted(DECODERS))}"
+        )
+    decoder, package = DECODERS[media_type]
+    if {"msgpack": msgpack, "pyarrow": pyarrow}[package] is None:
+        raise BulkFormatError(f"{media_type} ingest requires the {package} package")
+    return decoder(chunks)
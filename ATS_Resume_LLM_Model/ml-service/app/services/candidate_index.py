@@ -0,0 +1,708 @@
+"""
+Candidate Index Service
+Inverted index over the stored candidate pool with MaxScore top-k retrieval
+"""
+
+import hashlib
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from app.config import settings
+from app.models.records import Resume
+from app.services.candidate_store import SCORE_COLUMNS, CandidateStore, Segment
+from app.services.matcher import CompiledJob, MatcherService, matcher_service
+from app.services.resume_parser import resume_parser
+from app.services.scorer import ScorerService, exact_round, scorer_service
+from app.services.skill_bitmap import SkillBitmap
+
+
+# Match score weights (for bounds), from MatcherService.MATCH_WEIGHTS
+_WEIGHTS = MatcherService.MATCH_WEIGHTS
+SEMANTIC_WEIGHT = 100 * _WEIGHTS['semantic']
+SKILL_WEIGHT = _WEIGHTS['skills']
+EXPERIENCE_POINTS = (30 * _WEIGHTS['experience'], 100 * _WEIGHTS['experience'])
+EDUCATION_POINTS = (50 * _WEIGHTS['education'], 100 * _WEIGHTS['education'])
+# Slack for pruning against scores that are rounded to 2 decimals
+SCORE_EPSILON = 0.01
+
+
+def last_occurrences(ids: Sequence[Optional[str]]) -> List[int]:
+    """
+    Positions to keep so each id appears once, at its last occurrence
+
+    Missing (None) ids are all kept. Positions are in input order.
+    """
+    last = {candidate_id: i for i, candidate_id in enumerate(ids) if candidate_id is not None}
+    return [i for i, candidate_id in enumerate(ids) if candidate_id is None or last[candidate_id] == i]
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer over a uint64 array (wrapping arithmetic)"""
+    values = values ^ (values >> np.uint64(30))
+    values *= np.uint64(0xBF58476D1CE4E5B9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94D049BB133111EB)
+    values ^= values >> np.uint64(31)
+    return values
+
+
+def row_digests(
+    vectors: sparse.csr_matrix,
+    years: Sequence[float],
+    scores: Sequence[Sequence[float]]
+) -> np.ndarray:
+    """64-bit digest of each candidate's TF-IDF row, experience years and ATS components"""
+    vectors = sparse.csr_matrix(vectors)
+    terms = _mix(
+        vectors.indices.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+        ^ vectors.data.astype(np.float64).view(np.uint64)
+    )
+    # Wrapping sum per row: independent of the order of a row's terms
+    sums = np.concatenate(([np.uint64(0)], np.cumsum(terms, dtype=np.uint64)))
+    digests = sums[vectors.indptr[1:]] - sums[vectors.indptr[:-1]]
+    columns = np.column_stack([
+        np.asarray(years, dtype=np.float64),
+        np.asarray(scores, dtype=np.float64).reshape(len(digests), -1)
+    ]).view(np.uint64)
+    for column in columns.T:
+        digests = _mix(digests ^ column)
+    return digests
+
+
+class PostingList:
+    """Append-only posting list of (doc id, weight) in doubling numpy buffers"""
+
+    __slots__ = ("_docs", "_weights", "_size", "max_weight")
+
+    def __init__(self):
+        self._docs = np.empty(8, dtype=np.int32)
+        self._weights = np.empty(8, dtype=np.float64)
+        self._size = 0
+        self.max_weight = 0.0
+
+    def extend(self, docs: np.ndarray, weights: np.ndarray) -> None:
+        end = self._size + len(docs)
+        if end > len(self._docs):
+            capacity = max(end, 2 * len(self._docs))
+            # Views handed out by arrays() keep the old buffers alive
+            self._docs = self._resized(self._docs, capacity)
+            self._weights = self._resized(self._weights, capacity)
+        self._docs[self._size:end] = docs
+        self._weights[self._size:end] = weights
+        self._size = end
+        if len(weights):
+            self.max_weight = max(self.max_weight, float(weights.max()))
+
+    def _resized(self, buffer: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.empty(capacity, dtype=buffer.dtype)
+        grown[:self._size] = buffer[:self._size]
+        return grown
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Doc ids (ascending) and weights"""
+        return self._docs[:self._size], self._weights[:self._size]
+
+
+class StoredRow(NamedTuple):
+    """A candidate whose parsed resume stays on disk in a store segment"""
+    segment: Segment
+    row: int
+
+
+class CandidateIndex:
+    """
+    Incremental inverted index of candidates for per-job top-k retrieval
+
+    Each candidate contributes postings for its TF-IDF terms and a packed
+    skill bitmap row. Skill coverage and experience are exact for the whole
+    pool from popcounts and array compares; a query then walks the JD's
+    terms in decreasing upper-bound order and stops once the remaining
+    terms cannot lift any candidate above the current k-th best score
+    (MaxScore). Only the surviving candidates are scored exactly, with the
+    same formula as MatcherService, so results agree with
+    /api/matching/rank.
+    """
+
+    def __init__(
+        self,
+        matcher: MatcherService,
+        skills: Sequence[str] = (),
+        store: Optional[CandidateStore] = None,
+        scorer: ScorerService = scorer_service
+    ):
+        """
+        Initialize an empty index
+
+        Args:
+            matcher: Matcher providing the TF-IDF model and result builder
+            skills: Skill vocabulary for the bitmaps (lowercased names)
+            store: Optional on-disk store that additions and deletions are
+                written through to and that load() reads back
+            scorer: Scorer for the job-independent ATS component scores
+        """
+        self.matcher = matcher
+        self.store = store
+        self.scorer = scorer
+        self._vocabulary = list(skills)
+        self._lock = threading.RLock()
+        # Bumped whenever the live pool changes; cached per-job scores key on it
+        self.version = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._terms: Dict[int, PostingList] = {}
+        self._skills = SkillBitmap(self._vocabulary)
+        self._ids: List[Optional[str]] = []
+        # ResumeRecords (or ParsedResumes) in memory, StoredRows for loaded segments
+        self._resumes: List[Optional[Union[Resume, StoredRow]]] = []
+        self._names: List[Optional[str]] = []
+        self._doc_of: Dict[str, int] = {}
+        self._years = np.zeros(0, dtype=np.float64)
+        self._digests = np.zeros(0, dtype=np.uint64)
+        self._scores = np.zeros((0, len(SCORE_COLUMNS)), dtype=np.float64)
+        self._live = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._deleted = 0
+        self.version += 1
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._doc_of
+
+    def ids(self) -> List[str]:
+        """Live candidate ids in doc order"""
+        with self._lock:
+            return [self._ids[doc] for doc in np.flatnonzero(self._live[:self._size]).tolist()]
+
+    def pool_state(self) -> Tuple[int, str]:
+        """
+        Current version and a digest of the live pool
+
+        The digest covers ids in doc order and each candidate's content, so
+        unlike version it is stable across restarts and changes when an id
+        is re-added with a different resume.
+        """
+        with self._lock:
+            docs = np.flatnonzero(self._live[:self._size])
+            digest = hashlib.sha256()
+            digest.update("\n".join([self._ids[doc] for doc in docs.tolist()]).encode("utf-8"))
+            digest.update(self._digests[docs].tobytes())
+            return self.version, digest.hexdigest()[:16]
+
+    def load(self) -> int:
+        """
+        Rebuild the index from the store without parsing any resume
+
+        Columns are memory-mapped; parsed resumes stay on disk and are only
+        decoded for result pages. Segments vectorized with a different
+        TF-IDF model are re-vectorized from their stored resumes.
+
+        Returns:
+            Number of candidates loaded
+        """
+        if self.store is None or self.matcher.model is None:
+            return 0
+        with self._lock:
+            stored = self.store.vocabulary()
+            known = set(stored)
+            self._vocabulary = stored + [s for s in self._vocabulary if s not in known]
+            self._reset()
+            for segment in self.store.segments():
+                # A segment written before ids were deduped may repeat one
+                rows = last_occurrences(segment.ids)
+                if segment.model != self.matcher.model.fingerprint:
+                    vectors = self.matcher.resume_vectors([segment.resume(row) for row in rows])
+                else:
+                    vectors = segment.vectors[rows]
+                self._insert(
+                    [segment.ids[row] for row in rows], [StoredRow(segment, row) for row in rows],
+                    vectors, segment.years[rows], segment.scores[rows],
+                    [segment.names[row] for row in rows]
+                )
+                self._skills.extend(segment.skills[:, rows])
+            for candidate_id, before in self.store.tombstones().items():
+                doc = self._doc_of.get(candidate_id)
+                if doc is not None and self._resumes[doc].segment.sequence < before:
+                    self._remove(candidate_id)
+            return len(self._doc_of)
+
+    def add(
+        self,
+        candidates: Sequence[Tuple[str, Resume]],
+        vectors: Optional[sparse.csr_matrix] = None
+    ) -> None:
+        """
+        Insert or replace candidates
+
+        An id repeated within the batch is added once, from its last entry.
+
+        Args:
+            candidates: (candidate id, parsed resume) pairs; ResumeRecords
+                keep the in-memory pool compact
+            vectors: Precomputed resume TF-IDF rows in the same order
+        """
+        if not candidates:
+            return
+        if self.matcher.model is None:
+            raise RuntimeError("Candidate index requires a fitted TF-IDF model")
+        keep = last_occurrences([candidate_id for candidate_id, _ in candidates])
+        if len(keep) < len(candidates):
+            candidates = [candidates[i] for i in keep]
+            if vectors is not None:
+                vectors = vectors[keep]
+        if vectors is None:
+            vectors = self.matcher.resume_vectors([resume for _, resume in candidates])
+        ids = [candidate_id for candidate_id, _ in candidates]
+        resumes = [resume for _, resume in candidates]
+        scores = np.array([
+            [components[name] for name in SCORE_COLUMNS]
+            for components in map(self.scorer.component_scores, resumes)
+        ], dtype=np.float64)
+
+        # Persist before touching the postings so a failed write leaves the
+        # index unchanged
+        with self._lock:
+            first = self._size
+            self._skills.append(
+                {skill.name.lower() for skill in resume.skills} for resume in resumes
+            )
+            if self.store is not None:
+                try:
+                    self.store.append(
+                        ids, resumes, vectors, self._skills.words[:, first:],
+                        list(self._skills.vocabulary), self.matcher.model.fingerprint,
+                        scores=scores
+                    )
+                except Exception:
+                    self._skills.take(np.arange(first))
+                    raise
+            self._insert(
+                ids, resumes, vectors,
+                [resume.total_experience_years for resume in resumes], scores,
+                [resume.anonymized_name for resume in resumes]
+            )
+
+    def _insert(
+        self,
+        ids: Sequence[str],
+        resumes: Sequence[Union[Resume, "StoredRow"]],
+        vectors: sparse.csr_matrix,
+        years: Sequence[float],
+        scores: Sequence[Sequence[float]],
+        names: Sequence[str]
+    ) -> None:
+        """
+        Append rows and their term postings; skill rows are appended by the caller
+
+        ids must be distinct: earlier copies are removed before any row is assigned.
+        """
+        for candidate_id in ids:
+            self._remove(candidate_id)
+
+        first = self._size
+        count = len(ids)
+        self._grow(first + count)
+        for offset, candidate_id in enumerate(ids):
+            self._doc_of[candidate_id] = first + offset
+        self._ids.extend(ids)
+        self._resumes.extend(resumes)
+        self._names.extend(names)
+        self._years[first:first + count] = years
+        self._digests[first:first + count] = row_digests(vectors, years, scores)
+        self._scores[first:first + count] = scores
+        self._live[first:first + count] = True
+        self._size = first + count
+        self.version += 1
+
+        # Term postings: one slice per term from the column-major batch
+        columns = sparse.csc_matrix(vectors)
+        columns.sort_indices()
+        indptr = columns.indptr
+        for term in np.flatnonzero(np.diff(indptr)):
+            start, end = indptr[term], indptr[term + 1]
+            postings = self._terms.get(term)
+            if postings is None:
+                postings = self._terms[term] = PostingList()
+            postings.extend(
+                (columns.indices[start:end] + first).astype(np.int32),
+                columns.data[start:end].astype(np.float64)
+            )
+
+    def get(self, candidate_id: str) -> Optional[Resume]:
+        """Parsed resume of an indexed candidate, in the form it was added or stored, or None"""
+        doc = self._doc_of.get(candidate_id)
+        return None if doc is None else self._resume(doc)
+
+    def _resume(self, doc: int) -> Resume:
+        resume = self._resumes[doc]
+        if isinstance(resume, StoredRow):
+            return resume.segment.resume(resume.row)
+        return resume
+
+    def _education_texts(self, doc: int) -> List[str]:
+        resume = self._resumes[doc]
+        if isinstance(resume, StoredRow):
+            return resume.segment.education_texts(resume.row)
+        return self.matcher.education_texts(resume.education)
+
+    def ats_scores(self, candidate_ids: Sequence[str]) -> List[Dict]:
+        """
+        Job-independent ATS scores from the stored component columns
+
+        Raises:
+            KeyError: If a candidate id is not indexed
+        """
+        with self._lock:
+            docs = np.array([self._doc_of[candidate_id] for candidate_id in candidate_ids],
+                            dtype=np.int64)
+            rows = self._scores[docs]
+            scores = self.scorer.scores_from_component_arrays(
+                {name: rows[:, column] for column, name in enumerate(SCORE_COLUMNS)},
+                self._skills.sizes(docs)
+            )
+            return [
+                {"candidate_id": candidate_id, "name": self._names[doc], "ats_score": score}
+                for candidate_id, doc, score in zip(candidate_ids, docs, scores)
+            ]
+
+    def delete(self, candidate_id: str) -> bool:
+        """
+        Remove a candidate; returns False if it was not indexed
+
+        Deleted rows are only dropped by compact(), which callers schedule
+        off the request path once needs_compaction is set.
+        """
+        with self._lock:
+            removed = self._remove(candidate_id)
+            if removed and self.store is not None:
+                self.store.delete([candidate_id])
+            return removed
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Whether deleted rows make up enough of the index to compact it"""
+        return self._deleted > max(1024, self._size // 2)
+
+    def _remove(self, candidate_id: str) -> bool:
+        doc = self._doc_of.pop(candidate_id, None)
+        if doc is None:
+            return False
+        self._live[doc] = False
+        self._ids[doc] = None
+        self._resumes[doc] = None
+        self._names[doc] = None
+        self._deleted += 1
+        self.version += 1
+        return True
+
+    def compact(self) -> None:
+        """Rebuild postings (and the store) without deleted candidates"""
+        with self._lock:
+            live_docs = np.flatnonzero(self._live[:self._size])
+            remap = np.full(self._size, -1, dtype=np.int64)
+            remap[live_docs] = np.arange(len(live_docs))
+
+            def _compact(table: Dict) -> Dict:
+                compacted = {}
+                for key, postings in table.items():
+                    docs, weights = postings.arrays()
+                    keep = self._live[docs]
+                    if keep.any():
+                        fresh = PostingList()
+                        fresh.extend(remap[docs[keep]].astype(np.int32), weights[keep])
+                        compacted[key] = fresh
+                return compacted
+
+            self._terms = _compact(self._terms)
+            self._skills.take(live_docs)
+            self._ids = [self._ids[doc] for doc in live_docs]
+            self._resumes = [self._resumes[doc] for doc in live_docs]
+            self._names = [self._names[doc] for doc in live_docs]
+            self._doc_of = {candidate_id: doc for doc, candidate_id in enumerate(self._ids)}
+            self._years = self._years[live_docs].copy()
+            self._digests = self._digests[live_docs].copy()
+            self._scores = self._scores[live_docs].copy()
+            self._live = np.ones(len(live_docs), dtype=bool)
+            self._size = len(live_docs)
+            self._deleted = 0
+            if self.store is not None:
+                # The old segments are removed, so loaded rows move to the new one
+                segment = self.store.compact()
+                if segment is not None:
+                    row_of = {candidate_id: row for row, candidate_id in enumerate(segment.ids)}
+                    self._resumes = [
+                        StoredRow(segment, row_of[candidate_id])
+                        if isinstance(resume, StoredRow) else resume
+                        for candidate_id, resume in zip(self._ids, self._resumes)
+                    ]
+
+    def _grow(self, capacity: int) -> None:
+        if capacity <= len(self._years):
+            return
+        new_capacity = max(capacity, 2 * len(self._years), 1024)
+        years = np.zeros(new_capacity, dtype=np.float64)
+        years[:self._size] = self._years[:self._size]
+        digests = np.zeros(new_capacity, dtype=np.uint64)
+        digests[:self._size] = self._digests[:self._size]
+        scores = np.zeros((new_capacity, len(SCORE_COLUMNS)), dtype=np.float64)
+        scores[:self._size] = self._scores[:self._size]
+        live = np.zeros(new_capacity, dtype=bool)
+        live[:self._size] = self._live[:self._size]
+        self._years, self._digests, self._scores, self._live = years, digests, scores, live
+
+    def filter(self, skill_query: str) -> List[str]:
+        """
+        Ids of candidates matching a boolean skill query
+
+        Raises:
+            ValueError: If the query is malformed or names an unknown skill
+        """
+        with self._lock:
+            docs = np.flatnonzero(self._skills.select(skill_query) & self._live[:self._size])
+            return [self._ids[doc] for doc in docs]
+
+    def search(
+        self,
+        job: CompiledJob,
+        top_k: int = 10,
+        skill_query: Optional[str] = None,
+        candidate_ids: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
+        """
+        Top-k candidates for a job without scoring the whole pool
+
+        Args:
+            job: Compiled job to match against
+            top_k: Number of candidates to return
+            skill_query: Optional boolean skill query restricting the pool
+            candidate_ids: Optional ids restricting the pool; unknown ids
+                are ignored
+
+        Returns:
+            Ranked candidates with candidate id, parsed resume, match_result,
+            ranking_score and rank, best first
+        """
+        if job.vector is None:
+            raise RuntimeError("Candidate index requires a fitted TF-IDF model")
+        with self._lock:
+            n = self._size
+            live = self._live[:n]
+            if skill_query:
+                live = live & self._skills.select(skill_query)
+            if candidate_ids is not None:
+                selected = np.zeros(n, dtype=bool)
+                selected[[self._doc_of[c] for c in candidate_ids if c in self._doc_of]] = True
+                live = live & selected
+            n_live = int(np.count_nonzero(live))
+            if not n_live or top_k <= 0:
+                return []
+            k = min(top_k, n_live)
+
+            # Skill coverage (popcounts) and experience are exact for the
+            # whole pool; only semantic similarity and education are bounded
+            if job.required_skills:
+                matched = self._skills.count(self._skills.mask(job.required_skills))
+                skill_match_pct = matched / len(job.required_skills) * 100
+            else:
+                matched = self._skills.count(self._skills.mask(job.all_skills))
+                skill_match_pct = np.where(matched > 0, np.minimum(100, matched * 10), 50)
+            years = self._years[:n]
+            experience_match = years >= job.job.min_experience_years
+            if job.job.max_experience_years:
+                experience_match &= years <= job.job.max_experience_years
+            base = (skill_match_pct * SKILL_WEIGHT
+                    + np.where(experience_match, *EXPERIENCE_POINTS[::-1]))
+            base_max = float(base[live].max())
+
+            # Query terms with their contribution upper bounds
+            terms = []
+            jd = job.vector
+            for term, weight in zip(jd.indices, jd.data):
+                postings = self._terms.get(int(term))
+                if postings is not None:
+                    terms.append((weight * postings.max_weight * SEMANTIC_WEIGHT,
+                                  int(term), postings, float(weight)))
+            terms.sort(key=lambda item: item[0], reverse=True)
+            remaining = np.cumsum([item[0] for item in terms][::-1])[::-1].tolist() + [0.0]
+
+            # Walk terms by decreasing bound until the rest cannot lift any
+            # candidate to the current k-th best lower bound
+            semantic = np.zeros(n, dtype=np.float64)
+            threshold = self._kth_best(base, live, k)
+            stop = len(terms)
+            for i, (_, _, postings, weight) in enumerate(terms):
+                if remaining[i] + base_max + EDUCATION_POINTS[1] < threshold - SCORE_EPSILON:
+                    stop = i
+                    break
+                docs, weights = postings.arrays()
+                semantic[docs] += weight * weights
+                threshold = self._kth_best(semantic * SEMANTIC_WEIGHT + base, live, k)
+
+            upper = semantic * SEMANTIC_WEIGHT + base + remaining[stop] + EDUCATION_POINTS[1]
+            candidates = np.flatnonzero(live & (upper >= threshold - SCORE_EPSILON))
+
+            # Exact similarity for the survivors only, summed in term order
+            # like the sparse product so scores equal rank_candidates'
+            semantic_c = np.zeros(len(candidates), dtype=np.float64)
+            for _, _, postings, weight in sorted(terms, key=lambda item: item[1]):
+                docs, weights = postings.arrays()
+                positions = np.searchsorted(docs, candidates)
+                positions[positions >= len(docs)] = 0
+                hit = docs[positions] == candidates
+                semantic_c += np.where(hit, weight * weights[positions], 0.0)
+
+            return self._rank(
+                job, candidates, np.clip(semantic_c, 0.0, 1.0),
+                skill_match_pct[candidates], experience_match[candidates], k
+            )
+
+    def job_components(self, job: CompiledJob) -> Tuple[List[str], List[str], Dict[str, np.ndarray]]:
+        """
+        Exact match and ATS component scores of every live candidate for a job
+
+        Semantic similarity is summed from the postings in term order, so
+        it equals MatcherService.match_matrix's sparse product exactly.
+
+        Returns:
+            Candidate ids and names in doc order, and columns: the match
+            components of MatcherService.match_matrix, plus the ATS
+            components keyed like ScorerService.WEIGHTS (as scored with
+            the job and its match result)
+        """
+        if job.vector is None:
+            raise RuntimeError("Candidate index requires a fitted TF-IDF model")
+        with self._lock:
+            n = self._size
+            docs = np.flatnonzero(self._live[:n])
+            semantic = np.zeros(n, dtype=np.float64)
+            jd = job.vector
+            for term, weight in sorted(zip(jd.indices.tolist(), jd.data.tolist())):
+                postings = self._terms.get(term)
+                if postings is not None:
+                    term_docs, weights = postings.arrays()
+                    semantic[term_docs] += weight * weights
+            semantic = np.clip(semantic[docs], 0.0, 1.0)
+
+            if job.required_skills:
+                matched = self._skills.count(self._skills.mask(job.required_skills))[docs]
+                skill_match_pct = matched / len(job.required_skills) * 100
+            else:
+                matched = self._skills.count(self._skills.mask(job.all_skills))[docs]
+                skill_match_pct = np.where(matched > 0, np.minimum(100, matched * 10), 50)
+            skill_match_pct = skill_match_pct.astype(np.float64)
+            years = self._years[docs]
+            experience_match = years >= job.job.min_experience_years
+            if job.job.max_experience_years:
+                experience_match &= years <= job.job.max_experience_years
+            education_match = np.fromiter((
+                self.matcher.education_texts_match(self._education_texts(doc), job.education_tokens)
+                for doc in docs.tolist()
+            ), dtype=bool, count=len(docs))
+
+            # ATS components see the match result's rounded values
+            stored = self._scores[docs]
+            ats = self.scorer.job_component_scores(
+                {name: stored[:, column] for column, name in enumerate(SCORE_COLUMNS)},
+                years, exact_round(skill_match_pct, 2), exact_round(semantic, 4), job.job
+            )
+            columns = {
+                "semantic_similarity": semantic,
+                "skill_match_pct": skill_match_pct,
+                "experience_match": experience_match,
+                "education_match": education_match,
+                **{f"ats_{name}": values for name, values in ats.items()},
+            }
+            ids = [self._ids[doc] for doc in docs.tolist()]
+            names = [self._names[doc] for doc in docs.tolist()]
+            return ids, names, columns
+
+    @staticmethod
+    def _kth_best(partial: np.ndarray, live: np.ndarray, k: int) -> float:
+        """k-th best lower bound (education at its minimum) among live candidates"""
+        lower = partial[live]
+        return float(np.partition(lower, len(lower) - k)[len(lower) - k]) + EDUCATION_POINTS[0]
+
+    def _rank(
+        self,
+        job: CompiledJob,
+        docs: np.ndarray,
+        semantic: np.ndarray,
+        skill_match_pct: np.ndarray,
+        experience_match: np.ndarray,
+        k: int
+    ) -> List[Dict]:
+        """
+        Exact scores for a candidate subset and the top-k page
+
+        Education needs the parsed resume, so candidates are verified in
+        blocks by decreasing upper bound until the next block cannot reach
+        the k-th exact score.
+        """
+        partial = (
+            semantic * SEMANTIC_WEIGHT
+            + skill_match_pct * SKILL_WEIGHT
+            + np.where(experience_match, *EXPERIENCE_POINTS[::-1])
+        )
+        upper = partial + EDUCATION_POINTS[1]
+
+        order = np.argsort(-upper, kind="stable")
+        education_match = np.zeros(len(docs), dtype=bool)
+        scores = np.full(len(docs), -np.inf)
+        block = max(4 * k, 1024)
+        verified = 0
+        while verified < len(order):
+            if verified >= k:
+                threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+                if upper[order[verified]] < threshold - SCORE_EPSILON:
+                    break
+            indices = order[verified:verified + block]
+            for index in indices:
+                education_match[index] = self.matcher.education_texts_match(
+                    self._education_texts(docs[index]), job.education_tokens
+                )
+            scores[indices] = np.round(self.matcher.match_scores(
+                semantic[indices], skill_match_pct[indices],
+                experience_match[indices], education_match[indices]
+            ), 2)
+            verified += block
+
+        # Unverified candidates keep -inf and never make the page;
+        # top_indices keeps ties in doc (insertion) order like rank_candidates
+        ranked = []
+        for position, index in enumerate(self.matcher.top_indices(scores, k)):
+            resume = self._resume(docs[index])
+            match_result = self.matcher.build_match_result(
+                resume, job,
+                float(semantic[index]), float(skill_match_pct[index]),
+                bool(experience_match[index]), bool(education_match[index])
+            )
+            ranked.append({
+                "id": self._ids[docs[index]],
+                "parsed_resume": resume,
+                "match_result": match_result,
+                "ranking_score": match_result.match_score,
+                "rank": position + 1
+            })
+        return ranked
+
+    def stats(self) -> Dict[str, int]:
+        """Pool size and index shape"""
+        return {
+            "candidates": len(self._doc_of),
+            "deleted_pending_compaction": self._deleted,
+            "terms": len(self._terms),
+            "skills": len(self._skills.vocabulary),
+            "stored_segments": len(self.store.segments()) if self.store is not None else 0,
+        }
+
+
+candidate_index = CandidateIndex(
+    matcher_service,
+    skills=resume_parser.skill_matcher.taxonomy,
+    store=CandidateStore(settings.CANDIDATE_STORE_PATH) if settings.CANDIDATE_STORE_PATH else None
+)
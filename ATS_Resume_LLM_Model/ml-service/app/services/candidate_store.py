@@ -0,0 +1,348 @@
+"""
+Candidate Store Service
+Append-only columnar store of parsed candidates, memory-mapped on load
+
+Layout of a store directory:
+    manifest.json        live segments and the next segment sequence
+    skills.json          skill vocabulary in bitmap bit order
+    tombstones.jsonl     deletions, each applying to earlier segments
+    segments/000001/     one immutable batch of candidates, see Segment
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from app.models.records import Resume, as_parsed_resume
+from app.models.schemas import ParsedResume
+from app.services.matcher import MatcherService
+from app.services.scorer import ScorerService, scorer_service
+
+
+MANIFEST_FILE = "manifest.json"
+VOCABULARY_FILE = "skills.json"
+TOMBSTONES_FILE = "tombstones.jsonl"
+SEGMENTS_DIR = "segments"
+META_FILE = "meta.json"
+
+# Unweighted ATS component scores, one column each
+SCORE_COLUMNS = tuple(ScorerService.WEIGHTS)
+
+
+def _write_json(path: Path, data) -> None:
+    """Write JSON atomically by replacing the file"""
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, delete=False, encoding="utf-8", suffix=".tmp"
+    ) as f:
+        json.dump(data, f)
+    os.replace(f.name, path)
+
+
+def _pack_blobs(items: Iterable[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate byte strings into a uint8 blob plus offsets"""
+    items = list(items)
+    offsets = np.zeros(len(items) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in items], out=offsets[1:])
+    return np.frombuffer(b"".join(items), dtype=np.uint8), offsets
+
+
+class Segment:
+    """
+    One immutable batch of candidates with memory-mapped columns
+
+    Columns: ids, names and roles (JSON); years; skill bitmap words
+    (n_words, rows); ATS component scores (rows, len(SCORE_COLUMNS));
+    resume TF-IDF rows as CSR arrays; parsed resumes and education texts
+    as JSON blobs with offsets, decoded one row at a time.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a segment directory
+
+        Args:
+            path: Directory written by Segment.write
+        """
+        self.path = path
+        self.sequence = int(path.name)
+        with open(path / META_FILE, encoding="utf-8") as f:
+            meta = json.load(f)
+        self.rows = meta["rows"]
+        self.model = meta["model"]
+        with open(path / "ids.json", encoding="utf-8") as f:
+            self.ids: List[str] = json.load(f)
+        with open(path / "names.json", encoding="utf-8") as f:
+            self.names: List[str] = json.load(f)
+        with open(path / "roles.json", encoding="utf-8") as f:
+            self.roles: List[Optional[str]] = json.load(f)
+
+        self.years = self._load("years")
+        self.skills = self._load("skills")
+        self.scores = self._load("scores")
+        self.vectors = sparse.csr_matrix(
+            (self._load("vector_data"), self._load("vector_indices"), self._load("vector_indptr")),
+            shape=(self.rows, meta["n_features"])
+        )
+        self._resumes = self._load("resumes")
+        self._resume_offsets = self._load("resume_offsets")
+        self._education = self._load("education")
+        self._education_offsets = self._load("education_offsets")
+
+    def _load(self, name: str) -> np.ndarray:
+        return np.load(self.path / f"{name}.npy", mmap_mode="r")
+
+    def resume(self, row: int) -> ParsedResume:
+        """Decode one parsed resume"""
+        start, end = self._resume_offsets[row], self._resume_offsets[row + 1]
+        return ParsedResume.model_validate_json(self._resumes[start:end].tobytes())
+
+    def education_texts(self, row: int) -> List[str]:
+        """Lowercased "degree field" texts of one candidate"""
+        start, end = self._education_offsets[row], self._education_offsets[row + 1]
+        return json.loads(self._education[start:end].tobytes())
+
+    @classmethod
+    def write(
+        cls,
+        path: Path,
+        ids: Sequence[str],
+        resumes: Sequence[Resume],
+        vectors: sparse.csr_matrix,
+        skill_words: np.ndarray,
+        model: str,
+        scores: Optional[np.ndarray] = None,
+        scorer: ScorerService = scorer_service
+    ) -> "Segment":
+        """
+        Write a segment atomically (to a temporary directory, then renamed)
+
+        Args:
+            path: Final segment directory, named by its sequence number
+            ids: Candidate ids
+            resumes: Parsed resumes in the same order
+            vectors: Resume TF-IDF rows in the same order
+            skill_words: Packed skill bitmap words, shape (n_words, rows)
+            model: Fingerprint of the TF-IDF model the vectors came from
+            scores: Precomputed component scores, (rows, len(SCORE_COLUMNS))
+            scorer: Scorer used when scores are not given
+
+        Returns:
+            The opened segment
+        """
+        staging = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}-"))
+        try:
+            def save(name: str, array: np.ndarray) -> None:
+                np.save(staging / f"{name}.npy", np.ascontiguousarray(array))
+
+            vectors = sparse.csr_matrix(vectors)
+            index_dtype = np.int32 if vectors.nnz < 2 ** 31 else np.int64
+            save("vector_indptr", vectors.indptr.astype(index_dtype))
+            save("vector_indices", vectors.indices.astype(index_dtype))
+            save("vector_data", vectors.data.astype(np.float64))
+            save("years", np.array([r.total_experience_years for r in resumes], dtype=np.float64))
+            save("skills", skill_words.astype(np.uint64))
+            if scores is None:
+                components = [scorer.component_scores(r) for r in resumes]
+                scores = np.array([[c[name] for name in SCORE_COLUMNS] for c in components])
+            save("scores", np.asarray(scores, dtype=np.float64).reshape(
+                len(resumes), len(SCORE_COLUMNS)
+            ))
+
+            blob, offsets = _pack_blobs(
+                as_parsed_resume(r).model_dump_json().encode("utf-8") for r in resumes
+            )
+            save("resumes", blob)
+            save("resume_offsets", offsets)
+            blob, offsets = _pack_blobs(
+                json.dumps(MatcherService.education_texts(r.education)).encode("utf-8")
+                for r in resumes
+            )
+            save("education", blob)
+            save("education_offsets", offsets)
+
+            for name, values in (
+                ("ids.json", list(ids)),
+                ("names.json", [r.anonymized_name for r in resumes]),
+                ("roles.json", [r.primary_role for r in resumes]),
+                (META_FILE, {"rows": len(resumes), "model": model, "n_features": vectors.shape[1]}),
+            ):
+                with open(staging / name, "w", encoding="utf-8") as f:
+                    json.dump(values, f)
+            os.rename(staging, path)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return cls(path)
+
+
+class CandidateStore:
+    """
+    Directory of append-only candidate segments
+
+    Appends write a new segment and then swap the manifest, so a crash
+    leaves either the old or the new state. Deletes are tombstones until
+    compaction rewrites the live rows into a single segment.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a store directory
+
+        Args:
+            path: Store directory
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _manifest(self) -> Dict:
+        try:
+            with open(self.path / MANIFEST_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"segments": [], "next_sequence": 1}
+
+    def vocabulary(self) -> List[str]:
+        """Skill names in bitmap bit order"""
+        try:
+            with open(self.path / VOCABULARY_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def segments(self) -> List[Segment]:
+        """Open every live segment, oldest first"""
+        return [
+            Segment(self.path / SEGMENTS_DIR / name)
+            for name in self._manifest()["segments"]
+        ]
+
+    def tombstones(self) -> Dict[str, int]:
+        """Deleted candidate id -> first segment sequence the deletion does not cover"""
+        deleted: Dict[str, int] = {}
+        try:
+            with open(self.path / TOMBSTONES_FILE, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        deleted[record["id"]] = record["before"]
+        except FileNotFoundError:
+            pass
+        return deleted
+
+    def append(
+        self,
+        ids: Sequence[str],
+        resumes: Sequence[Resume],
+        vectors: sparse.csr_matrix,
+        skill_words: np.ndarray,
+        vocabulary: Sequence[str],
+        model: str,
+        scores: Optional[np.ndarray] = None
+    ) -> Segment:
+        """
+        Persist a batch of candidates as a new segment
+
+        Args:
+            ids: Candidate ids; later segments supersede earlier rows
+            resumes: Parsed resumes
+            vectors: Resume TF-IDF rows
+            skill_words: Packed skill bitmap words, shape (n_words, rows)
+            vocabulary: Skill names in bit order (append-only)
+            model: Fingerprint of the TF-IDF model
+            scores: Precomputed ATS component scores, computed if omitted
+
+        Returns:
+            The new segment
+        """
+        with self._lock:
+            (self.path / SEGMENTS_DIR).mkdir(parents=True, exist_ok=True)
+            manifest = self._manifest()
+            name = f"{manifest['next_sequence']:06d}"
+            segment = Segment.write(
+                self.path / SEGMENTS_DIR / name, ids, resumes, vectors, skill_words, model,
+                scores=scores
+            )
+            _write_json(self.path / VOCABULARY_FILE, list(vocabulary))
+            manifest["segments"].append(name)
+            manifest["next_sequence"] += 1
+            _write_json(self.path / MANIFEST_FILE, manifest)
+            return segment
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Record deletions of everything stored so far for these ids"""
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            before = self._manifest()["next_sequence"]
+            with open(self.path / TOMBSTONES_FILE, "a", encoding="utf-8") as f:
+                for candidate_id in ids:
+                    f.write(json.dumps({"id": candidate_id, "before": before}) + "\n")
+
+    def compact(self) -> Optional[Segment]:
+        """
+        Rewrite the live rows into one segment and drop the rest
+
+        Returns:
+            The compacted segment, or None if nothing is stored
+        """
+        with self._lock:
+            segments = self.segments()
+            if not segments:
+                return None
+            deleted = self.tombstones()
+
+            # Last write wins; tombstones cover segments older than them
+            latest: Dict[str, Tuple[int, int]] = {}
+            for position, segment in enumerate(segments):
+                for row, candidate_id in enumerate(segment.ids):
+                    latest.pop(candidate_id, None)
+                    if deleted.get(candidate_id, 0) <= segment.sequence:
+                        latest[candidate_id] = (position, row)
+            ids = list(latest)
+
+            # Surviving rows stay grouped by segment in ascending order
+            n_words = max(segment.skills.shape[0] for segment in segments)
+            by_segment: Dict[int, List[int]] = {}
+            for position, row in latest.values():
+                by_segment.setdefault(position, []).append(row)
+            resumes, vector_parts, word_parts, score_parts = [], [], [], []
+            for position, rows in by_segment.items():
+                segment = segments[position]
+                resumes += [segment.resume(row) for row in rows]
+                vector_parts.append(segment.vectors[rows])
+                score_parts.append(segment.scores[rows])
+                words = np.zeros((n_words, len(rows)), dtype=np.uint64)
+                words[:segment.skills.shape[0]] = segment.skills[:, rows]
+                word_parts.append(words)
+            if vector_parts:
+                vectors = sparse.vstack(vector_parts, format="csr")
+                skill_words = np.concatenate(word_parts, axis=1)
+                scores = np.concatenate(score_parts)
+            else:
+                vectors = sparse.csr_matrix((0, segments[0].vectors.shape[1]))
+                skill_words = np.zeros((n_words, 0), dtype=np.uint64)
+                scores = np.zeros((0, len(SCORE_COLUMNS)))
+            models = {segment.model for segment in segments}
+
+            manifest = self._manifest()
+            name = f"{manifest['next_sequence']:06d}"
+            compacted = Segment.write(
+                self.path / SEGMENTS_DIR / name, ids, resumes, vectors, skill_words,
+                models.pop() if len(models) == 1 else "mixed", scores=scores
+            )
+            _write_json(self.path / MANIFEST_FILE, {
+                "segments": [name], "next_sequence": manifest["next_sequence"] + 1
+            })
+            try:
+                os.remove(self.path / TOMBSTONES_FILE)
+            except FileNotFoundError:
+                pass
+            for segment in segments:
+                shutil.rmtree(segment.path, ignore_errors=True)
+            return compacted
@@ -0,0 +1,414 @@
+"""
+Delta Scoring Service
+Estimates how much hypothetical resume edits would change match and ATS scores
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.models.schemas import (
+    ATSScore, EditImpact, JobDescription, KeywordGap, MatchResult, ParsedResume,
+    ResumeEdit, Skill
+)
+from app.services.matcher import CompiledJob, MatcherService, matcher_service
+from app.services.scorer import ScorerService, exact_round, scorer_service
+from app.services.tfidf_model import VECTORIZER_PARAMS
+
+
+# Where each edit kind lands in the matcher's resume text; edits sharing a
+# position are inserted in this order
+EDIT_ANCHORS = ("summary", "skill", "keyword", "experience", "certification")
+
+# IDF of a term found in one of the two documents of a pair-fitted vectorizer
+# (smooth_idf: ln((1 + n) / (1 + df)) + 1 with n = 2, df = 1)
+PAIR_IDF_SINGLE = math.log(1.5) + 1
+
+
+@dataclass
+class EditState:
+    """Scoring intermediates of one resume (and job) that edits are applied to"""
+    resume: ParsedResume
+    job: Optional[CompiledJob]
+    skills: FrozenSet[str]
+    tokens: List[str]
+    anchors: Dict[str, int]
+    counts: Counter
+    jd_terms: Dict[str, float]
+    pair_fitted: bool
+    dot: float
+    resume_sq: float
+    jd_sq: float
+    features: Dict[str, float]
+    experience_match: bool
+    education_match: bool
+
+
+class DeltaScorer:
+    """
+    Marginal score gains of resume edits from cached intermediates
+
+    Preparing a resume counts the n-grams of the matcher's resume text
+    once and keeps the running sums of the cosine similarity. An edit then
+    only touches the n-grams it inserts (and the bigrams at its insertion
+    point), the skill set and the format flags; match and ATS scores for
+    all edits are recomputed column-wise by the matcher and scorer.
+    """
+
+    def __init__(
+        self,
+        matcher: MatcherService = matcher_service,
+        scorer: ScorerService = scorer_service
+    ):
+        """
+        Args:
+            matcher: Matcher whose TF-IDF model (or pair fallback) is mirrored
+            scorer: Scorer for the ATS component and overall scores
+        """
+        self.matcher = matcher
+        self.scorer = scorer
+        vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS)
+        self._preprocess = vectorizer.build_preprocessor()
+        self._tokenize = vectorizer.build_tokenizer()
+        self._stop_words = vectorizer.get_stop_words()
+        self._vocabulary: Tuple[object, Dict[str, int]] = (None, {})
+
+    def _tokens(self, text: str) -> List[str]:
+        """Stop-word filtered tokens, as the TF-IDF analyzer sees them"""
+        return [t for t in self._tokenize(self._preprocess(text)) if t not in self._stop_words]
+
+    @staticmethod
+    def _ngrams(tokens: Sequence[str]) -> List[str]:
+        return list(tokens) + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def _model_vocabulary(self) -> Dict[str, int]:
+        model, vocabulary = self._vocabulary
+        if model is not self.matcher.model:
+            model = self.matcher.model
+            vocabulary = {term: index for index, term in enumerate(model.terms)}
+            self._vocabulary = (model, vocabulary)
+        return vocabulary
+
+    def _contribution(self, state: EditState, term: str, count: int) -> Tuple[float, float, float]:
+        """A term's share of (dot, resume norm², JD norm²) at a resume count"""
+        if not count and term not in state.jd_terms:
+            return 0.0, 0.0, 0.0
+        if not state.pair_fitted:
+            model = self.matcher.model
+            index = self._model_vocabulary().get(term)
+            if index is None:
+                return 0.0, 0.0, 0.0
+            weight = count * float(model.idf[index])
+            return weight * state.jd_terms.get(term, 0.0), weight * weight, 0.0
+        jd_count = state.jd_terms.get(term, 0.0)
+        idf = 1.0 if count and jd_count else PAIR_IDF_SINGLE
+        idf2 = idf * idf
+        return count * jd_count * idf2, count * count * idf2, jd_count * jd_count * idf2
+
+    def prepare(
+        self,
+        parsed_resume: ParsedResume,
+        job_description: Optional[Union[JobDescription, CompiledJob]] = None
+    ) -> EditState:
+        """
+        Cache the intermediates edits are scored from
+
+        Args:
+            parsed_resume: Resume as parsed
+            job_description: Job to match against (ATS-only gains without one)
+
+        Returns:
+            State for evaluate, rank_edits and project
+        """
+        job = job_description
+        if job is not None and not isinstance(job, CompiledJob):
+            job = self.matcher.compile_job(job)
+
+        # Token positions of the sections of MatcherService._resume_to_text
+        tokens: List[str] = []
+        anchors = {}
+        if parsed_resume.summary:
+            tokens += self._tokens(parsed_resume.summary)
+        anchors["summary"] = 0
+        if parsed_resume.primary_role:
+            tokens += self._tokens(parsed_resume.primary_role)
+        for skill in parsed_resume.skills:
+            tokens += self._tokens(skill.name)
+        anchors["skill"] = len(tokens)
+        for exp in parsed_resume.experience:
+            tokens += self._tokens(f"{exp.title} {exp.company} {exp.description or ''}")
+        anchors["keyword"] = anchors["experience"] = len(tokens)
+        for edu in parsed_resume.education:
+            tokens += self._tokens(f"{edu.degree} {edu.field} {edu.institution}")
+        for cert in parsed_resume.certifications:
+            tokens += self._tokens(cert.name)
+        anchors["certification"] = len(tokens)
+
+        jd_terms: Dict[str, float] = {}
+        model = self.matcher.model
+        # Without a model (or a JD vector) the matcher fits TF-IDF on the pair
+        pair_fitted = model is None or job is None or job.vector is None
+        experience_match = education_match = False
+        if job is not None:
+            if pair_fitted:
+                jd_terms = dict(Counter(self._ngrams(self._tokens(job.text))))
+            else:
+                jd_terms = {
+                    model.terms[int(index)]: float(weight)
+                    for index, weight in zip(job.vector.indices, job.vector.data)
+                }
+            experience_match = self.matcher.check_experience_match(
+                parsed_resume.total_experience_years,
+                job.job.min_experience_years,
+                job.job.max_experience_years
+            )
+            education_match = self.matcher.check_education_match(
+                parsed_resume.education, job.education_tokens
+            )
+
+        features = {
+            name: float(values[0])
+            for name, values in self.scorer.feature_table([parsed_resume]).items()
+        }
+        state = EditState(
+            resume=parsed_resume,
+            job=job,
+            skills=frozenset(skill.name.lower() for skill in parsed_resume.skills),
+            tokens=tokens,
+            anchors=anchors,
+            counts=Counter(self._ngrams(tokens)),
+            jd_terms=jd_terms,
+            pair_fitted=pair_fitted,
+            dot=0.0,
+            resume_sq=0.0,
+            jd_sq=0.0,
+            features=features,
+            experience_match=experience_match,
+            education_match=education_match
+        )
+        for term in set(state.counts) | set(jd_terms):
+            dot, resume_sq, jd_sq = self._contribution(state, term, state.counts.get(term, 0))
+            state.dot += dot
+            state.resume_sq += resume_sq
+            state.jd_sq += jd_sq
+        return state
+
+    def draft_summary(self, state: EditState) -> str:
+        """A short summary from the role, experience and top skills"""
+        resume = state.resume
+        role = resume.primary_role or (state.job.job.title if state.job else "Professional")
+        summary = role
+        if resume.total_experience_years:
+            summary += f" with {resume.total_experience_years:g} years of experience"
+        if resume.skills:
+            summary += f" in {', '.join(skill.name for skill in resume.skills[:3])}"
+        return summary
+
+    def _edit_text(self, state: EditState, edit: ResumeEdit) -> str:
+        if edit.kind == "summary":
+            return "" if state.resume.summary else (edit.value or self.draft_summary(state))
+        if edit.kind == "skill" and edit.value.lower() in state.skills:
+            return ""
+        return edit.value
+
+    def _semantic(self, state: EditState, inserted: Dict[int, List[str]]) -> float:
+        """Cosine similarity after inserting tokens at token positions"""
+        delta = Counter()
+        tokens = state.tokens
+        for position, sequence in inserted.items():
+            if not sequence:
+                continue
+            delta.update(self._ngrams(sequence))
+            left = tokens[position - 1] if position > 0 else None
+            right = tokens[position] if position < len(tokens) else None
+            if left is not None:
+                delta[f"{left} {sequence[0]}"] += 1
+            if right is not None:
+                delta[f"{sequence[-1]} {right}"] += 1
+            if left is not None and right is not None:
+                delta[f"{left} {right}"] -= 1
+
+        dot, resume_sq, jd_sq = state.dot, state.resume_sq, state.jd_sq
+        for term, change in delta.items():
+            if not change:
+                continue
+            count = state.counts.get(term, 0)
+            old = self._contribution(state, term, count)
+            new = self._contribution(state, term, count + change)
+            dot += new[0] - old[0]
+            resume_sq += new[1] - old[1]
+            jd_sq += new[2] - old[2]
+
+        if not state.pair_fitted:
+            return dot / math.sqrt(resume_sq) if resume_sq > 1e-12 else 0.0
+        if resume_sq <= 1e-12 and jd_sq <= 1e-12:
+            return 0.5  # the matcher's default when the pair has no terms
+        if resume_sq <= 1e-12 or jd_sq <= 1e-12:
+            return 0.0
+        return dot / math.sqrt(resume_sq * jd_sq)
+
+    def _edited_row(self, state: EditState, edits: Sequence[ResumeEdit]) -> Tuple[Dict, FrozenSet[str]]:
+        """Features (and skill set) of the resume with edits applied"""
+        features = dict(state.features)
+        skills = set(state.skills)
+        inserted: Dict[int, List[str]] = {}
+        for edit in sorted(edits, key=lambda e: EDIT_ANCHORS.index(e.kind)):
+            text = self._edit_text(state, edit)
+            if edit.kind == "skill":
+                if not text or text.lower() in skills:
+                    continue
+                skills.add(text.lower())
+                features["skill_count"] += 1
+            elif edit.kind == "summary":
+                if not text:
+                    continue
+                features["has_summary"] = 1.0
+            elif edit.kind == "experience":
+                features["experience_count"] += 1
+            elif edit.kind == "certification":
+                features["has_certifications"] = 1.0
+            inserted.setdefault(state.anchors[edit.kind], []).extend(self._tokens(text))
+
+        job = state.job
+        if job is not None:
+            if job.required_skills:
+                pct = len(skills & job.required_skills) / len(job.required_skills) * 100
+            else:
+                matched = skills & job.all_skills
+                pct = min(100, len(matched) * 10) if matched else 50
+            features["skill_match_percentage"] = float(pct)
+            features["semantic_similarity"] = self._semantic(state, inserted)
+        return features, frozenset(skills)
+
+    def _score_rows(self, state: EditState, rows: List[Dict]) -> Tuple[Optional[np.ndarray], np.ndarray, Dict]:
+        """Rounded match scores, rounded ATS overall scores and components per row"""
+        features = {name: np.array([row[name] for row in rows]) for name in rows[0]}
+        for name in ('skill_count', 'degree_level', 'experience_count'):
+            features[name] = features[name].astype(np.int64)
+        for name in ('has_summary', 'has_certifications'):
+            features[name] = features[name].astype(bool)
+
+        match = None
+        if state.job is not None:
+            semantic = features['semantic_similarity']
+            pct = features['skill_match_percentage']
+            match = exact_round(self.matcher.match_scores(
+                semantic, pct, state.experience_match, state.education_match
+            ), 2)
+            # ATS components see the match result's rounded values
+            features['skill_match_percentage'] = exact_round(pct, 2)
+            features['semantic_similarity'] = exact_round(semantic, 4)
+        job = state.job.job if state.job is not None else None
+        components = self.scorer.batch_component_scores(features, job)
+        ats = exact_round(self.scorer.batch_overall_scores(components), 1)
+        return match, ats, components
+
+    def evaluate(
+        self,
+        state: EditState,
+        edit_sets: Sequence[Sequence[ResumeEdit]]
+    ) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """
+        Scores with each set of edits applied, one column entry per set
+
+        Returns:
+            (rounded match scores or None without a job, rounded ATS
+            overall scores)
+        """
+        rows = [self._edited_row(state, edits)[0] for edits in edit_sets]
+        match, ats, _ = self._score_rows(state, rows)
+        return match, ats
+
+    def rank_edits(self, state: EditState, edits: Sequence[ResumeEdit]) -> List[EditImpact]:
+        """
+        Score each edit on its own and rank by ATS gain, then match gain
+
+        Args:
+            state: Prepared resume
+            edits: Candidate edits
+
+        Returns:
+            One EditImpact per edit, best first (ties keep input order)
+        """
+        if not edits:
+            return []
+        match, ats = self.evaluate(state, [()] + [(edit,) for edit in edits])
+        impacts = []
+        for i, edit in enumerate(edits, start=1):
+            impact = EditImpact(
+                edit=edit,
+                ats_score=float(ats[i]),
+                ats_score_gain=round(float(ats[i] - ats[0]), 1)
+            )
+            if match is not None:
+                impact.match_score = float(match[i])
+                impact.match_score_gain = round(float(match[i] - match[0]), 2)
+            impacts.append(impact)
+        impacts.sort(key=lambda impact: (-impact.ats_score_gain, -(impact.match_score_gain or 0)))
+        return impacts
+
+    def project(
+        self,
+        state: EditState,
+        edits: Sequence[ResumeEdit] = ()
+    ) -> Tuple[Optional[MatchResult], ATSScore]:
+        """
+        Match result and ATS score with edits applied
+
+        Only the skill list is rebuilt for the match result; everything
+        else comes from the edited feature row.
+        """
+        row, skills = self._edited_row(state, edits)
+        _, _, components = self._score_rows(state, [row])
+        match_result = None
+        if state.job is not None:
+            resume = state.resume
+            added = [Skill(name=edit.value) for edit in edits
+                     if edit.kind == "skill" and edit.value.lower() not in state.skills]
+            if added:
+                resume = resume.model_copy(update={"skills": resume.skills + added})
+            match_result = self.matcher.build_match_result(
+                resume, state.job, row["semantic_similarity"], row["skill_match_percentage"],
+                state.experience_match, state.education_match
+            )
+        ats_score = self.scorer.score_from_components(
+            {name: float(values[0]) for name, values in components.items()},
+            int(row["skill_count"])
+        )
+        return match_result, ats_score
+
+    def candidate_edits(
+        self,
+        state: EditState,
+        keyword_gaps: Optional[KeywordGap] = None
+    ) -> List[ResumeEdit]:
+        """
+        Edits worth scoring: missing job skills and keywords, and the
+        summary, certification and experience entries the resume lacks
+        """
+        edits = []
+        job = state.job
+        if job is not None:
+            missing = sorted(job.required_skills - state.skills) + \
+                sorted(job.preferred_skills - job.required_skills - state.skills)
+            edits += [ResumeEdit(kind="skill", value=skill.title()) for skill in missing]
+            if keyword_gaps is not None:
+                keywords = keyword_gaps.missing_keywords
+            else:
+                present = set(state.tokens)
+                keywords = sorted(k for k in job.keywords - present if k not in state.skills)
+            edits += [ResumeEdit(kind="keyword", value=keyword) for keyword in keywords]
+        if not state.resume.summary:
+            edits.append(ResumeEdit(kind="summary", value=self.draft_summary(state)))
+        if not state.resume.certifications:
+            edits.append(ResumeEdit(kind="certification"))
+        if len(state.resume.experience) < 2:
+            edits.append(ResumeEdit(kind="experience"))
+        return edits
+
+
+delta_scorer = DeltaScorer()
@@ -0,0 +1,168 @@
+"""
+Resume Document
+Normalized, tokenized view of a resume built once and shared by all extractors
+"""
+
+import hashlib
+import re
+import unicodedata
+from bisect import bisect_right
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Section names and the header phrases that introduce them
+SECTION_HEADERS = {
+    "summary": ["summary", "objective", "profile", "about", "about me"],
+    "experience": ["experience", "employment", "employment history",
+                   "work history", "professional"],
+    "education": ["education", "academic", "academics", "qualification",
+                  "qualifications"],
+    "skills": ["skills", "competencies"],
+    "projects": ["projects"],
+    "certifications": ["certifications", "certificates", "licenses"],
+    "awards": ["awards", "honors", "achievements"],
+    "references": ["references"],
+}
+HEADER_PHRASES = {
+    phrase: section
+    for section, phrases in SECTION_HEADERS.items()
+    for phrase in phrases
+}
+# Words that may precede a header phrase ("Work Experience", "Technical Skills")
+HEADER_QUALIFIERS = frozenset([
+    "work", "professional", "relevant", "technical", "core", "key", "career",
+    "academic", "educational", "employment", "selected", "additional", "other",
+    "personal", "notable", "recent",
+])
+HEADER_LINE_PATTERN = re.compile(r"^[a-z][a-z &/']*$")
+# Joins header phrases of one line ("Awards & Honors", "Licenses and Certifications")
+HEADER_CONNECTOR_PATTERN = re.compile(r"\s*[&/]\s*|\s+and\s+")
+MAX_HEADER_LENGTH = 40
+MAX_HEADER_WORDS = 4
+
+
+class ResumeDocument:
+    """
+    Normalized resume text with derived views computed at most once
+
+    All offsets refer to the NFKC-normalized text, which is the text every
+    extractor sees.
+    """
+
+    def __init__(self, raw_text: str):
+        """
+        Normalize raw resume text
+
+        Args:
+            raw_text: Resume text as received from the client
+        """
+        self.text = unicodedata.normalize('NFKC', raw_text)
+        self.lower = self.text.lower()
+
+    @cached_property
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the normalized text"""
+        return hashlib.sha256(self.text.encode('utf-8')).hexdigest()
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Text split on newlines"""
+        return self.text.split('\n')
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Start offset of every line in the text"""
+        offsets = [0]
+        for line in self.lines[:-1]:
+            offsets.append(offsets[-1] + len(line) + 1)
+        return offsets
+
+    @cached_property
+    def tokens(self) -> List[Tuple[str, int, int]]:
+        """Lowercased word tokens as (token, start, end)"""
+        return [
+            (match.group(0), match.start(), match.end())
+            for match in TOKEN_PATTERN.finditer(self.lower)
+        ]
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Lowercased word tokens without offsets"""
+        return TOKEN_PATTERN.findall(self.lower)
+
+    @cached_property
+    def sections(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Map of section name to the (start, end) span of its body
+
+        Lines are scanned once; a short line made of letters whose trailing
+        words form a known header phrase ("Work Experience", "SKILLS:")
+        starts a section that runs until the next header. Only the first
+        occurrence of each section is kept.
+        """
+        headers = []
+        for index, line in enumerate(self.lines):
+            section = self._classify_header(line)
+            if section:
+                headers.append((index, section))
+
+        spans: Dict[str, Tuple[int, int]] = {}
+        offsets = self.line_offsets
+        for position, (index, section) in enumerate(headers):
+            if section in spans:
+                continue
+            start = offsets[index + 1] if index + 1 < len(offsets) else len(self.text)
+            if position + 1 < len(headers):
+                end = offsets[headers[position + 1][0]]
+            else:
+                end = len(self.text)
+            spans[section] = (start, end)
+        return spans
+
+    def section_text(self, section: str) -> Optional[str]:
+        """Body text of a section, or None if absent or empty"""
+        span = self.sections.get(section)
+        if not span:
+            return None
+        body = self.text[span[0]:span[1]]
+        return body if body.strip() else None
+
+    @staticmethod
+    def _classify_header(line: str) -> Optional[str]:
+        """
+        Section name if the line is a section header
+
+        The whole line must be a header phrase, optionally preceded by
+        qualifiers ("Professional Summary"), or several of those joined by
+        "&", "/" or "and" (named by the first). A sentence that merely ends
+        in a phrase, like "Software engineering experience", is not a header.
+        """
+        header = line.strip().rstrip(':').strip()
+        if not header or len(header) > MAX_HEADER_LENGTH:
+            return None
+        header = header.lower()
+        if not HEADER_LINE_PATTERN.match(header):
+            return None
+        if len(header.split()) > MAX_HEADER_WORDS:
+            return None
+        sections = [
+            ResumeDocument._phrase_section(part.split())
+            for part in HEADER_CONNECTOR_PATTERN.split(header)
+        ]
+        return sections[0] if all(sections) else None
+
+    @staticmethod
+    def _phrase_section(words: List[str]) -> Optional[str]:
+        """Section of a header phrase after any qualifiers"""
+        for count in (3, 2, 1):
+            section = HEADER_PHRASES.get(' '.join(words[-count:]))
+            if section and all(word in HEADER_QUALIFIERS for word in words[:-count]):
+                return section
+        return None
+
+    def line_at(self, offset: int) -> int:
+        """Index of the line containing a text offset"""
+        return bisect_right(self.line_offsets, offset) - 1
@@ -0,0 +1,124 @@
+"""
+CPU Executor Service
+Runs CPU-bound request work off the event loop with admission control
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+from app.config import settings
+
+
+class CpuExecutor:
+    """
+    Bounded executor for synchronous parsing, matching and scoring work
+
+    At most max_in_flight jobs run at once and at most max_queue_depth wait
+    for a slot; further requests are rejected with 429 and Retry-After so
+    the event loop keeps serving health checks and small requests.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue_depth: int, retry_after_seconds: int):
+        """
+        Configure limits; threads and the semaphore are created on first use
+
+        Args:
+            max_in_flight: Maximum concurrently executing jobs
+            max_queue_depth: Maximum jobs waiting for a slot
+            retry_after_seconds: Retry-After value sent with 429 responses
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue_depth = max(0, max_queue_depth)
+        self.retry_after_seconds = retry_after_seconds
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._running = 0
+        self.rejected = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphore
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_in_flight,
+                thread_name_prefix="cpu-executor"
+            )
+        return self._pool
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one in-flight slot, waiting in the bounded queue if needed
+
+        Raises:
+            HTTPException: 429 when the wait queue is full
+        """
+        semaphore = self._get_semaphore()
+        if semaphore.locked() and self._waiting >= self.max_queue_depth:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=429,
+                detail="Service is busy, retry later",
+                headers={"Retry-After": str(self.retry_after_seconds)}
+            )
+        self._waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._running += 1
+        try:
+            yield
+        finally:
+            self._running -= 1
+            semaphore.release()
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a synchronous function on the executor threads
+
+        Args:
+            func: CPU-bound callable
+            args: Positional arguments for func
+            kwargs: Keyword arguments for func
+
+        Returns:
+            The function's return value
+        """
+        async with self.slot():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_pool(), functools.partial(func, *args, **kwargs)
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Current load and limits"""
+        return {
+            "running": self._running,
+            "waiting": self._waiting,
+            "rejected": self.rejected,
+            "max_in_flight": self.max_in_flight,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+    def shutdown(self) -> None:
+        """Stop executor threads"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+cpu_executor = CpuExecutor(
+    max_in_flight=settings.CPU_MAX_IN_FLIGHT,
+    max_queue_depth=settings.CPU_MAX_QUEUE_DEPTH,
+    retry_after_seconds=settings.CPU_RETRY_AFTER_SECONDS
+)
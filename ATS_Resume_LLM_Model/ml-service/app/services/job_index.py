@@ -0,0 +1,255 @@
+"""
+Job Index Service
+Inverted index over the job catalog for top-k job recommendations per resume
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from app.models.records import Resume
+from app.services.candidate_index import PostingList
+from app.services.matcher import CompiledJob, MatcherService
+
+
+class JobIndex:
+    """
+    Incremental index of compiled jobs for reverse (resume to jobs) matching
+
+    Jobs are indexed by their TF-IDF terms, required skills and all listed
+    skills. A query only considers jobs sharing at least one skill with the
+    resume (falling back to the whole catalog when fewer than k do) and
+    scores them in one vectorized pass with the MatcherService formula.
+    """
+
+    def __init__(self, matcher: MatcherService):
+        """
+        Initialize an empty index
+
+        Args:
+            matcher: Matcher providing the TF-IDF model and result builder
+        """
+        self.matcher = matcher
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._terms: Dict[int, PostingList] = {}
+        self._required: Dict[str, PostingList] = {}
+        self._skills: Dict[str, PostingList] = {}
+        self._jobs: List[Optional[CompiledJob]] = []
+        self._doc_of: Dict[str, int] = {}
+        self._min_years: List[float] = []
+        self._max_years: List[float] = []
+        self._n_required: List[int] = []
+        # Jobs share an education key per distinct requirement set; a key
+        # is dropped when its last live job is removed
+        self._education_key: List[int] = []
+        self._education_keys: Dict[Tuple[Tuple[str, ...], ...], int] = {}
+        self._education_tokens: Dict[int, Tuple[Tuple[str, ...], ...]] = {}
+        self._education_jobs: Dict[int, int] = {}
+        self._next_education_key = 0
+        self._live: List[bool] = []
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._deleted = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    def add(self, job: CompiledJob) -> None:
+        """Insert or replace a compiled job"""
+        with self._lock:
+            self._remove(job.job_id)
+            doc = len(self._jobs)
+            self._jobs.append(job)
+            self._doc_of[job.job_id] = doc
+            self._min_years.append(job.job.min_experience_years)
+            self._max_years.append(job.job.max_experience_years or 0)
+            self._n_required.append(len(job.required_skills))
+            self._education_key.append(self._acquire_education_key(job.education_tokens))
+            self._live.append(True)
+            self._arrays = None
+
+            docs = np.array([doc], dtype=np.int32)
+            if job.vector is not None:
+                for term, weight in zip(job.vector.indices, job.vector.data):
+                    self._posting(self._terms, int(term)).extend(
+                        docs, np.array([weight], dtype=np.float64)
+                    )
+            one = np.ones(1, dtype=np.float32)
+            for skill in job.required_skills:
+                self._posting(self._required, skill).extend(docs, one)
+            for skill in job.all_skills:
+                self._posting(self._skills, skill).extend(docs, one)
+
+    def delete(self, job_id: str) -> bool:
+        """Remove a job; returns False if it was not indexed"""
+        with self._lock:
+            removed = self._remove(job_id)
+            if self._deleted > max(1024, len(self._jobs) // 2):
+                self.compact()
+            return removed
+
+    def _remove(self, job_id: str) -> bool:
+        doc = self._doc_of.pop(job_id, None)
+        if doc is None:
+            return False
+        self._jobs[doc] = None
+        self._live[doc] = False
+        self._arrays = None
+        self._deleted += 1
+        self._release_education_key(self._education_key[doc])
+        return True
+
+    def _acquire_education_key(self, tokens: Tuple[Tuple[str, ...], ...]) -> int:
+        key = self._education_keys.get(tokens)
+        if key is None:
+            key = self._education_keys[tokens] = self._next_education_key
+            self._education_tokens[key] = tokens
+            self._next_education_key += 1
+        self._education_jobs[key] = self._education_jobs.get(key, 0) + 1
+        return key
+
+    def _release_education_key(self, key: int) -> None:
+        self._education_jobs[key] -= 1
+        if not self._education_jobs[key]:
+            del self._education_jobs[key]
+            del self._education_keys[self._education_tokens.pop(key)]
+
+    def compact(self) -> None:
+        """Rebuild the index without deleted jobs"""
+        with self._lock:
+            jobs = [job for job in self._jobs if job is not None]
+            self._reset()
+            for job in jobs:
+                self.add(job)
+
+    @staticmethod
+    def _posting(table: Dict, key) -> PostingList:
+        postings = table.get(key)
+        if postings is None:
+            postings = table[key] = PostingList()
+        return postings
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        """Per-job numeric columns, rebuilt after catalog changes"""
+        if self._arrays is None:
+            self._arrays = {
+                "min_years": np.asarray(self._min_years, dtype=np.float64),
+                "max_years": np.asarray(self._max_years, dtype=np.float64),
+                "n_required": np.asarray(self._n_required, dtype=np.float64),
+                "education_key": np.asarray(self._education_key, dtype=np.int64),
+                "live": np.asarray(self._live, dtype=bool),
+            }
+        return self._arrays
+
+    def recommend(
+        self,
+        parsed_resume: Resume,
+        top_k: int = 10,
+        vector: Optional[sparse.csr_matrix] = None
+    ) -> List[Dict]:
+        """
+        Best-matching jobs for a resume
+
+        Args:
+            parsed_resume: Resume to match
+            top_k: Number of jobs to return
+            vector: Precomputed resume TF-IDF row
+
+        Returns:
+            Ranked jobs with the compiled job, match_result, ranking_score
+            and rank, best first
+        """
+        if self.matcher.model is None:
+            raise RuntimeError("Job index requires a fitted TF-IDF model")
+        if vector is None:
+            vector = self.matcher.resume_vectors([parsed_resume])
+        resume_skills = {skill.name.lower() for skill in parsed_resume.skills}
+
+        with self._lock:
+            if not self._doc_of or top_k <= 0:
+                return []
+            columns = self._columns()
+            n = len(self._jobs)
+            k = min(top_k, len(self._doc_of))
+
+            # Skill-overlap prefilter from the all-skills postings
+            skill_hits = np.zeros(n, dtype=np.float64)
+            required_hits = np.zeros(n, dtype=np.float64)
+            for skill in resume_skills:
+                postings = self._skills.get(skill)
+                if postings is not None:
+                    skill_hits[postings.arrays()[0]] += 1
+                postings = self._required.get(skill)
+                if postings is not None:
+                    required_hits[postings.arrays()[0]] += 1
+            jobs = np.flatnonzero((skill_hits > 0) & columns["live"])
+            if len(jobs) < k:
+                jobs = np.flatnonzero(columns["live"])
+
+            # Semantic similarity over the resume's terms only
+            semantic = np.zeros(n, dtype=np.float64)
+            for term, weight in zip(vector.indices, vector.data):
+                postings = self._terms.get(int(term))
+                if postings is not None:
+                    docs, weights = postings.arrays()
+                    semantic[docs] += weight * weights
+            semantic = np.clip(semantic[jobs], 0.0, 1.0)
+
+            n_required = columns["n_required"][jobs]
+            matched = skill_hits[jobs]
+            skill_match_pct = np.where(
+                n_required > 0,
+                required_hits[jobs] / np.maximum(n_required, 1) * 100,
+                np.where(matched > 0, np.minimum(100, matched * 10), 50)
+            )
+
+            years = parsed_resume.total_experience_years
+            max_years = columns["max_years"][jobs]
+            experience_match = (years >= columns["min_years"][jobs]) & (
+                (max_years == 0) | (years <= max_years)
+            )
+
+            # Education is checked once per distinct requirement set among
+            # the prefiltered jobs
+            keys, inverse = np.unique(columns["education_key"][jobs], return_inverse=True)
+            education_by_key = np.fromiter((
+                self.matcher.check_education_match(
+                    parsed_resume.education, self._education_tokens[key]
+                )
+                for key in keys.tolist()
+            ), dtype=bool, count=len(keys))
+            education_match = education_by_key[inverse]
+
+            scores = np.round(self.matcher.match_scores(
+                semantic, skill_match_pct, experience_match, education_match
+            ), 2)
+
+            ranked = []
+            for position, index in enumerate(self.matcher.top_indices(scores, k)):
+                job = self._jobs[jobs[index]]
+                match_result = self.matcher.build_match_result(
+                    parsed_resume, job,
+                    float(semantic[index]), float(skill_match_pct[index]),
+                    bool(experience_match[index]), bool(education_match[index])
+                )
+                ranked.append({
+                    "job": job,
+                    "match_result": match_result,
+                    "ranking_score": match_result.match_score,
+                    "rank": position + 1
+                })
+            return ranked
+
+    def stats(self) -> Dict[str, int]:
+        """Catalog size and index shape"""
+        return {
+            "jobs": len(self._doc_of),
+            "deleted_pending_compaction": self._deleted,
+            "terms": len(self._terms),
+            "skills": len(self._skills),
+            "education_requirements": len(self._education_keys),
+        }
@@ -0,0 +1,94 @@
+"""
+Job Registry Service
+Stores job descriptions by job_id together with their compiled matching artifacts
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from app.models.records import Resume
+from app.models.schemas import JobDescription
+from app.services.job_index import JobIndex
+from app.services.matcher import CompiledJob, MatcherService, matcher_service
+
+
+class JobRegistry:
+    """In-memory registry of compiled job descriptions and their job index"""
+
+    def __init__(self, matcher: MatcherService):
+        """
+        Initialize an empty registry
+
+        Args:
+            matcher: Matcher used to compile job descriptions
+        """
+        self.matcher = matcher
+        self._jobs: Dict[str, CompiledJob] = {}
+        self.index = JobIndex(matcher)
+        self._lock = threading.Lock()
+
+    def create(self, job: JobDescription) -> CompiledJob:
+        """
+        Register a new job
+
+        Raises:
+            ValueError: If the job_id is already registered
+        """
+        compiled = self.matcher.compile_job(job)
+        with self._lock:
+            if job.job_id in self._jobs:
+                raise ValueError(f"Job {job.job_id} already exists")
+            self._jobs[job.job_id] = compiled
+            self.index.add(compiled)
+        return compiled
+
+    def update(self, job_id: str, job: JobDescription) -> CompiledJob:
+        """
+        Replace a registered job and recompile it
+
+        Raises:
+            KeyError: If the job_id is not registered
+        """
+        job = job.model_copy(update={"job_id": job_id})
+        compiled = self.matcher.compile_job(job)
+        with self._lock:
+            if job_id not in self._jobs:
+                raise KeyError(job_id)
+            self._jobs[job_id] = compiled
+            self.index.add(compiled)
+        return compiled
+
+    def upsert(self, job: JobDescription) -> CompiledJob:
+        """Register or replace a job"""
+        compiled = self.matcher.compile_job(job)
+        with self._lock:
+            self._jobs[job.job_id] = compiled
+            self.index.add(compiled)
+        return compiled
+
+    def delete(self, job_id: str) -> None:
+        """
+        Remove a registered job
+
+        Raises:
+            KeyError: If the job_id is not registered
+        """
+        with self._lock:
+            del self._jobs[job_id]
+            self.index.delete(job_id)
+
+    def get(self, job_id: str) -> Optional[CompiledJob]:
+        """Compiled job for an id, or None"""
+        return self._jobs.get(job_id)
+
+    def recommend(self, parsed_resume: Resume, top_k: int = 10) -> List[Dict]:
+        """Best-matching registered jobs for a resume, see JobIndex.recommend"""
+        return self.index.recommend(parsed_resume, top_k)
+
+    def list_jobs(self) -> List[JobDescription]:
+        """All registered job descriptions"""
+        with self._lock:
+            return [compiled.job for compiled in self._jobs.values()]
+
+
+job_registry = JobRegistry(matcher_service)
@@ -0,0 +1,256 @@
+"""
+Job Scores Service
+Per-job component scores of the candidate pool, re-ranked under weight profiles
+"""
+
+import hashlib
+import json
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.config import settings
+from app.models.schemas import RecommendationStatus, WeightProfile
+from app.services.candidate_index import CandidateIndex, candidate_index
+from app.services.matcher import CompiledJob, MatcherService
+from app.services.scorer import ScorerService, scorer_service
+
+
+PROFILES_FILE = "profiles.json"
+TABLE_META_FILE = "meta.json"
+
+
+class JobScoreTable:
+    """Match and ATS component columns of every pooled candidate for one job"""
+
+    def __init__(
+        self,
+        ids: List[str],
+        names: List[str],
+        columns: Dict[str, np.ndarray],
+        key: str,
+        pool: str
+    ):
+        """
+        Args:
+            ids: Candidate ids in pool order (ties rank in this order)
+            names: Anonymized candidate names
+            columns: Component arrays, see CandidateIndex.job_components
+            key: Fingerprint of the job and model the columns were scored with
+            pool: Digest of the candidate pool they were scored over
+        """
+        self.ids = ids
+        self.names = names
+        self.columns = columns
+        self.key = key
+        self.pool = pool
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class JobScoreService:
+    """
+    Weight profiles per job and cached component scores to re-rank with them
+
+    Component scores do not depend on weights, so a table is computed once
+    per job and candidate pool and saved next to the profiles; changing a
+    profile only re-weights the columns.
+    """
+
+    def __init__(
+        self,
+        index: CandidateIndex,
+        path: Optional[str] = None,
+        scorer: ScorerService = scorer_service
+    ):
+        """
+        Initialize the service
+
+        Args:
+            index: Candidate pool to score
+            path: Directory for profiles and score tables (None keeps them in memory)
+            scorer: Scorer for ATS weights
+        """
+        self.index = index
+        self.scorer = scorer
+        self.path = Path(path) if path else None
+        self._tables: Dict[str, tuple] = {}
+        self._profiles: Optional[Dict[str, WeightProfile]] = None
+        self._lock = threading.Lock()
+
+    def _load_profiles(self) -> Dict[str, WeightProfile]:
+        if self._profiles is None:
+            self._profiles = {}
+            if self.path is not None and (self.path / PROFILES_FILE).exists():
+                with open(self.path / PROFILES_FILE, encoding="utf-8") as f:
+                    self._profiles = {
+                        job_id: WeightProfile.model_validate(profile)
+                        for job_id, profile in json.load(f).items()
+                    }
+        return self._profiles
+
+    def _save_profiles(self) -> None:
+        if self.path is None:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path, delete=False, encoding="utf-8", suffix=".tmp"
+        ) as f:
+            json.dump({job_id: p.model_dump() for job_id, p in self._profiles.items()}, f)
+        Path(f.name).replace(self.path / PROFILES_FILE)
+
+    def profile(self, job_id: str) -> WeightProfile:
+        """The job's weight profile (defaults when none is set)"""
+        with self._lock:
+            return self._load_profiles().get(job_id) or WeightProfile()
+
+    def set_profile(self, job_id: str, profile: WeightProfile) -> None:
+        """Attach a weight profile to a job"""
+        with self._lock:
+            self._load_profiles()[job_id] = profile
+            self._save_profiles()
+
+    def forget(self, job_id: str) -> None:
+        """Drop a job's profile and cached scores"""
+        with self._lock:
+            self._tables.pop(job_id, None)
+            if self._load_profiles().pop(job_id, None) is not None:
+                self._save_profiles()
+            if self.path is not None:
+                shutil.rmtree(self._table_dir(job_id), ignore_errors=True)
+
+    def _table_dir(self, job_id: str) -> Path:
+        return self.path / "tables" / hashlib.sha256(job_id.encode("utf-8")).hexdigest()[:32]
+
+    def _job_key(self, job: CompiledJob) -> str:
+        model = self.index.matcher.model
+        content = job.job.model_dump_json() + (model.fingerprint if model is not None else "")
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+    def table(self, job: CompiledJob) -> JobScoreTable:
+        """
+        Component scores of the current pool for a job
+
+        Reuses the in-memory table while the pool is unchanged, then a
+        saved table if it was scored for the same job over the same pool
+        contents (see CandidateIndex.pool_state), and only otherwise
+        scores the pool. Scoring runs outside the service lock, so
+        concurrent requests for other jobs are not held up by it.
+        """
+        key = self._job_key(job)
+        version, pool = self.index.pool_state()
+        with self._lock:
+            cached = self._tables.get(job.job_id)
+            if cached is not None and cached[0] == version and cached[1].key == key:
+                return cached[1]
+            table = self._read_table(job.job_id, key, pool)
+        if table is None:
+            ids, names, columns = self.index.job_components(job)
+            table = JobScoreTable(ids, names, columns, key, pool)
+            if self.index.version != version:
+                # Scored over a newer pool than the digest describes; serve it uncached
+                return table
+            with self._lock:
+                self._write_table(job.job_id, table)
+        with self._lock:
+            cached = self._tables.get(job.job_id)
+            if cached is None or cached[0] <= version:
+                self._tables[job.job_id] = (version, table)
+        return table
+
+    def _read_table(self, job_id: str, key: str, pool: str) -> Optional[JobScoreTable]:
+        if self.path is None:
+            return None
+        directory = self._table_dir(job_id)
+        try:
+            with open(directory / TABLE_META_FILE, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["key"] != key or meta["pool"] != pool:
+                return None
+            columns = {
+                name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in meta["columns"]
+            }
+        except (FileNotFoundError, KeyError, ValueError):
+            return None
+        return JobScoreTable(meta["ids"], meta["names"], columns, key, pool)
+
+    def _write_table(self, job_id: str, table: JobScoreTable) -> None:
+        if self.path is None:
+            return
+        directory = self._table_dir(job_id)
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=directory.parent, prefix=".tmp-"))
+        for name, values in table.columns.items():
+            np.save(staging / f"{name}.npy", values)
+        with open(staging / TABLE_META_FILE, "w", encoding="utf-8") as f:
+            json.dump({
+                "key": table.key, "pool": table.pool, "ids": table.ids, "names": table.names,
+                "columns": list(table.columns)
+            }, f)
+        shutil.rmtree(directory, ignore_errors=True)
+        staging.rename(directory)
+
+    def rank(
+        self,
+        table: JobScoreTable,
+        profile: WeightProfile,
+        top_k: int = 10,
+        offset: int = 0,
+        rank_by: str = "match"
+    ) -> List[Dict]:
+        """
+        Re-weight a score table and return a ranked page
+
+        Args:
+            table: Component scores from table()
+            profile: Weights and thresholds to apply
+            top_k: Page size
+            offset: Number of top candidates to skip
+            rank_by: "match" (match score) or "ats" (ATS overall score)
+
+        Returns:
+            Page entries with candidate_id, name, rank, match_score,
+            ats_score and recommendation (from the ATS score and thresholds)
+        """
+        columns = table.columns
+        match = np.round(MatcherService.match_scores(
+            columns["semantic_similarity"], columns["skill_match_pct"],
+            columns["experience_match"], columns["education_match"],
+            profile.match_weights.model_dump()
+        ), 2)
+        ats = self.scorer.batch_overall_scores(
+            {name: columns[f"ats_{name}"] for name in self.scorer.WEIGHTS},
+            profile.ats_weights.model_dump()
+        )
+        key = match if rank_by == "match" else np.round(ats, 1)
+        page = MatcherService.top_indices(key, offset + top_k)[offset:]
+
+        ranked = []
+        for position, index in enumerate(page.tolist()):
+            ats_score = float(ats[index])
+            if ats_score >= profile.hire_threshold:
+                recommendation = RecommendationStatus.HIRE
+            elif ats_score >= profile.review_threshold:
+                recommendation = RecommendationStatus.REVIEW
+            else:
+                recommendation = RecommendationStatus.REJECT
+            ranked.append({
+                "candidate_id": table.ids[index],
+                "name": table.names[index],
+                "rank": offset + position + 1,
+                "match_score": float(match[index]),
+                "ats_score": round(ats_score, 1),
+                "recommendation": recommendation,
+            })
+        return ranked
+
+
+job_scores = JobScoreService(
+    candidate_index,
+    path=settings.JOB_SCORES_PATH or None
+)
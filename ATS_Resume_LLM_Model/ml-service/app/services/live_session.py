@@ -0,0 +1,366 @@
+"""
+Live Session Service
+Incrementally re-parsed and re-scored resume text for interactive editing
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from app.models.records import SkillRecord
+from app.models.schemas import JobDescription, MatchResult, ParsedResume
+from app.services.document import ResumeDocument
+from app.services.matcher import CompiledJob, MatcherService, matcher_service
+from app.services.resume_parser import ResumeParserService, resume_parser
+from app.services.scorer import ScorerService, scorer_service
+from app.services.skill_matcher import SkillHit
+from app.services.suggestions import SuggestionsService, suggestions_service
+
+
+class LineScan(NamedTuple):
+    """Per-line results that never depend on neighbouring lines"""
+    header: Optional[str]
+    hits: List[SkillHit]
+    indicators: List[Tuple[int, int, str]]
+
+
+class TextChange(NamedTuple):
+    """Replacement of text[start:end] by text, in code point offsets"""
+    start: int
+    end: int
+    text: str
+
+
+class _MemoDocument(ResumeDocument):
+    """ResumeDocument whose header classification comes from the line memo"""
+
+    def __init__(self, raw_text: str, scans: Dict[str, LineScan]):
+        super().__init__(raw_text)
+        self._scans = scans
+
+    def _classify_header(self, line: str) -> Optional[str]:
+        return self._scans[line].header
+
+
+class LiveResume:
+    """
+    Resume text kept in sync with an editor through text changes
+
+    Skill hits, proficiency indicators and section headers never span a
+    newline, so they are memoized per line and only new or edited lines
+    are scanned. Every other extractor is tied to the text it reads (its
+    section body, the first lines, or the whole text) and re-runs only
+    when that text changed. The result always equals a full parse.
+    """
+
+    def __init__(self, parser: ResumeParserService = resume_parser, anonymize: bool = True):
+        """
+        Args:
+            parser: Parser whose extractors are re-run
+            anonymize: Whether to anonymize personal information
+        """
+        self.parser = parser
+        self.anonymize = anonymize
+        self.text = ""
+        self.doc: Optional[ResumeDocument] = None
+        self.parsed: Optional[ParsedResume] = None
+        self._scans: Dict[str, LineScan] = {}
+        self._scopes: Dict[str, Any] = {}
+        self._extracted: Dict[str, Any] = {}
+
+    def apply(self, changes: Sequence[TextChange]) -> None:
+        """
+        Apply text changes in order, each against the text the previous left
+
+        Raises:
+            ValueError: If a change's offsets fall outside the text
+        """
+        text = self.text
+        for change in changes:
+            if not 0 <= change.start <= change.end <= len(text):
+                raise ValueError(
+                    f"Change {change.start}:{change.end} outside text of length {len(text)}"
+                )
+            text = text[:change.start] + change.text + text[change.end:]
+        self.text = text
+
+    def _scan(self, line: str) -> LineScan:
+        matcher = self.parser.skill_matcher
+        lower = line.lower()
+        return LineScan(
+            ResumeDocument._classify_header(line),
+            matcher.find_all(lower),
+            matcher.find_indicators(lower)
+        )
+
+    def _skills(self, doc: ResumeDocument, scans: Dict[str, LineScan]) -> List[SkillRecord]:
+        """_extract_skills from the per-line hits"""
+        hits, indicators = [], []
+        offset = 0
+        for line in doc.lines:
+            scan = scans[line]
+            hits += [hit._replace(start=hit.start + offset, end=hit.end + offset) for hit in scan.hits]
+            indicators += [(start + offset, end + offset, level) for start, end, level in scan.indicators]
+            offset += len(line.lower()) + 1
+        if not hits:
+            return []
+        return self.parser.skills_from_hits(hits, indicators, len(doc.lower))
+
+    def _extractor_scopes(self, doc: ResumeDocument) -> Dict[str, Any]:
+        """The text each extractor reads"""
+        lines = doc.lines
+        first = next((i for i, line in enumerate(lines) if line.strip()), len(lines))
+        education = doc.section_text("education")
+        experience = doc.section_text("experience")
+        return {
+            "name": lines[first:first + 5],
+            "email": doc.text,
+            "phone": doc.text,
+            "location": doc.text,
+            "education": doc.text if education is None else education,
+            "experience": doc.text if experience is None else experience,
+            "certifications": doc.text,
+            "summary": doc.section_text("summary"),
+        }
+
+    def reparse(self) -> List[str]:
+        """
+        Re-parse the current text, re-running only the affected extractors
+
+        Returns:
+            Names of the extractors that ran ("skills" when any line was scanned)
+        """
+        doc = _MemoDocument(self.text, {})
+        scans = {}
+        scanned = 0
+        for line in doc.lines:
+            if line not in scans:
+                scan = self._scans.get(line)
+                if scan is None:
+                    scan = self._scan(line)
+                    scanned += 1
+                scans[line] = scan
+        # Lines no longer in the text drop out of the memo
+        doc._scans = self._scans = scans
+
+        needed = self.parser.extractors_for(self.parser.FIELD_EXTRACTORS, self.anonymize)
+        scopes = {
+            field: scope for field, scope in self._extractor_scopes(doc).items() if field in needed
+        }
+        reran = [
+            field for field, scope in scopes.items()
+            if field not in self._extracted or self._scopes.get(field) != scope
+        ]
+        self._extracted.update(self.parser.extract(doc, reran))
+        if scanned or "skills" not in self._extracted:
+            self._extracted["skills"] = self._skills(doc, scans)
+            reran.append("skills")
+        self._scopes = scopes
+
+        self.doc = doc
+        self.parsed = self.parser.assemble(doc, self.anonymize, self._extracted)
+        return reran
+
+
+class Debouncer:
+    """
+    Decides when queued edits are due: after a quiet period, or once the
+    oldest has waited max_delay, so continuous typing still gets updates
+    """
+
+    def __init__(self, quiet: float, max_delay: float):
+        """
+        Args:
+            quiet: Seconds without edits before an update
+            max_delay: Upper bound in seconds on how long an edit waits
+        """
+        self.quiet = quiet
+        self.max_delay = max_delay
+        self.reset()
+
+    def reset(self) -> None:
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+        self._forced = False
+
+    def touch(self, now: float) -> None:
+        """Record an edit"""
+        if self._first is None:
+            self._first = now
+        self._last = now
+
+    def flush(self) -> None:
+        """Make queued edits due immediately"""
+        self._forced = True
+
+    def remaining(self, now: float) -> float:
+        """Seconds until queued edits are due (0 when due)"""
+        if self._forced or self._first is None:
+            return 0.0
+        return max(0.0, min(self._last + self.quiet, self._first + self.max_delay) - now)
+
+
+class LiveScoringSession:
+    """
+    Parse, score and suggestion state of one resume builder connection
+
+    Edits are queued as they arrive and applied together by update(), so
+    bursts of keystrokes cost one re-parse and one re-score.
+    """
+
+    def __init__(
+        self,
+        parser: ResumeParserService = resume_parser,
+        matcher: MatcherService = matcher_service,
+        scorer: ScorerService = scorer_service,
+        suggestions: SuggestionsService = suggestions_service,
+        anonymize: bool = True
+    ):
+        self.resume = LiveResume(parser, anonymize)
+        self.matcher = matcher
+        self.scorer = scorer
+        self.suggestions = suggestions
+        self.job: Optional[CompiledJob] = None
+        self.version = 0
+        self._pending: List[TextChange] = []
+        self._pending_messages = 0
+        self._length = 0
+        self._job_changed = False
+        self._lock = threading.Lock()
+        self._last: Dict[str, Any] = {}
+        self._match_result: Optional[MatchResult] = None
+
+    def queue(self, changes: Sequence[TextChange], version: int) -> None:
+        """
+        Queue an edit message's changes for the next update
+
+        Raises:
+            ValueError: If a change does not fit the text as edited so far
+        """
+        with self._lock:
+            length = self._length
+            for change in changes:
+                if not 0 <= change.start <= change.end <= length:
+                    raise ValueError(
+                        f"Change {change.start}:{change.end} outside text of length {length}"
+                    )
+                length += len(change.text) - (change.end - change.start)
+            self._length = length
+            self._pending += changes
+            self._pending_messages += 1
+            self.version = version
+
+    def reset(self, text: str, version: int = 0) -> None:
+        """Replace the whole text, e.g. on connect or after a resync"""
+        with self._lock:
+            self._pending = [TextChange(0, self._length, text)]
+            self._pending_messages += 1
+            self._length = len(text)
+            self.version = version
+
+    def set_job(self, job: Optional[Union[JobDescription, CompiledJob]]) -> None:
+        """Score against a job from the next update on (None for ATS only)"""
+        if isinstance(job, JobDescription):
+            job = self.matcher.compile_job(job)
+        with self._lock:
+            self.job = job
+            self._job_changed = True
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending) or self._job_changed
+
+    def update(self) -> Optional[Dict]:
+        """
+        Apply queued changes, then re-parse and re-score what they affected
+
+        Returns:
+            An "update" message with only the parts that changed, or None
+            when nothing was queued
+        """
+        with self._lock:
+            if not self.dirty:
+                return None
+            changes, self._pending = self._pending, []
+            coalesced, self._pending_messages = self._pending_messages, 0
+            job, job_changed, self._job_changed = self.job, self._job_changed, False
+            version = self.version
+
+        start = time.perf_counter()
+        resume = self.resume
+        resume.apply(changes)
+        reran = resume.reparse()
+        parsed, doc = resume.parsed, resume.doc
+        last = self._last
+
+        state = {"parsed_resume": parsed.model_dump(mode="json")}
+        keyword_gaps = self.matcher.analyze_keyword_gaps(doc, job if job is not None else "")
+        state["keyword_gaps"] = keyword_gaps.model_dump(mode="json")
+
+        # Scores only depend on the parsed resume and the job
+        if job_changed or state["parsed_resume"] != last.get("parsed_resume"):
+            self._match_result = self.matcher.match_resume_to_job(parsed, job) if job else None
+            ats_score = self.scorer.calculate_ats_score(
+                parsed, job.job if job else None, self._match_result
+            )
+            state["match_result"] = (
+                self._match_result.model_dump(mode="json") if self._match_result else None
+            )
+            state["ats_score"] = ats_score.model_dump(mode="json")
+        else:
+            state["match_result"] = last["match_result"]
+            state["ats_score"] = last["ats_score"]
+
+        if any(state[key] != last.get(key) for key in state):
+            suggestions = self.suggestions.generate_suggestions(
+                parsed, job.job if job else None, keyword_gaps, self._match_result
+            )
+            state["suggestions"] = [s.model_dump(mode="json") for s in suggestions]
+        else:
+            state["suggestions"] = last["suggestions"]
+
+        message = self._delta(last, state)
+        message.update({
+            "type": "update",
+            "version": version,
+            "coalesced": coalesced,
+            "reparsed": reran,
+            "timing_ms": round((time.perf_counter() - start) * 1000, 3),
+        })
+        self._last = state
+        return message
+
+    @staticmethod
+    def _delta(last: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        """The parts of state that differ from the last update"""
+        message: Dict[str, Any] = {}
+        previous = last.get("parsed_resume") or {}
+        changed = {
+            field: value for field, value in state["parsed_resume"].items()
+            if previous.get(field) != value
+        }
+        if changed:
+            message["parsed_resume"] = changed
+        for key in ("keyword_gaps", "match_result", "ats_score"):
+            if state[key] != last.get(key):
+                message[key] = state[key]
+        if state["ats_score"] != last.get("ats_score") and last.get("ats_score"):
+            message["ats_score_delta"] = round(
+                state["ats_score"]["overall_score"] - last["ats_score"]["overall_score"], 1
+            )
+        if state["match_result"] and last.get("match_result") and \
+                state["match_result"] != last["match_result"]:
+            message["match_score_delta"] = round(
+                state["match_result"]["match_score"] - last["match_result"]["match_score"], 2
+            )
+
+        before = {s["title"]: s for s in last.get("suggestions", [])}
+        after = {s["title"]: s for s in state["suggestions"]}
+        suggestions = {
+            "added": [s for title, s in after.items() if title not in before],
+            "updated": [s for title, s in after.items() if title in before and before[title] != s],
+            "removed": [title for title in before if title not in after],
+        }
+        if any(suggestions.values()):
+            message["suggestions"] = suggestions
+        return message
@@ -3,117 +3,211 @@ JD-Resume Matching Service
 Implements semantic matching using TF-IDF and cosine similarity
 """
 
-import re
-from typing import List, Dict, Set, Tuple
+from dataclasses import dataclass
+from typing import FrozenSet, List, Dict, Optional, Set, Tuple, Union
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
-from app.models.schemas import (
-    ParsedResume, JobDescription, MatchResult, KeywordGap
-)
+from app.models.records import Resume
+from app.models.schemas import JobDescription, MatchResult, KeywordGap
+from app.config import settings
+from app.services.document import ResumeDocument, TOKEN_PATTERN
+from app.services.tfidf_model import TfidfModel, VECTORIZER_PARAMS
+
+
+@dataclass(frozen=True)
+class CompiledJob:
+    """Job description with all JD-side matching inputs precomputed"""
+    job: JobDescription
+    text: str
+    vector: Optional[sparse.csr_matrix]
+    required_skills: FrozenSet[str]
+    preferred_skills: FrozenSet[str]
+    all_skills: FrozenSet[str]
+    education_tokens: Tuple[Tuple[str, ...], ...]
+    keywords: FrozenSet[str]
+    
+    @property
+    def job_id(self) -> str:
+        return self.job.job_id
 
 
 class MatcherService:
     """Service for matching resumes against job descriptions"""
     
-    def __init__(self):
-        """Initialize the matcher with TF-IDF vectorizer"""
-        self.vectorizer = TfidfVectorizer(
-            stop_words='english',
-            ngram_range=(1, 2),
-            max_features=5000,
-            lowercase=True
+    # Common stop words to exclude from keyword analysis
+    STOP_WORDS = frozenset({
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+        'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+        'before', 'after', 'above', 'below', 'between', 'under', 'again',
+        'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why',
+        'how', 'all', 'each', 'few', 'more', 'most', 'other', 'some', 'such',
+        'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very',
+        's', 't', 'can', 'will', 'just', 'don', 'should', 'now', 'we', 'you',
+        'your', 'our', 'their', 'this', 'that', 'these', 'those', 'am', 'is',
+        'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
+        'having', 'do', 'does', 'did', 'doing', 'would', 'could', 'should',
+        'might', 'must', 'shall', 'what', 'which', 'who', 'whom', 'years',
+        'year', 'experience', 'work', 'working', 'job', 'position', 'role',
+        'team', 'company', 'looking', 'seeking', 'required', 'requirements'
+    })
+    
+    # ParsedResume fields matching reads
+    RESUME_FIELDS = (
+        "skills", "education", "experience", "certifications",
+        "total_experience_years", "primary_role", "summary"
+    )
+    
+    # Match score weights; experience and education award 100 points when
+    # met and 30 / 50 otherwise
+    MATCH_WEIGHTS = {
+        'semantic': 0.25,
+        'skills': 0.40,
+        'experience': 0.20,
+        'education': 0.15
+    }
+    
+    def __init__(self, model: Optional[TfidfModel] = None):
+        """
+        Initialize the matcher
+        
+        Args:
+            model: Corpus-fitted TF-IDF model; without one, each pair is
+                fitted on its own two documents
+        """
+        self.model = model
+    
+    def compile_job(self, job_description: JobDescription) -> CompiledJob:
+        """
+        Precompute everything matching needs from the JD side
+        
+        Args:
+            job_description: Job description to compile
+            
+        Returns:
+            CompiledJob reusable across any number of resumes
+        """
+        jd_text = self._jd_to_text(job_description)
+        required_skills = frozenset(skill.lower() for skill in job_description.required_skills)
+        preferred_skills = frozenset(skill.lower() for skill in job_description.preferred_skills)
+        
+        return CompiledJob(
+            job=job_description,
+            text=jd_text,
+            vector=self.model.transform([jd_text]) if self.model is not None else None,
+            required_skills=required_skills,
+            preferred_skills=preferred_skills,
+            all_skills=required_skills | preferred_skills,
+            education_tokens=tuple(
+                tuple(req.lower().split()) for req in job_description.education_requirements
+            ),
+            keywords=frozenset(self._extract_keywords(job_description.description))
         )
     
     def match_resume_to_job(
         self, 
-        parsed_resume: ParsedResume, 
-        job_description: JobDescription
+        parsed_resume: Resume, 
+        job_description: Union[JobDescription, CompiledJob]
     ) -> MatchResult:
         """
         Match a parsed resume against a job description
         
         Args:
             parsed_resume: Parsed resume data
-            job_description: Job description to match against
+            job_description: Job description, or its compiled form to skip
+                all JD-side work
             
         Returns:
             MatchResult with scores and analysis
         """
-        # Extract text representations
-        resume_text = self._resume_to_text(parsed_resume)
-        jd_text = self._jd_to_text(job_description)
-        
-        # Calculate semantic similarity using TF-IDF
-        semantic_similarity = self._calculate_semantic_similarity(resume_text, jd_text)
+        if isinstance(job_description, CompiledJob):
+            compiled = job_description
+        else:
+            compiled = self.compile_job(job_description)
         
-        # Extract and compare skills
+        return self.match_from_components(
+            parsed_resume,
+            compiled,
+            self.semantic_similarity(parsed_resume, compiled),
+            self.skill_match_percentage(parsed_resume, compiled)
+        )
+    
+    def semantic_similarity(self, parsed_resume: Resume, compiled: CompiledJob) -> float:
+        """TF-IDF cosine similarity between a parsed resume and a compiled job"""
+        return self._calculate_semantic_similarity(self._resume_to_text(parsed_resume), compiled)
+    
+    def skill_match_percentage(self, parsed_resume: Resume, compiled: CompiledJob) -> float:
+        """Share of the job's required skills (or matched skills) the resume lists"""
         resume_skills = set(skill.name.lower() for skill in parsed_resume.skills)
-        required_skills = set(skill.lower() for skill in job_description.required_skills)
-        preferred_skills = set(skill.lower() for skill in job_description.preferred_skills)
-        all_jd_skills = required_skills | preferred_skills
+        required_skills = compiled.required_skills
+        matched_skills = resume_skills & compiled.all_skills
         
-        # Calculate skill matches
-        matched_skills = resume_skills & all_jd_skills
-        missing_skills = required_skills - resume_skills
-        extra_skills = resume_skills - all_jd_skills
-        
-        # Calculate skill match percentage
         if required_skills:
-            skill_match_pct = (len(matched_skills & required_skills) / len(required_skills)) * 100
-        else:
-            skill_match_pct = len(matched_skills) * 10 if matched_skills else 50
+            return (len(matched_skills & required_skills) / len(required_skills)) * 100
+        return min(100, len(matched_skills) * 10) if matched_skills else 50
+    
+    def match_from_components(
+        self,
+        parsed_resume: Resume,
+        compiled: CompiledJob,
+        semantic_similarity: float,
+        skill_match_pct: float
+    ) -> MatchResult:
+        """
+        MatchResult from precomputed semantic and skill components
+        
+        Args:
+            parsed_resume: Parsed resume data
+            compiled: Compiled job
+            semantic_similarity: From semantic_similarity
+            skill_match_pct: From skill_match_percentage
+        """
+        job_description = compiled.job
         
         # Check experience match
-        experience_match = self._check_experience_match(
+        experience_match = self.check_experience_match(
             parsed_resume.total_experience_years,
             job_description.min_experience_years,
             job_description.max_experience_years
         )
         
         # Check education match
-        education_match = self._check_education_match(
+        education_match = self.check_education_match(
             parsed_resume.education,
-            job_description.education_requirements
+            compiled.education_tokens
         )
         
-        # Calculate overall match score
-        match_score = self._calculate_match_score(
+        return self.build_match_result(
+            parsed_resume,
+            compiled,
             semantic_similarity,
             skill_match_pct,
             experience_match,
             education_match
         )
-        
-        return MatchResult(
-            match_score=round(match_score, 2),
-            skill_match_percentage=round(skill_match_pct, 2),
-            experience_match=experience_match,
-            education_match=education_match,
-            matched_skills=[s.title() for s in matched_skills],
-            missing_skills=[s.title() for s in missing_skills],
-            extra_skills=[s.title() for s in list(extra_skills)[:10]],
-            semantic_similarity=round(semantic_similarity, 4)
-        )
     
     def analyze_keyword_gaps(
         self,
-        resume_text: str,
-        job_description_text: str
+        resume_text: Union[str, ResumeDocument],
+        job_description_text: Union[str, CompiledJob]
     ) -> KeywordGap:
         """
         Analyze keyword gaps between resume and job description
         
         Args:
-            resume_text: Raw resume text
-            job_description_text: Raw job description text
+            resume_text: Raw resume text or its already tokenized document
+            job_description_text: Raw job description text or a compiled job
             
         Returns:
             KeywordGap analysis
         """
         # Extract important keywords from JD
-        jd_keywords = self._extract_keywords(job_description_text)
+        if isinstance(job_description_text, CompiledJob):
+            jd_keywords = job_description_text.keywords
+        else:
+            jd_keywords = self._extract_keywords(job_description_text)
         resume_keywords = self._extract_keywords(resume_text)
         
         # Find gaps
@@ -141,7 +235,7 @@ class MatcherService:
             optimization_level=optimization_level
         )
     
-    def _resume_to_text(self, parsed_resume: ParsedResume) -> str:
+    def _resume_to_text(self, parsed_resume: Resume) -> str:
         """Convert parsed resume to text representation"""
         parts = []
         
@@ -187,11 +281,18 @@ class MatcherService:
         ]
         return ' '.join(parts)
     
-    def _calculate_semantic_similarity(self, text1: str, text2: str) -> float:
+    def _calculate_semantic_similarity(self, resume_text: str, compiled: CompiledJob) -> float:
         """Calculate semantic similarity using TF-IDF"""
         try:
-            # Fit and transform both texts
-            tfidf_matrix = self.vectorizer.fit_transform([text1, text2])
+            if self.model is not None and compiled.vector is not None:
+                # Rows are L2-normalized, so the dot product is the cosine
+                resume_vector = self.model.transform([resume_text])
+                return float(resume_vector.multiply(compiled.vector).sum())
+            
+            # Without a fitted model, fit a throwaway vectorizer on the pair
+            tfidf_matrix = TfidfVectorizer(**VECTORIZER_PARAMS).fit_transform(
+                [resume_text, compiled.text]
+            )
             
             # Calculate cosine similarity
             similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
@@ -200,7 +301,7 @@ class MatcherService:
         except Exception:
             return 0.5  # Default similarity on error
     
-    def _check_experience_match(
+    def check_experience_match(
         self,
         candidate_years: float,
         min_years: float,
@@ -211,12 +312,12 @@ class MatcherService:
             return min_years <= candidate_years <= max_years
         return candidate_years >= min_years
     
-    def _check_education_match(
+    def check_education_match(
         self,
         education: List,
-        requirements: List[str]
+        requirements: Tuple[Tuple[str, ...], ...]
     ) -> bool:
-        """Check if candidate education matches requirements"""
+        """Check if candidate education matches tokenized requirements"""
         if not requirements:
             return True
         
@@ -224,15 +325,25 @@ class MatcherService:
             return False
         
         # Check if any education matches any requirement
-        education_texts = [
-            f"{edu.degree} {edu.field}".lower() 
-            for edu in education
-        ]
+        return self.education_texts_match(self.education_texts(education), requirements)
+    
+    @staticmethod
+    def education_texts(education: List) -> List[str]:
+        """Lowercased "degree field" text per education entry"""
+        return [f"{edu.degree} {edu.field}".lower() for edu in education]
+    
+    @staticmethod
+    def education_texts_match(
+        texts: List[str],
+        requirements: Tuple[Tuple[str, ...], ...]
+    ) -> bool:
+        """Check education texts against tokenized requirements"""
+        if not requirements:
+            return True
         
-        for req in requirements:
-            req_lower = req.lower()
-            for edu_text in education_texts:
-                if any(word in edu_text for word in req_lower.split()):
+        for req_words in requirements:
+            for edu_text in texts:
+                if any(word in edu_text for word in req_words):
                     return True
         
         return False
@@ -245,86 +356,376 @@ class MatcherService:
         education_match: bool
     ) -> float:
         """Calculate overall match score (0-100)"""
-        # Weighted scoring
-        semantic_score = semantic_similarity * 100 * 0.25  # 25% weight
-        skill_score = skill_match_pct * 0.40  # 40% weight
-        experience_score = 100 * 0.20 if experience_match else 30 * 0.20  # 20% weight
-        education_score = 100 * 0.15 if education_match else 50 * 0.15  # 15% weight
+        weights = self.MATCH_WEIGHTS
+        semantic_score = semantic_similarity * 100 * weights['semantic']
+        skill_score = skill_match_pct * weights['skills']
+        experience_score = 100 * weights['experience'] if experience_match \
+            else 30 * weights['experience']
+        education_score = 100 * weights['education'] if education_match \
+            else 50 * weights['education']
         
         total = semantic_score + skill_score + experience_score + education_score
         
         return min(100, max(0, total))
     
-    def _extract_keywords(self, text: str) -> Set[str]:
-        """Extract important keywords from text"""
-        # Clean text
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # Common stop words to exclude
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
-            'before', 'after', 'above', 'below', 'between', 'under', 'again',
-            'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why',
-            'how', 'all', 'each', 'few', 'more', 'most', 'other', 'some', 'such',
-            'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very',
-            's', 't', 'can', 'will', 'just', 'don', 'should', 'now', 'we', 'you',
-            'your', 'our', 'their', 'this', 'that', 'these', 'those', 'am', 'is',
-            'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
-            'having', 'do', 'does', 'did', 'doing', 'would', 'could', 'should',
-            'might', 'must', 'shall', 'what', 'which', 'who', 'whom', 'years',
-            'year', 'experience', 'work', 'working', 'job', 'position', 'role',
-            'team', 'company', 'looking', 'seeking', 'required', 'requirements'
-        }
+    @classmethod
+    def match_scores(
+        cls,
+        semantic_similarity: np.ndarray,
+        skill_match_pct: np.ndarray,
+        experience_match: np.ndarray,
+        education_match: np.ndarray,
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        Unrounded match scores for component arrays
         
-        # Extract words
-        words = text.split()
-        keywords = set()
+        Same order of operations as _calculate_match_score, so with the
+        default MATCH_WEIGHTS the results are identical.
         
-        for word in words:
-            word = word.strip()
-            if len(word) > 2 and word not in stop_words:
-                keywords.add(word)
+        Args:
+            semantic_similarity: Semantic similarity in [0, 1]
+            skill_match_pct: Skill match percentage
+            experience_match: Experience requirement met
+            education_match: Education requirement met
+            weights: Weights keyed like MATCH_WEIGHTS (default MATCH_WEIGHTS)
+        """
+        weights = weights or cls.MATCH_WEIGHTS
+        return np.clip(
+            semantic_similarity * 100 * weights['semantic']
+            + skill_match_pct * weights['skills']
+            + np.where(experience_match, 100 * weights['experience'], 30 * weights['experience'])
+            + np.where(education_match, 100 * weights['education'], 50 * weights['education']),
+            0, 100
+        )
+    
+    def _extract_keywords(self, text: Union[str, ResumeDocument]) -> Set[str]:
+        """Extract important keywords from text or a prepared document"""
+        if isinstance(text, ResumeDocument):
+            words = text.words
+        else:
+            words = TOKEN_PATTERN.findall(text.lower())
         
-        return keywords
+        return {
+            word for word in words
+            if len(word) > 2 and word not in self.STOP_WORDS
+        }
     
     def rank_candidates(
         self,
         candidates: List[Dict],
-        job_description: JobDescription
+        job_description: Union[JobDescription, CompiledJob],
+        top_k: Optional[int] = None,
+        offset: int = 0
     ) -> List[Dict]:
         """
-        Rank multiple candidates for a job
+        Rank multiple candidates for a job in one vectorized pass
+        
+        All resumes are transformed into one sparse matrix and scored
+        against the JD vector with a single product; skill coverage comes
+        from a sparse candidate x JD-skill matrix. Only the requested page
+        is sorted and turned into MatchResult objects.
         
         Args:
-            candidates: List of candidate data with parsed resumes
+            candidates: List of candidate data with parsed resumes and,
+                optionally, a precomputed 'resume_vector' row
             job_description: Job to rank against
+            top_k: Number of ranked candidates to return (all if None)
+            offset: Number of top candidates to skip before the page
             
         Returns:
-            Sorted list of candidates with rankings
+            The page of candidates, best first, with match_result,
+            ranking_score and a global rank
         """
-        ranked = []
+        if not isinstance(job_description, CompiledJob):
+            job_description = self.compile_job(job_description)
+        job = job_description
+        
+        candidates = [c for c in candidates if c.get('parsed_resume')]
+        if not candidates:
+            return []
+        resumes = [c['parsed_resume'] for c in candidates]
+        vectors = [c.get('resume_vector') for c in candidates]
         
-        for candidate in candidates:
-            parsed_resume = candidate.get('parsed_resume')
-            if parsed_resume:
-                match_result = self.match_resume_to_job(parsed_resume, job_description)
-                ranked.append({
-                    **candidate,
-                    'match_result': match_result,
-                    'ranking_score': match_result.match_score
-                })
+        components = self.batch_components(resumes, job, vectors)
+        scores = np.round(components['match_score'], 2)
         
-        # Sort by ranking score
-        ranked.sort(key=lambda x: x['ranking_score'], reverse=True)
+        page_end = len(candidates) if top_k is None else min(len(candidates), offset + top_k)
+        order = self.top_indices(scores, page_end)[offset:page_end]
         
-        # Add rank positions
-        for i, candidate in enumerate(ranked):
-            candidate['rank'] = i + 1
+        ranked = []
+        for position, index in enumerate(order):
+            match_result = self.build_match_result(
+                resumes[index],
+                job,
+                float(components['semantic_similarity'][index]),
+                float(components['skill_match_pct'][index]),
+                bool(components['experience_match'][index]),
+                bool(components['education_match'][index])
+            )
+            ranked.append({
+                **candidates[index],
+                'match_result': match_result,
+                'ranking_score': match_result.match_score,
+                'rank': offset + position + 1
+            })
         
         return ranked
+    
+    def resume_vectors(self, resumes: List[Resume]) -> Optional[sparse.csr_matrix]:
+        """
+        TF-IDF rows for resumes, independent of any job
+        
+        Returns:
+            One L2-normalized row per resume, or None without a corpus model
+        """
+        if self.model is None:
+            return None
+        return self.model.transform([self._resume_to_text(resume) for resume in resumes])
+    
+    def batch_components(
+        self,
+        resumes: List[Resume],
+        job: CompiledJob,
+        vectors: Optional[List[Optional[sparse.csr_matrix]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute every match component for a batch of resumes against one job
+        
+        Args:
+            resumes: Parsed resumes
+            job: Compiled job
+            vectors: Optional precomputed resume TF-IDF rows
+            
+        Returns:
+            Component arrays of length len(resumes), keyed like match_matrix
+        """
+        components = self.match_matrix(resumes, [job], vectors)
+        return {name: values[:, 0] for name, values in components.items()}
+    
+    def match_matrix(
+        self,
+        resumes: List[Resume],
+        jobs: List[CompiledJob],
+        vectors: Optional[List[Optional[sparse.csr_matrix]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute every match component for resumes x jobs
+        
+        Semantic similarity is one sparse product of the resume and JD
+        matrices and skill coverage one product of boolean incidence
+        matrices, so each resume and each JD is vectorized exactly once.
+        Without a corpus model every pair is fitted on its own, exactly as
+        match_resume_to_job does, so scores never depend on what else is
+        in the batch (slower, but rankings agree with single matches).
+        
+        Args:
+            resumes: Parsed resumes (rows)
+            jobs: Compiled jobs (columns)
+            vectors: Optional precomputed resume TF-IDF rows
+            
+        Returns:
+            Component arrays of shape (len(resumes), len(jobs))
+        """
+        n, m = len(resumes), len(jobs)
+        
+        # Semantic similarity: one sparse product against the JD matrix
+        if self.model is not None and all(job.vector is not None for job in jobs):
+            vectors = list(vectors) if vectors else [None] * n
+            missing = [i for i, vector in enumerate(vectors) if vector is None]
+            if len(missing) == n:
+                matrix = self.resume_vectors(resumes)
+            else:
+                if missing:
+                    computed = self.resume_vectors([resumes[i] for i in missing])
+                    for row, i in enumerate(missing):
+                        vectors[i] = computed[row]
+                matrix = self.stack_rows(vectors, self.model.n_features)
+            jd_matrix = sparse.vstack([job.vector for job in jobs], format='csr')
+            semantic = np.clip((matrix @ jd_matrix.T).toarray(), 0.0, 1.0)
+        else:
+            # No corpus model: the scalar path's per-pair fit, so each score
+            # is independent of the batch, chunk or window it is computed in
+            texts = [self._resume_to_text(resume) for resume in resumes]
+            semantic = np.array([
+                [self._calculate_semantic_similarity(text, job) for job in jobs]
+                for text in texts
+            ], dtype=np.float64).reshape(n, m)
+        
+        # Skill coverage: resume x skill and skill x job incidence matrices
+        skill_index: Dict[str, int] = {}
+        for job in jobs:
+            for skill in sorted(job.all_skills):
+                skill_index.setdefault(skill, len(skill_index))
+        n_skills = max(1, len(skill_index))
+        rows, cols = [], []
+        for row, resume in enumerate(resumes):
+            seen = set()
+            for skill in resume.skills:
+                col = skill_index.get(skill.name.lower())
+                if col is not None and col not in seen:
+                    seen.add(col)
+                    rows.append(row)
+                    cols.append(col)
+        incidence = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(n, n_skills)
+        )
+        all_mask = np.zeros((n_skills, m))
+        required_mask = np.zeros((n_skills, m))
+        for col, job in enumerate(jobs):
+            for skill in job.all_skills:
+                all_mask[skill_index[skill], col] = 1.0
+            for skill in job.required_skills:
+                required_mask[skill_index[skill], col] = 1.0
+        matched_all = np.asarray(incidence @ all_mask)
+        matched_required = np.asarray(incidence @ required_mask)
+        n_required = np.array([len(job.required_skills) for job in jobs], dtype=np.float64)
+        skill_match_pct = np.where(
+            n_required > 0,
+            matched_required / np.maximum(n_required, 1) * 100,
+            np.where(matched_all > 0, np.minimum(100, matched_all * 10), 50)
+        )
+        
+        # Experience and education
+        years = np.fromiter((r.total_experience_years for r in resumes), dtype=np.float64, count=n)
+        min_years = np.array([job.job.min_experience_years for job in jobs], dtype=np.float64)
+        max_years = np.array([job.job.max_experience_years or 0 for job in jobs], dtype=np.float64)
+        experience_match = (years[:, None] >= min_years) & (
+            (max_years == 0) | (years[:, None] <= max_years)
+        )
+        # Jobs often share education requirements; check each set once
+        education_keys: Dict[Tuple[Tuple[str, ...], ...], int] = {}
+        job_keys = np.array([
+            education_keys.setdefault(job.education_tokens, len(education_keys)) for job in jobs
+        ], dtype=np.int64)
+        by_key = np.array([
+            [self.check_education_match(r.education, tokens) for tokens in education_keys]
+            for r in resumes
+        ], dtype=bool).reshape(n, len(education_keys))
+        education_match = by_key[:, job_keys]
+        
+        return {
+            'semantic_similarity': semantic,
+            'skill_match_pct': skill_match_pct,
+            'experience_match': experience_match,
+            'education_match': education_match,
+            'match_score': self.match_scores(
+                semantic, skill_match_pct, experience_match, education_match
+            ),
+        }
+    
+    def score_matrix(
+        self,
+        resumes: List[Resume],
+        jobs: List[CompiledJob],
+        vectors: Optional[List[Optional[sparse.csr_matrix]]] = None,
+        block_size: int = 1024
+    ) -> np.ndarray:
+        """
+        Rounded match scores for resumes x jobs
+        
+        Resumes are scored in row blocks so intermediate component arrays
+        stay bounded for large N x M.
+        
+        Returns:
+            Array of shape (len(resumes), len(jobs))
+        """
+        if self.model is None:
+            # The fallback IDF is fitted per call, so blocks would disagree
+            block_size = max(1, len(resumes))
+        scores = np.empty((len(resumes), len(jobs)))
+        for start in range(0, len(resumes), block_size):
+            end = start + block_size
+            components = self.match_matrix(
+                resumes[start:end], jobs, vectors[start:end] if vectors else None
+            )
+            scores[start:end] = np.round(components['match_score'], 2)
+        return scores
+    
+    @staticmethod
+    def stack_rows(rows: List[sparse.csr_matrix], n_features: int) -> sparse.csr_matrix:
+        """
+        Stack single-row CSR matrices by concatenating their buffers
+        
+        Args:
+            rows: Resume vectors, e.g. as returned by worker processes
+            n_features: Width of the model the rows came from
+            
+        Returns:
+            CSR matrix with one row per input row
+        """
+        lengths = np.fromiter((row.nnz for row in rows), dtype=np.int64, count=len(rows))
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        data = np.concatenate([row.data for row in rows]) if rows else np.empty(0)
+        indices = np.concatenate([row.indices for row in rows]) if rows else np.empty(0, dtype=np.int32)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), n_features))
+    
+    @staticmethod
+    def top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Indices of the k best scores, best first, ties in input order
+        
+        argpartition selects the top k in linear time; only those (plus any
+        ties at the cut-off) are sorted.
+        """
+        n = len(scores)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        if k < n:
+            threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+            selected = np.flatnonzero(scores >= threshold)
+        else:
+            selected = np.arange(n)
+        order = np.lexsort((selected, -scores[selected]))
+        return selected[order][:k]
+    
+    def build_match_result(
+        self,
+        parsed_resume: Resume,
+        job: CompiledJob,
+        semantic_similarity: float,
+        skill_match_pct: float,
+        experience_match: bool,
+        education_match: bool
+    ) -> MatchResult:
+        """
+        Assemble a MatchResult from precomputed components
+        
+        Args:
+            parsed_resume: Resume the components were computed for
+            job: Compiled job
+            semantic_similarity: Cosine similarity of the resume and JD vectors
+            skill_match_pct: Skill coverage percentage
+            experience_match: Whether experience is in the job's range
+            education_match: Whether an education requirement is met
+            
+        Returns:
+            The same MatchResult match_resume_to_job would return
+        """
+        resume_skills = set(skill.name.lower() for skill in parsed_resume.skills)
+        matched_skills = resume_skills & job.all_skills
+        missing_skills = job.required_skills - resume_skills
+        extra_skills = resume_skills - job.all_skills
+        
+        match_score = self._calculate_match_score(
+            semantic_similarity,
+            skill_match_pct,
+            experience_match,
+            education_match
+        )
+        
+        return MatchResult(
+            match_score=round(match_score, 2),
+            skill_match_percentage=round(skill_match_pct, 2),
+            experience_match=experience_match,
+            education_match=education_match,
+            matched_skills=[s.title() for s in matched_skills],
+            missing_skills=[s.title() for s in missing_skills],
+            extra_skills=[s.title() for s in list(extra_skills)[:10]],
+            semantic_similarity=round(semantic_similarity, 4)
+        )
 
 
 # Singleton instance
-matcher_service = MatcherService()
+matcher_service = MatcherService(model=TfidfModel.load_if_exists(settings.TFIDF_MODEL_PATH))
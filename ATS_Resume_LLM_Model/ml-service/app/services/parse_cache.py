@@ -0,0 +1,91 @@
+"""
+Parse Cache Service
+Content-addressed LRU cache of parsed resumes bounded by entry count and size
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.models.schemas import ParsedResume
+
+
+CacheKey = Tuple[str, bool]
+
+
+class ParseCache:
+    """
+    LRU cache of ParsedResume results keyed on content hash and anonymize flag
+
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        """
+        Initialize an empty cache
+
+        Args:
+            max_entries: Maximum number of cached resumes
+            max_bytes: Maximum total serialized size of cached resumes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Tuple[ParsedResume, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, content_hash: str, anonymize: bool) -> Optional[ParsedResume]:
+        """Return a cached result and mark it most recently used"""
+        key = (content_hash, anonymize)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, content_hash: str, anonymize: bool, parsed: ParsedResume) -> None:
+        """Store a result, evicting least recently used entries as needed"""
+        if self.max_entries <= 0:
+            return
+        size = len(parsed.model_dump_json())
+        if size > self.max_bytes:
+            return
+
+        key = (content_hash, anonymize)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (parsed, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries; counters are kept"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss/eviction counters and current occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
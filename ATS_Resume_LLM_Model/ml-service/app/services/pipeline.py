@@ -0,0 +1,242 @@
+"""
+Analysis Pipeline Service
+Resolves the stages an endpoint needs and computes each shared intermediate once per request
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from app.config import settings
+from app.models.schemas import ATSScore, JobDescription, KeywordGap, MatchResult, ParsedResume, Suggestion
+from app.services.delta_scorer import DeltaScorer, EditState, delta_scorer
+from app.services.document import ResumeDocument
+from app.services.matcher import CompiledJob, MatcherService, matcher_service
+from app.services.resume_parser import ResumeParserService, resume_parser
+from app.services.scorer import ScorerService, scorer_service
+from app.services.suggestions import SuggestionsService, suggestions_service
+
+
+# Values a request supplies rather than a stage computes
+PIPELINE_INPUTS = ("resume_text", "anonymize", "resume_fields", "job_description")
+
+
+class Stage(NamedTuple):
+    """One node of the pipeline: the value it produces and what it reads"""
+    name: str
+    inputs: Tuple[str, ...]
+    func: Callable[..., Any]
+
+
+class AnalysisPipeline:
+    """
+    Dependency graph of the analysis stages behind the resume endpoints
+
+    Stages:
+        document             resume_text -> ResumeDocument (tokenized once)
+        parsed_resume        parse (only resume_fields, plus what later stages read)
+        job                  JD prep: compile the job once (None without one)
+        semantic_similarity  TF-IDF cosine of resume and job
+        skill_match_pct      required skill coverage
+        match_result         match score from the two above
+        keyword_gaps         JD keywords missing from the resume tokens
+        ats_score            ATS score (sees the match result with a job)
+        edit_state           delta scorer state shared by suggest stages
+        suggestions          suggestions with estimated gains
+        rewrite              rewritten sections with the estimated gain
+
+    run() computes only the stages the requested outputs depend on, each
+    exactly once, so no endpoint re-parses or re-tokenizes. With threads,
+    stages whose inputs are ready run concurrently on a shared pool.
+    """
+
+    def __init__(
+        self,
+        parser: ResumeParserService = resume_parser,
+        matcher: MatcherService = matcher_service,
+        scorer: ScorerService = scorer_service,
+        suggestions: SuggestionsService = suggestions_service,
+        delta: DeltaScorer = delta_scorer,
+        threads: int = 0
+    ):
+        """
+        Args:
+            parser: Resume parser
+            matcher: Matcher for the job, semantic, skill and keyword stages
+            scorer: ATS scorer
+            suggestions: Suggestion generator
+            delta: Delta scorer whose state the suggest stages share
+            threads: Threads for running independent stages concurrently
+                (0 runs them in order on the calling thread)
+        """
+        self.parser = parser
+        self.matcher = matcher
+        self.scorer = scorer
+        self.suggestions = suggestions
+        self.delta = delta
+        self.threads = threads
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.stages: Dict[str, Stage] = {stage.name: stage for stage in (
+            Stage("document", ("resume_text",), ResumeDocument),
+            Stage("parsed_resume", ("document", "anonymize", "resume_fields"), self._parse),
+            Stage("job", ("job_description",), self._prepare_job),
+            Stage("semantic_similarity", ("parsed_resume", "job"), self._semantic),
+            Stage("skill_match_pct", ("parsed_resume", "job"), self._skills),
+            Stage("match_result", ("parsed_resume", "job", "semantic_similarity", "skill_match_pct"),
+                  self._match),
+            Stage("keyword_gaps", ("document", "job"), self._keywords),
+            Stage("ats_score", ("parsed_resume", "job", "match_result"), self._score),
+            Stage("edit_state", ("parsed_resume", "job"), self.delta.prepare),
+            Stage("suggestions", ("parsed_resume", "job", "keyword_gaps", "match_result", "edit_state"),
+                  self._suggest),
+            Stage("rewrite", ("parsed_resume", "keyword_gaps", "edit_state"),
+                  self.suggestions.generate_rewrite_suggestions),
+        )}
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="pipeline")
+        return self._pool
+
+    def _parse(self, doc: ResumeDocument, anonymize: bool, fields: Optional[Sequence[str]]) -> ParsedResume:
+        return self.parser.parse_document(doc, anonymize=anonymize, fields=fields)
+
+    def _prepare_job(self, job: Optional[Union[JobDescription, CompiledJob]]) -> Optional[CompiledJob]:
+        if isinstance(job, JobDescription):
+            return self.matcher.compile_job(job)
+        return job
+
+    def _semantic(self, parsed: ParsedResume, job: Optional[CompiledJob]) -> Optional[float]:
+        return self.matcher.semantic_similarity(parsed, job) if job is not None else None
+
+    def _skills(self, parsed: ParsedResume, job: Optional[CompiledJob]) -> Optional[float]:
+        return self.matcher.skill_match_percentage(parsed, job) if job is not None else None
+
+    def _match(
+        self,
+        parsed: ParsedResume,
+        job: Optional[CompiledJob],
+        semantic: Optional[float],
+        skill_match_pct: Optional[float]
+    ) -> Optional[MatchResult]:
+        if job is None:
+            return None
+        return self.matcher.match_from_components(parsed, job, semantic, skill_match_pct)
+
+    def _keywords(self, doc: ResumeDocument, job: Optional[CompiledJob]) -> KeywordGap:
+        return self.matcher.analyze_keyword_gaps(doc, job if job is not None else "")
+
+    def _score(
+        self,
+        parsed: ParsedResume,
+        job: Optional[CompiledJob],
+        match_result: Optional[MatchResult]
+    ) -> ATSScore:
+        return self.scorer.calculate_ats_score(parsed, job.job if job else None, match_result)
+
+    def _suggest(
+        self,
+        parsed: ParsedResume,
+        job: Optional[CompiledJob],
+        keyword_gaps: KeywordGap,
+        match_result: Optional[MatchResult],
+        state: EditState
+    ) -> List[Suggestion]:
+        return self.suggestions.generate_suggestions(
+            parsed, job.job if job else None, keyword_gaps, match_result, state
+        )
+
+    def plan(self, outputs: Sequence[str]) -> List[Stage]:
+        """
+        Stages needed for outputs, each after the stages it reads
+
+        Raises:
+            ValueError: If an output is not a stage or input
+        """
+        order: List[Stage] = []
+        seen = set(PIPELINE_INPUTS)
+
+        def visit(name: str) -> None:
+            if name in seen:
+                return
+            stage = self.stages.get(name)
+            if stage is None:
+                raise ValueError(f"Unknown pipeline output: {name}")
+            seen.add(name)
+            for dependency in stage.inputs:
+                visit(dependency)
+            order.append(stage)
+
+        for name in outputs:
+            visit(name)
+        return order
+
+    def run(
+        self,
+        outputs: Sequence[str],
+        resume_text: str,
+        job_description: Optional[Union[JobDescription, CompiledJob]] = None,
+        anonymize: bool = True,
+        resume_fields: Optional[Sequence[str]] = None,
+        timings: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute the requested outputs for one request
+
+        Args:
+            outputs: Stage names wanted
+            resume_text: Raw resume text
+            job_description: Job to analyze against, inline or compiled
+            anonymize: Whether parsing anonymizes personal information
+            resume_fields: ParsedResume fields the caller needs (all if
+                None); fields that later stages read are added
+            timings: If given, filled with milliseconds per stage run
+
+        Returns:
+            Every value computed (inputs and intermediates included), by name
+        """
+        stages = self.plan(outputs)
+        if resume_fields is not None and any(
+            "parsed_resume" in stage.inputs for stage in stages
+        ):
+            resume_fields = sorted(set(resume_fields) | set(self.matcher.RESUME_FIELDS)
+                                   | set(self.scorer.RESUME_FIELDS))
+        values: Dict[str, Any] = {
+            "resume_text": resume_text,
+            "anonymize": anonymize,
+            "resume_fields": resume_fields,
+            "job_description": job_description,
+        }
+        if self.threads <= 0 or len(stages) <= 1:
+            for stage in stages:
+                values[stage.name] = self._call(stage, values, timings)
+            return values
+
+        pool = self._get_pool()
+        pending = list(stages)
+        running: Dict[Future, Stage] = {}
+        while pending or running:
+            for stage in [s for s in pending if all(name in values for name in s.inputs)]:
+                pending.remove(stage)
+                running[pool.submit(self._call, stage, values, timings)] = stage
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                values[running.pop(future).name] = future.result()
+        return values
+
+    @staticmethod
+    def _call(stage: Stage, values: Dict[str, Any], timings: Optional[Dict[str, float]]) -> Any:
+        start = time.perf_counter()
+        result = stage.func(*(values[name] for name in stage.inputs))
+        if timings is not None:
+            timings[stage.name] = round((time.perf_counter() - start) * 1000, 3)
+        return result
+
+    def shutdown(self) -> None:
+        """Stop stage threads"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+analysis_pipeline = AnalysisPipeline(threads=settings.PIPELINE_THREADS)
@@ -4,11 +4,15 @@ Extracts structured information from resume text using NLP techniques
 """
 
 import re
-import uuid
-from typing import List, Dict, Optional, Tuple
-from app.models.schemas import (
-    ParsedResume, Skill, Education, Experience, Certification
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from app.models.records import (
+    CertificationRecord, EducationRecord, ExperienceRecord, ResumeRecord, SkillRecord
 )
+from app.models.schemas import ParsedResume
+from app.config import settings
+from app.services.document import ResumeDocument
+from app.services.parse_cache import ParseCache
+from app.services.skill_matcher import SkillHit, SkillMatcher
 
 
 class ResumeParserService:
@@ -64,61 +68,208 @@ class ResumeParserService:
         "mathematics": ["mathematics", "math", "statistics", "applied math"]
     }
     
-    def __init__(self):
+    # Extractors whose output assemble() combines, named after _extract_<field>
+    EXTRACTORS = (
+        "name", "email", "phone", "location", "skills", "education",
+        "experience", "certifications", "summary"
+    )
+    
+    # Extractors each ParsedResume field is derived from
+    FIELD_EXTRACTORS = {
+        "candidate_id": (),
+        "anonymized_name": ("name",),
+        "skills": ("skills",),
+        "education": ("education",),
+        "experience": ("experience",),
+        "certifications": ("certifications",),
+        "total_experience_years": ("experience",),
+        "primary_role": ("experience", "skills"),
+        "summary": ("summary",),
+        "original_name": ("name",),
+        "email": ("email",),
+        "phone": ("phone",),
+        "location": ("location",),
+    }
+    
+    # Fields filled from personal information only when not anonymizing
+    PERSONAL_FIELDS = frozenset({"anonymized_name", "original_name", "email", "phone", "location"})
+    
+    def __init__(self, cache: Optional[ParseCache] = None):
         """Initialize the resume parser"""
-        self.candidate_counter = 0
+        self.cache = cache
+        # Compiled once; soft skills never override a technical entry
+        self.skill_matcher = SkillMatcher({
+            **{skill: "soft" for skill in self.SOFT_SKILLS},
+            **{skill: "technical" for skill in self.TECHNICAL_SKILLS},
+        })
     
-    def parse_resume(self, resume_text: str, anonymize: bool = True) -> ParsedResume:
+    def parse_resume(
+        self,
+        resume_text: str,
+        anonymize: bool = True,
+        fields: Optional[Iterable[str]] = None
+    ) -> ParsedResume:
         """
         Parse resume text and extract structured information
         
         Args:
             resume_text: Raw resume text
             anonymize: Whether to anonymize personal information
+            fields: ParsedResume fields to fill (all if None)
             
         Returns:
             ParsedResume object with extracted data
         """
-        # Generate candidate ID
-        candidate_id = f"CAND-{uuid.uuid4().hex[:8].upper()}"
-        self.candidate_counter += 1
-        
-        # Extract all components
-        name = self._extract_name(resume_text)
-        email = self._extract_email(resume_text)
-        phone = self._extract_phone(resume_text)
-        location = self._extract_location(resume_text)
-        
-        skills = self._extract_skills(resume_text)
-        education = self._extract_education(resume_text)
-        experience = self._extract_experience(resume_text)
-        certifications = self._extract_certifications(resume_text)
-        
-        total_experience = self._calculate_total_experience(experience)
-        primary_role = self._determine_primary_role(experience, skills)
-        summary = self._extract_summary(resume_text)
-        
-        return ParsedResume(
-            candidate_id=candidate_id,
-            anonymized_name=f"Candidate {chr(65 + (self.candidate_counter % 26))}" if anonymize else name,
-            skills=skills,
-            education=education,
-            experience=experience,
-            certifications=certifications,
-            total_experience_years=total_experience,
-            primary_role=primary_role,
-            summary=summary,
+        return self.parse_document(ResumeDocument(resume_text), anonymize=anonymize, fields=fields)
+    
+    def parse_document(
+        self,
+        doc: ResumeDocument,
+        anonymize: bool = True,
+        fields: Optional[Iterable[str]] = None
+    ) -> ParsedResume:
+        """
+        Parse an already normalized resume document
+        
+        Args:
+            doc: Resume document shared with the other services
+            anonymize: Whether to anonymize personal information
+            fields: ParsedResume fields to fill (all if None); only their
+                extractors run and the other fields keep their defaults
+            
+        Returns:
+            ParsedResume object with extracted data
+        
+        Raises:
+            ValueError: If fields names something that is not a ParsedResume field
+        """
+        if self.cache is not None:
+            cached = self.cache.get(doc.content_hash, anonymize)
+            if cached is not None:
+                return cached
+        
+        if fields is not None:
+            return self.assemble(doc, anonymize, self.extract(doc, self.extractors_for(fields, anonymize)))
+        
+        parsed = self._parse(doc, anonymize)
+        if self.cache is not None:
+            self.cache.put(doc.content_hash, anonymize, parsed)
+        return parsed
+    
+    def parse_record(
+        self,
+        resume_text: str,
+        anonymize: bool = True,
+        fields: Optional[Iterable[str]] = None
+    ) -> ResumeRecord:
+        """
+        Parse resume text into a compact ResumeRecord
+        
+        For batch and ranking paths that match and score many resumes and
+        serialize few: nothing is validated until to_model(). Bypasses the
+        parse cache, which holds ParsedResume results.
+        
+        Args:
+            resume_text: Raw resume text
+            anonymize: Whether to anonymize personal information
+            fields: ParsedResume fields to fill (all if None)
+        
+        Raises:
+            ValueError: If fields names something that is not a ParsedResume field
+        """
+        doc = ResumeDocument(resume_text)
+        extractors = self.extractors_for(self.FIELD_EXTRACTORS if fields is None else fields, anonymize)
+        return self.assemble_record(doc, anonymize, self.extract(doc, extractors))
+    
+    def _parse(self, doc: ResumeDocument, anonymize: bool) -> ParsedResume:
+        """Run every extractor the full ParsedResume needs over a document"""
+        return self.assemble(
+            doc, anonymize, self.extract(doc, self.extractors_for(self.FIELD_EXTRACTORS, anonymize))
+        )
+    
+    def extractors_for(self, fields: Iterable[str], anonymize: bool = True) -> List[str]:
+        """
+        Extractors the given ParsedResume fields depend on, in EXTRACTORS order
+        
+        Personal fields need no extractor when anonymizing (they stay empty);
+        otherwise the name always runs, since anonymized_name is required.
+        
+        Raises:
+            ValueError: If a field is not a ParsedResume field
+        """
+        needed = set() if anonymize else {"name"}
+        for field in fields:
+            if field not in self.FIELD_EXTRACTORS:
+                raise ValueError(f"Unknown resume field: {field}")
+            if not (anonymize and field in self.PERSONAL_FIELDS):
+                needed.update(self.FIELD_EXTRACTORS[field])
+        return [extractor for extractor in self.EXTRACTORS if extractor in needed]
+    
+    def extract(self, doc: ResumeDocument, fields: Iterable[str]) -> Dict[str, Any]:
+        """
+        Run some of the extractors over a document
+        
+        Args:
+            doc: Resume document
+            fields: Names from EXTRACTORS
+            
+        Returns:
+            Extracted value per field
+        """
+        return {field: getattr(self, f"_extract_{field}")(doc) for field in fields}
+    
+    def assemble(self, doc: ResumeDocument, anonymize: bool, extracted: Dict[str, Any]) -> ParsedResume:
+        """Build a ParsedResume from extractor output, see assemble_record"""
+        return self.assemble_record(doc, anonymize, extracted).to_model()
+    
+    def assemble_record(self, doc: ResumeDocument, anonymize: bool, extracted: Dict[str, Any]) -> ResumeRecord:
+        """
+        Build a ResumeRecord from extractor output
+        
+        Fields whose extractors are missing from extracted keep their defaults.
+        
+        Args:
+            doc: Document the values were extracted from
+            anonymize: Whether to anonymize personal information
+            extracted: Value per extractor that ran
+        """
+        # Candidate ID and alias derive from content, so re-parsing the same
+        # resume always yields the same identity
+        candidate_id = f"CAND-{doc.content_hash[:8].upper()}"
+        alias = chr(65 + int(doc.content_hash[:8], 16) % 26)
+        
+        name = extracted.get("name")
+        values = {
+            "candidate_id": candidate_id,
+            "anonymized_name": f"Candidate {alias}" if anonymize else name,
+        }
+        for field in ("skills", "education", "experience", "certifications"):
+            if field in extracted:
+                values[field] = extracted[field]
+        
+        if "experience" in extracted:
+            values["total_experience_years"] = self._calculate_total_experience(extracted["experience"])
+            if "skills" in extracted:
+                values["primary_role"] = self._determine_primary_role(
+                    extracted["experience"], extracted["skills"]
+                )
+        if "summary" in extracted:
+            values["summary"] = extracted["summary"]
+        
+        values.update(
             original_name=name if not anonymize else None,
-            email=email if not anonymize else None,
-            phone=phone if not anonymize else None,
-            location=location if not anonymize else None
+            email=extracted.get("email") if not anonymize else None,
+            phone=extracted.get("phone") if not anonymize else None,
+            location=extracted.get("location") if not anonymize else None
         )
+        return ResumeRecord(**values)
     
-    def _extract_name(self, text: str) -> str:
+    def _extract_name(self, doc: ResumeDocument) -> str:
         """Extract candidate name from resume"""
-        lines = text.strip().split('\n')
-        # Usually the name is in the first few lines
-        for line in lines[:5]:
+        # Usually the name is in the first few non-blank lines
+        lines = doc.lines
+        first = next((i for i, line in enumerate(lines) if line.strip()), len(lines))
+        for line in lines[first:first + 5]:
             line = line.strip()
             # Skip empty lines and lines that look like headers
             if line and len(line) < 50 and not any(word in line.lower() for word in 
@@ -128,25 +279,25 @@ class ResumeParserService:
                     return line.title()
         return "Unknown Candidate"
     
-    def _extract_email(self, text: str) -> Optional[str]:
+    def _extract_email(self, doc: ResumeDocument) -> Optional[str]:
         """Extract email address from resume"""
         email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        match = re.search(email_pattern, text)
+        match = re.search(email_pattern, doc.text)
         return match.group(0) if match else None
     
-    def _extract_phone(self, text: str) -> Optional[str]:
+    def _extract_phone(self, doc: ResumeDocument) -> Optional[str]:
         """Extract phone number from resume"""
         phone_patterns = [
             r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
             r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
         ]
         for pattern in phone_patterns:
-            match = re.search(pattern, text)
+            match = re.search(pattern, doc.text)
             if match:
                 return match.group(0)
         return None
     
-    def _extract_location(self, text: str) -> Optional[str]:
+    def _extract_location(self, doc: ResumeDocument) -> Optional[str]:
         """Extract location from resume"""
         # Look for common location patterns
         location_patterns = [
@@ -155,73 +306,74 @@ class ResumeParserService:
             r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Za-z]+)'  # City, Country
         ]
         for pattern in location_patterns:
-            match = re.search(pattern, text)
+            match = re.search(pattern, doc.text)
             if match:
                 return match.group(1).strip()
         return None
     
-    def _extract_skills(self, text: str) -> List[Skill]:
+    def _extract_skills(self, doc: ResumeDocument) -> List[SkillRecord]:
         """Extract skills from resume text"""
-        text_lower = text.lower()
+        text_lower = doc.lower
+        hits = self.skill_matcher.find_all(text_lower)
+        if not hits:
+            return []
+        
+        # Proficiency indicators are located once and shared by all hits
+        indicators = self.skill_matcher.find_indicators(text_lower)
+        return self.skills_from_hits(hits, indicators, len(text_lower))
+    
+    def skills_from_hits(
+        self,
+        hits: List[SkillHit],
+        indicators: List[Tuple[int, int, str]],
+        text_length: int
+    ) -> List[SkillRecord]:
+        """
+        Skills for the hits and indicators the skill matcher found in a text
+        
+        Args:
+            hits: SkillMatcher.find_all output
+            indicators: SkillMatcher.find_indicators output
+            text_length: Length of the scanned lowercased text
+        """
         skills = []
         found_skills = set()
         
-        # Extract technical skills
-        for skill in self.TECHNICAL_SKILLS:
-            if skill in text_lower and skill not in found_skills:
-                found_skills.add(skill)
-                proficiency = self._estimate_proficiency(text_lower, skill)
-                skills.append(Skill(
-                    name=skill.title() if len(skill) > 3 else skill.upper(),
+        for hit in hits:
+            if hit.skill in found_skills:
+                continue
+            found_skills.add(hit.skill)
+            if hit.category == "technical":
+                skills.append(SkillRecord.named(
+                    hit.skill.title() if len(hit.skill) > 3 else hit.skill.upper(),
                     category="technical",
-                    proficiency=proficiency
+                    proficiency=self.skill_matcher.estimate_proficiency(
+                        hit, indicators, text_length
+                    )
                 ))
-        
-        # Extract soft skills
-        for skill in self.SOFT_SKILLS:
-            if skill in text_lower and skill not in found_skills:
-                found_skills.add(skill)
-                skills.append(Skill(
-                    name=skill.title(),
+            else:
+                skills.append(SkillRecord.named(
+                    hit.skill.title(),
                     category="soft",
                     proficiency="intermediate"
                 ))
         
         return skills
     
-    def _estimate_proficiency(self, text: str, skill: str) -> str:
-        """Estimate skill proficiency based on context"""
-        # Look for proficiency indicators near the skill mention
-        context_window = 100
-        skill_pos = text.find(skill)
-        if skill_pos == -1:
-            return "intermediate"
-        
-        start = max(0, skill_pos - context_window)
-        end = min(len(text), skill_pos + len(skill) + context_window)
-        context = text[start:end]
-        
-        if any(word in context for word in ['expert', 'advanced', 'senior', '5+ years', 'lead']):
-            return "expert"
-        elif any(word in context for word in ['proficient', '3+ years', 'experienced']):
-            return "advanced"
-        elif any(word in context for word in ['familiar', 'basic', 'beginner', 'learning']):
-            return "beginner"
-        return "intermediate"
-    
-    def _extract_education(self, text: str) -> List[Education]:
+    def _extract_education(self, doc: ResumeDocument) -> List[EducationRecord]:
         """Extract education history from resume"""
         education_list = []
-        text_lower = text.lower()
         
         # Find education section
-        education_section = self._find_section(text, ['education', 'academic', 'qualification'])
-        if not education_section:
-            education_section = text
+        education_section = self._find_section(doc, 'education')
+        if education_section:
+            section_lower = education_section.lower()
+        else:
+            education_section, section_lower = doc.text, doc.lower
         
         # Extract degree information
         for degree_pattern in self.DEGREE_PATTERNS:
-            matches = re.finditer(degree_pattern, education_section.lower())
+            matches = re.finditer(degree_pattern, section_lower)
             for match in matches:
                 # Get surrounding context
                 start = max(0, match.start() - 10)
@@ -234,7 +386,7 @@ class ResumeParserService:
                 institution = self._extract_institution(context)
                 year = self._extract_year(context)
                 
-                education_list.append(Education(
+                education_list.append(EducationRecord(
                     degree=degree_type,
                     field=field,
                     institution=institution,
@@ -292,18 +444,18 @@ class ResumeParserService:
         match = re.search(year_pattern, context)
         return int(match.group(0)) if match else None
     
-    def _extract_experience(self, text: str) -> List[Experience]:
+    def _extract_experience(self, doc: ResumeDocument) -> List[ExperienceRecord]:
         """Extract work experience from resume"""
         experience_list = []
         
         # Find experience section
-        experience_section = self._find_section(text, ['experience', 'employment', 'work history', 'professional'])
+        experience_section = self._find_section(doc, 'experience')
         if not experience_section:
-            experience_section = text
+            experience_section = doc.text
         
         # Look for job title patterns
         title_patterns = [
-            r'(Senior|Junior|Lead|Principal|Staff)?\s*(Software|Data|ML|Machine Learning|Full Stack|Frontend|Backend|DevOps|Cloud|Platform|AI)\s*(Engineer|Developer|Scientist|Analyst|Architect)',
+            r'(?:(Senior|Junior|Lead|Principal|Staff)\s*)?(Software|Data|ML|Machine Learning|Full Stack|Frontend|Backend|DevOps|Cloud|Platform|AI)\s*(Engineer|Developer|Scientist|Analyst|Architect)',
             r'(Project|Product|Program|Engineering)\s*Manager',
             r'(CTO|CEO|VP|Director|Head)\s*(?:of)?\s*\w+'
         ]
@@ -323,7 +475,7 @@ class ResumeParserService:
                 company = self._extract_company(context)
                 duration, years = self._extract_duration(context)
                 
-                experience_list.append(Experience(
+                experience_list.append(ExperienceRecord(
                     title=title.title(),
                     company=company,
                     duration=duration,
@@ -374,7 +526,7 @@ class ResumeParserService:
         
         return "N/A", 1.0
     
-    def _extract_certifications(self, text: str) -> List[Certification]:
+    def _extract_certifications(self, doc: ResumeDocument) -> List[CertificationRecord]:
         """Extract certifications from resume"""
         certifications = []
         
@@ -387,10 +539,10 @@ class ResumeParserService:
         ]
         
         for pattern in cert_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = re.finditer(pattern, doc.text, re.IGNORECASE)
             for match in matches:
                 cert_name = match.group(0).strip()
-                certifications.append(Certification(
+                certifications.append(CertificationRecord(
                     name=cert_name,
                     issuer=self._determine_cert_issuer(cert_name),
                     valid=True
@@ -415,25 +567,17 @@ class ResumeParserService:
             return "CNCF"
         return "Issuing Authority"
     
-    def _find_section(self, text: str, keywords: List[str]) -> Optional[str]:
+    def _find_section(self, doc: ResumeDocument, section: str) -> Optional[str]:
         """Find a specific section in the resume"""
-        text_lower = text.lower()
-        for keyword in keywords:
-            pattern = rf'(?:^|\n)\s*{keyword}[:\s]*\n(.*?)(?=\n\s*(?:experience|education|skills|projects|awards|references|$))'
-            match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-            if match:
-                start = text_lower.find(keyword)
-                end = start + len(match.group(0))
-                return text[start:end]
-        return None
+        return doc.section_text(section)
     
-    def _calculate_total_experience(self, experiences: List[Experience]) -> float:
+    def _calculate_total_experience(self, experiences: List[ExperienceRecord]) -> float:
         """Calculate total years of experience"""
         if not experiences:
             return 0.0
         return sum(exp.years for exp in experiences)
     
-    def _determine_primary_role(self, experiences: List[Experience], skills: List[Skill]) -> str:
+    def _determine_primary_role(self, experiences: List[ExperienceRecord], skills: List[SkillRecord]) -> str:
         """Determine the candidate's primary role"""
         if experiences:
             # Use the most recent job title
@@ -452,10 +596,10 @@ class ResumeParserService:
         
         return "Software Professional"
     
-    def _extract_summary(self, text: str) -> Optional[str]:
+    def _extract_summary(self, doc: ResumeDocument) -> Optional[str]:
         """Extract professional summary from resume"""
         # Look for summary section
-        summary_section = self._find_section(text, ['summary', 'objective', 'profile', 'about'])
+        summary_section = self._find_section(doc, 'summary')
         if summary_section:
             # Clean and limit length
             summary = re.sub(r'\s+', ' ', summary_section).strip()
@@ -464,4 +608,9 @@ class ResumeParserService:
 
 
 # Singleton instance
-resume_parser = ResumeParserService()
+resume_parser = ResumeParserService(
+    cache=ParseCache(
+        max_entries=settings.PARSE_CACHE_MAX_ENTRIES,
+        max_bytes=settings.PARSE_CACHE_MAX_BYTES
+    )
+)
@@ -3,10 +3,43 @@ ATS Scoring Service
 Calculates comprehensive ATS scores based on multiple factors
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.models.records import Resume
 from app.models.schemas import (
-    ParsedResume, JobDescription, ATSScore, RecommendationStatus, MatchResult
+    JobDescription, ATSScore, RecommendationStatus, MatchResult
+)
+
+
+# Columns of the batch feature table; the match columns are NaN for rows
+# scored without a match result
+FEATURE_COLUMNS = (
+    'skill_count', 'experience_years', 'degree_level', 'has_summary',
+    'experience_count', 'has_certifications',
+    'skill_match_percentage', 'semantic_similarity'
 )
+# degree_level codes: no education, other, bachelor, master, Ph.D.
+DEGREE_LEVEL_SCORES = (50, 60, 80, 90, 100)
+
+
+def exact_round(values: np.ndarray, digits: int) -> np.ndarray:
+    """round(x, digits) for each value, exactly as Python rounds floats"""
+    # np.round computes rint(x * 10**digits) / 10**digits, which can only
+    # disagree with round() when the scaled value lands within float
+    # error of a .5 tie
+    values = np.asarray(values, dtype=np.float64)
+    scaled = values * 10.0 ** digits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-9 * np.maximum(1, np.abs(scaled))
+    rounded = np.round(values, digits)
+    for i in np.flatnonzero(near_tie).tolist():
+        rounded[i] = round(float(values[i]), digits)
+    return rounded
+
+
+def _round1(values: np.ndarray) -> List[float]:
+    return exact_round(values, 1).tolist()
 
 
 class ScorerService:
@@ -20,21 +53,61 @@ class ScorerService:
         'format': 0.05
     }
     
+    BREAKDOWN_LABELS = {
+        'skills': 'Skills (40%)',
+        'experience': 'Experience (30%)',
+        'education': 'Education (15%)',
+        'keywords': 'Keywords (10%)',
+        'format': 'Format (5%)'
+    }
+    
     HIRE_THRESHOLD = 80
     REVIEW_THRESHOLD = 60
     
+    # ParsedResume fields the ATS features are computed from
+    RESUME_FIELDS = (
+        "skills", "education", "experience", "certifications",
+        "total_experience_years", "summary"
+    )
+    
     def calculate_ats_score(
         self,
-        parsed_resume: ParsedResume,
+        parsed_resume: Resume,
         job_description: Optional[JobDescription] = None,
         match_result: Optional[MatchResult] = None
     ) -> ATSScore:
         """Calculate comprehensive ATS score"""
-        skills_score = self._calc_skills(parsed_resume, job_description, match_result)
-        experience_score = self._calc_experience(parsed_resume, job_description)
-        education_score = self._calc_education(parsed_resume, job_description)
-        keyword_score = self._calc_keywords(parsed_resume, match_result)
-        format_score = self._calc_format(parsed_resume)
+        components = self.component_scores(parsed_resume, job_description, match_result)
+        return self.score_from_components(components, len(parsed_resume.skills))
+    
+    def component_scores(
+        self,
+        parsed_resume: Resume,
+        job_description: Optional[JobDescription] = None,
+        match_result: Optional[MatchResult] = None
+    ) -> Dict[str, float]:
+        """Unweighted component scores keyed like WEIGHTS"""
+        return {
+            'skills': self._calc_skills(parsed_resume, job_description, match_result),
+            'experience': self._calc_experience(parsed_resume, job_description),
+            'education': self._calc_education(parsed_resume, job_description),
+            'keywords': self._calc_keywords(parsed_resume, match_result),
+            'format': self._calc_format(parsed_resume)
+        }
+    
+    def score_from_components(self, components: Dict[str, float], skill_count: int) -> ATSScore:
+        """
+        Build an ATSScore from component scores
+        
+        Args:
+            components: Output of component_scores, possibly read back from storage
+            skill_count: Number of skills on the resume (drives confidence)
+        """
+        skills_score = components['skills']
+        experience_score = components['experience']
+        education_score = components['education']
+        keyword_score = components['keywords']
+        format_score = components['format']
         
         overall_score = (
             skills_score * self.WEIGHTS['skills'] +
@@ -45,7 +118,7 @@ class ScorerService:
         )
         
         recommendation = self._get_recommendation(overall_score)
-        confidence = min(1.0, 0.7 + (0.1 if len(parsed_resume.skills) >= 5 else 0))
+        confidence = min(1.0, 0.7 + (0.1 if skill_count >= 5 else 0))
         
         return ATSScore(
             overall_score=round(overall_score, 1),
@@ -55,16 +128,209 @@ class ScorerService:
             keyword_score=round(keyword_score, 1),
             format_score=round(format_score, 1),
             score_breakdown={
-                'Skills (40%)': round(skills_score * self.WEIGHTS['skills'], 1),
-                'Experience (30%)': round(experience_score * self.WEIGHTS['experience'], 1),
-                'Education (15%)': round(education_score * self.WEIGHTS['education'], 1),
-                'Keywords (10%)': round(keyword_score * self.WEIGHTS['keywords'], 1),
-                'Format (5%)': round(format_score * self.WEIGHTS['format'], 1)
+                self.BREAKDOWN_LABELS[name]: round(components[name] * weight, 1)
+                for name, weight in self.WEIGHTS.items()
             },
             recommendation=recommendation,
             confidence=round(confidence, 2)
         )
     
+    def feature_table(
+        self,
+        resumes: Sequence[Resume],
+        match_results: Optional[Sequence[Optional[MatchResult]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Columnar scoring features for a batch of resumes
+        
+        Args:
+            resumes: Parsed resumes
+            match_results: Optional match result per resume (None entries allowed)
+            
+        Returns:
+            Arrays keyed by FEATURE_COLUMNS
+        """
+        n = len(resumes)
+        matches = list(match_results) if match_results else [None] * n
+        return {
+            'skill_count': np.fromiter((len(r.skills) for r in resumes), np.int64, n),
+            'experience_years': np.fromiter(
+                (r.total_experience_years for r in resumes), np.float64, n
+            ),
+            'degree_level': np.fromiter((self._degree_level(r) for r in resumes), np.int64, n),
+            'has_summary': np.fromiter((bool(r.summary) for r in resumes), bool, n),
+            'experience_count': np.fromiter((len(r.experience) for r in resumes), np.int64, n),
+            'has_certifications': np.fromiter((bool(r.certifications) for r in resumes), bool, n),
+            'skill_match_percentage': np.fromiter(
+                (m.skill_match_percentage if m else np.nan for m in matches), np.float64, n
+            ),
+            'semantic_similarity': np.fromiter(
+                (m.semantic_similarity if m else np.nan for m in matches), np.float64, n
+            ),
+        }
+    
+    def batch_component_scores(
+        self,
+        features: Dict[str, np.ndarray],
+        job_description: Optional[JobDescription] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized component_scores over a feature table
+        
+        Each branch of the scalar _calc_* methods becomes a column-wide
+        select, with the same arithmetic, so scores are identical.
+        """
+        skill_count = features['skill_count']
+        years = features['experience_years']
+        has_summary = features['has_summary']
+        skill_match = features['skill_match_percentage']
+        semantic = features['semantic_similarity']
+        
+        skills = np.where(
+            np.isnan(skill_match),
+            np.select([skill_count >= 15, skill_count >= 10, skill_count >= 5], [95, 85, 70], 50),
+            skill_match
+        )
+        experience = self._batch_experience(years, job_description)
+        education = np.asarray(DEGREE_LEVEL_SCORES, dtype=np.float64)[features['degree_level']]
+        keywords = np.where(
+            np.isnan(semantic), np.where(has_summary, 75, 60), np.minimum(100, semantic * 120)
+        )
+        format_score = np.minimum(
+            100,
+            80 + np.where(has_summary, 5, 0)
+            + np.where(features['experience_count'] >= 2, 10, 0)
+            + np.where(features['has_certifications'], 5, 0)
+        )
+        return {
+            'skills': skills.astype(np.float64),
+            'experience': experience,
+            'education': education,
+            'keywords': keywords.astype(np.float64),
+            'format': format_score.astype(np.float64),
+        }
+    
+    def job_component_scores(
+        self,
+        components: Dict[str, np.ndarray],
+        years: np.ndarray,
+        skill_match_percentage: np.ndarray,
+        semantic_similarity: np.ndarray,
+        job_description: Optional[JobDescription] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Component scores against a job from JD-independent ones
+        
+        Args:
+            components: Columns from component_scores without a JD or match
+            years: Total experience years
+            skill_match_percentage: Match result skill percentages (rounded)
+            semantic_similarity: Match result similarities (rounded)
+            job_description: Job the match columns refer to
+        """
+        scored = dict(components)
+        scored['skills'] = np.asarray(skill_match_percentage, dtype=np.float64)
+        scored['experience'] = self._batch_experience(years, job_description)
+        scored['keywords'] = np.minimum(100, np.asarray(semantic_similarity) * 120)
+        return scored
+    
+    @staticmethod
+    def _batch_experience(years: np.ndarray, jd: Optional[JobDescription]) -> np.ndarray:
+        """Vectorized _calc_experience"""
+        if jd and jd.min_experience_years:
+            min_years = jd.min_experience_years
+            experience = np.where(
+                years >= min_years, 100, np.maximum(0, 100 - (min_years - years) * 20)
+            )
+        else:
+            experience = np.select([years >= 5, years >= 3, years >= 1], [95, 85, 70], 50)
+        return experience.astype(np.float64)
+    
+    def batch_overall_scores(
+        self,
+        components: Dict[str, np.ndarray],
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        Unrounded overall scores, summed in the same order as score_from_components
+        
+        Args:
+            components: Component columns keyed like WEIGHTS
+            weights: Weights keyed like WEIGHTS (default WEIGHTS)
+        """
+        weights = weights or self.WEIGHTS
+        return (
+            components['skills'] * weights['skills'] +
+            components['experience'] * weights['experience'] +
+            components['education'] * weights['education'] +
+            components['keywords'] * weights['keywords'] +
+            components['format'] * weights['format']
+        )
+    
+    def scores_from_component_arrays(
+        self,
+        components: Dict[str, np.ndarray],
+        skill_counts: np.ndarray
+    ) -> List[Dict]:
+        """
+        ATS scores for columns of component scores
+        
+        Returns:
+            One dict per row, equal to score_from_components(...).model_dump(mode='json')
+        """
+        overall = self.batch_overall_scores(components)
+        recommendation = np.where(
+            overall >= self.HIRE_THRESHOLD, 0, np.where(overall >= self.REVIEW_THRESHOLD, 1, 2)
+        ).tolist()
+        statuses = (RecommendationStatus.HIRE.value, RecommendationStatus.REVIEW.value,
+                    RecommendationStatus.REJECT.value)
+        confidences = (round(min(1.0, 0.7), 2), round(min(1.0, 0.7 + 0.1), 2))
+        confident = (np.asarray(skill_counts) >= 5).tolist()
+        
+        overall = _round1(overall)
+        skills, experience, education, keywords, format_score = (
+            _round1(components[name]) for name in self.WEIGHTS
+        )
+        breakdown = [
+            (self.BREAKDOWN_LABELS[name], _round1(components[name] * weight))
+            for name, weight in self.WEIGHTS.items()
+        ]
+        return [
+            {
+                'overall_score': overall[i],
+                'skills_score': skills[i],
+                'experience_score': experience[i],
+                'education_score': education[i],
+                'keyword_score': keywords[i],
+                'format_score': format_score[i],
+                'score_breakdown': {label: values[i] for label, values in breakdown},
+                'recommendation': statuses[recommendation[i]],
+                'confidence': confidences[confident[i]]
+            }
+            for i in range(len(overall))
+        ]
+    
+    def calculate_ats_scores(
+        self,
+        resumes: Sequence[Resume],
+        job_description: Optional[JobDescription] = None,
+        match_results: Optional[Sequence[Optional[MatchResult]]] = None
+    ) -> List[Dict]:
+        """Batch calculate_ats_score through the vectorized feature table (as dicts)"""
+        features = self.feature_table(resumes, match_results)
+        components = self.batch_component_scores(features, job_description)
+        return self.scores_from_component_arrays(components, features['skill_count'])
+    
+    @staticmethod
+    def _degree_level(resume: Resume) -> int:
+        """Highest degree as a DEGREE_LEVEL_SCORES index"""
+        if not resume.education: return 0
+        degrees = [edu.degree.lower() for edu in resume.education]
+        if any('ph.d' in d for d in degrees): return 4
+        elif any('master' in d for d in degrees): return 3
+        elif any('bachelor' in d for d in degrees): return 2
+        return 1
+    
     def _calc_skills(self, resume, jd, match_result) -> float:
         if match_result:
             return match_result.skill_match_percentage
@@ -85,12 +351,7 @@ class ScorerService:
         return 50
     
     def _calc_education(self, resume, jd) -> float:
-        if not resume.education: return 50
-        degrees = [edu.degree.lower() for edu in resume.education]
-        if any('ph.d' in d for d in degrees): return 100
-        elif any('master' in d for d in degrees): return 90
-        elif any('bachelor' in d for d in degrees): return 80
-        return 60
+        return DEGREE_LEVEL_SCORES[self._degree_level(resume)]
     
     def _calc_keywords(self, resume, match_result) -> float:
         if match_result:
@@ -0,0 +1,262 @@
+"""
+Skill Bitmap Service
+Packed uint64 skill sets over a skill vocabulary with boolean skill queries
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+WORD_BITS = 64
+QUERY_TOKEN_PATTERN = re.compile(r'\(|\)|"[^"]*"|[^\s()]+')
+QUERY_KEYWORDS = {"AND", "OR", "NOT"}
+
+# Query AST: skill name, ("NOT", node) or ("AND" | "OR", left, right)
+QueryNode = Union[str, Tuple]
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits in each element of a uint64 array, as int64"""
+    if hasattr(np, "bitwise_count"):
+        # NumPy >= 2.0 returns uint8 counts
+        return np.bitwise_count(words).astype(np.int64)
+    # SWAR popcount for NumPy < 2.0, in place on one temporary
+    x = words - ((words >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x += x >> np.uint64(4)
+    x &= _M4
+    x *= _H01
+    x >>= np.uint64(56)
+    return x.view(np.int64)
+
+
+def parse_skill_query(query: str) -> QueryNode:
+    """
+    Parse a boolean skill query such as ``python AND (aws OR gcp) AND NOT php``
+
+    Operators are AND, OR and NOT (NOT binds tightest, then AND, then OR);
+    adjacent words form one skill name, and quotes may wrap names that
+    contain operators or parentheses.
+
+    Raises:
+        ValueError: If the query is malformed
+    """
+    tokens = QUERY_TOKEN_PATTERN.findall(query)
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or() -> QueryNode:
+        node = parse_and()
+        while peek() is not None and peek().upper() == "OR":
+            take()
+            node = ("OR", node, parse_and())
+        return node
+
+    def parse_and() -> QueryNode:
+        node = parse_not()
+        while peek() is not None and peek().upper() == "AND":
+            take()
+            node = ("AND", node, parse_not())
+        return node
+
+    def parse_not() -> QueryNode:
+        if peek() is not None and peek().upper() == "NOT":
+            take()
+            return ("NOT", parse_not())
+        return parse_atom()
+
+    def parse_atom() -> QueryNode:
+        token = peek()
+        if token is None:
+            raise ValueError("Unexpected end of skill query")
+        if token == "(":
+            take()
+            node = parse_or()
+            if peek() != ")":
+                raise ValueError("Missing ')' in skill query")
+            take()
+            return node
+        if token == ")" or token.upper() in QUERY_KEYWORDS:
+            raise ValueError(f"Unexpected '{token}' in skill query")
+        words = []
+        while peek() is not None and peek() not in ("(", ")") \
+                and peek().upper() not in QUERY_KEYWORDS:
+            words.append(take().strip('"'))
+        return " ".join(words).lower()
+
+    node = parse_or()
+    if peek() is not None:
+        raise ValueError(f"Unexpected '{peek()}' in skill query")
+    return node
+
+
+def query_skills(node: QueryNode) -> List[str]:
+    """Skill names referenced by a parsed query"""
+    if isinstance(node, str):
+        return [node]
+    return [skill for child in node[1:] for skill in query_skills(child)]
+
+
+class SkillBitmap:
+    """
+    Rows of skill sets packed as uint64 bit vectors
+
+    Each skill in the vocabulary owns one bit; a row's words are the OR of
+    its skills' bits. Words are stored column-major, one contiguous array
+    per 64 skills, so a skill test or a popcount touches one array.
+    Coverage of a skill list is a popcount of the rows AND the list's mask,
+    and boolean queries become whole-column bit tests.
+    """
+
+    def __init__(self, skills: Iterable[str] = ()):
+        """
+        Initialize an empty bitmap
+
+        Args:
+            skills: Initial vocabulary (lowercased skill names)
+        """
+        self.vocabulary: Dict[str, int] = {}
+        for skill in skills:
+            self.vocabulary.setdefault(skill, len(self.vocabulary))
+        self._bits = np.zeros((self._words_for(len(self.vocabulary)), 0), dtype=np.uint64)
+        self._size = 0
+
+    @staticmethod
+    def _words_for(n_skills: int) -> int:
+        return max(1, -(-n_skills // WORD_BITS))
+
+    @property
+    def n_words(self) -> int:
+        return self._bits.shape[0]
+
+    @property
+    def words(self) -> np.ndarray:
+        """(n_words, rows) view of the packed skill sets"""
+        return self._bits[:, :self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, skill_sets: Iterable[Iterable[str]]) -> None:
+        """Append one row per skill set, growing the vocabulary as needed"""
+        ids = [
+            [self.vocabulary.setdefault(skill, len(self.vocabulary)) for skill in skills]
+            for skills in skill_sets
+        ]
+        end = self._size + len(ids)
+        n_words = max(self.n_words, self._words_for(len(self.vocabulary)))
+        if end > self._bits.shape[1] or n_words > self.n_words:
+            capacity = max(end, 2 * self._bits.shape[1], 1024)
+            grown = np.zeros((n_words, capacity), dtype=np.uint64)
+            grown[:self.n_words, :self._size] = self.words
+            self._bits = grown
+
+        rows = np.repeat(np.arange(len(ids)), [len(skill_ids) for skill_ids in ids])
+        flat = np.fromiter(
+            (skill_id for skill_ids in ids for skill_id in skill_ids),
+            dtype=np.int64, count=len(rows)
+        )
+        # Skills within a row are distinct, so OR equals a sum of bit values;
+        # bincount sums 32-bit halves exactly in float64
+        for word in np.unique(flat // WORD_BITS):
+            in_word = flat // WORD_BITS == word
+            bit = flat[in_word] % WORD_BITS
+            halves = []
+            for low, high in ((0, 32), (32, 64)):
+                selected = (bit >= low) & (bit < high)
+                sums = np.bincount(
+                    rows[in_word][selected],
+                    weights=np.exp2(bit[selected] - low),
+                    minlength=len(ids)
+                )
+                halves.append(sums.astype(np.uint64))
+            self._bits[word, self._size:end] = halves[0] | (halves[1] << np.uint64(32))
+        self._size = end
+
+    def extend(self, words: np.ndarray) -> None:
+        """
+        Append rows that are already packed against this vocabulary
+
+        Args:
+            words: (n_words, rows) words; missing high words are zero
+        """
+        end = self._size + words.shape[1]
+        n_words = max(self.n_words, words.shape[0], self._words_for(len(self.vocabulary)))
+        if end > self._bits.shape[1] or n_words > self.n_words:
+            capacity = max(end, 2 * self._bits.shape[1], 1024)
+            grown = np.zeros((n_words, capacity), dtype=np.uint64)
+            grown[:self.n_words, :self._size] = self.words
+            self._bits = grown
+        self._bits[:words.shape[0], self._size:end] = words
+        self._size = end
+
+    def take(self, rows: np.ndarray) -> None:
+        """Keep only the given rows, in order"""
+        self._bits = self.words[:, rows].copy()
+        self._size = len(rows)
+
+    def mask(self, skills: Iterable[str]) -> np.ndarray:
+        """Bit mask of the known skills among names; unknown names are skipped"""
+        words = np.zeros(self.n_words, dtype=np.uint64)
+        for skill in skills:
+            skill_id = self.vocabulary.get(skill)
+            if skill_id is not None:
+                words[skill_id // WORD_BITS] |= np.uint64(1 << (skill_id % WORD_BITS))
+        return words
+
+    def count(self, mask: np.ndarray) -> np.ndarray:
+        """Number of the mask's skills held by each row"""
+        counts = np.zeros(self._size, dtype=np.int64)
+        for word in np.flatnonzero(mask):
+            counts += popcount(self.words[word] & mask[word])
+        return counts
+
+    def sizes(self, rows: np.ndarray) -> np.ndarray:
+        """Number of skills held by each of the given rows"""
+        counts = np.zeros(len(rows), dtype=np.int64)
+        for word in range(self.n_words):
+            counts += popcount(self._bits[word, rows])
+        return counts
+
+    def has(self, skill: str) -> np.ndarray:
+        """Boolean column: which rows hold a skill"""
+        skill_id = self.vocabulary.get(skill)
+        if skill_id is None:
+            return np.zeros(self._size, dtype=bool)
+        bit = np.uint64(1 << (skill_id % WORD_BITS))
+        return (self.words[skill_id // WORD_BITS] & bit) != 0
+
+    def select(self, query: Union[str, QueryNode]) -> np.ndarray:
+        """
+        Evaluate a boolean skill query over every row
+
+        Raises:
+            ValueError: If the query is malformed or names an unknown skill
+        """
+        node = parse_skill_query(query) if isinstance(query, str) else query
+        unknown = sorted({s for s in query_skills(node) if s not in self.vocabulary})
+        if unknown:
+            raise ValueError(f"Unknown skills in query: {', '.join(unknown)}")
+        return self._evaluate(node)
+
+    def _evaluate(self, node: QueryNode) -> np.ndarray:
+        if isinstance(node, str):
+            return self.has(node)
+        if node[0] == "NOT":
+            return ~self._evaluate(node[1])
+        left, right = self._evaluate(node[1]), self._evaluate(node[2])
+        return left & right if node[0] == "AND" else left | right
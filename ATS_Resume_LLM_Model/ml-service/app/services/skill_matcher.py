@@ -0,0 +1,144 @@
+"""
+Skill Matcher Service
+Single-pass multi-pattern skill detection using a compiled trie regex
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class SkillHit(NamedTuple):
+    """A single skill occurrence in lowercased resume text"""
+    skill: str
+    category: str
+    start: int
+    end: int
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """
+    Build a regex alternation whose branches share common prefixes
+
+    A flat alternation makes the regex engine try every entry at every
+    position; a trie-shaped one only follows the branches whose prefix
+    matches, so scan cost stays flat as the taxonomy grows.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def _render(node: Dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + _render(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Longer continuations are tried before stopping at this node
+        return f"(?:{body})?" if terminal else body
+
+    return _render(trie)
+
+
+class SkillMatcher:
+    """Detects every taxonomy skill in a text with one regex scan"""
+
+    # Proficiency indicators in priority order (first level found wins)
+    PROFICIENCY_INDICATORS = [
+        ("expert", ['expert', 'advanced', 'senior', '5+ years', 'lead']),
+        ("advanced", ['proficient', '3+ years', 'experienced']),
+        ("beginner", ['familiar', 'basic', 'beginner', 'learning']),
+    ]
+    CONTEXT_WINDOW = 100
+
+    def __init__(self, taxonomy: Dict[str, str]):
+        """
+        Compile the matcher for a skill taxonomy
+
+        Args:
+            taxonomy: Mapping of lowercased skill name to category
+        """
+        self.taxonomy = dict(taxonomy)
+        # Skills must not start or end inside a word, so "r" and "go"
+        # no longer match in "rust" or "google"
+        self._pattern = re.compile(
+            rf"(?<!\w)({_trie_pattern(self.taxonomy)})(?!\w)"
+        )
+        self._indicator_levels = {
+            word: level
+            for level, words in self.PROFICIENCY_INDICATORS
+            for word in words
+        }
+        # Lookahead capture reports overlapping indicators as the original
+        # substring checks did
+        self._indicator_pattern = re.compile(
+            rf"(?=({_trie_pattern(self._indicator_levels)}))"
+        )
+        self._level_rank = {
+            level: rank for rank, (level, _) in enumerate(self.PROFICIENCY_INDICATORS)
+        }
+
+    def find_all(self, text_lower: str) -> List[SkillHit]:
+        """
+        Find every skill occurrence with its offsets
+
+        Args:
+            text_lower: Lowercased text to scan
+
+        Returns:
+            Skill hits in order of appearance
+        """
+        taxonomy = self.taxonomy
+        return [
+            SkillHit(match.group(1), taxonomy[match.group(1)], match.start(1), match.end(1))
+            for match in self._pattern.finditer(text_lower)
+        ]
+
+    def find_indicators(self, text_lower: str) -> List[Tuple[int, int, str]]:
+        """Find all proficiency indicator spans as (start, end, level)"""
+        indicators = []
+        for match in self._indicator_pattern.finditer(text_lower):
+            # The trie matches greedily; also record shorter indicators
+            # that are prefixes of the matched one
+            word = match.group(1)
+            start = match.start(1)
+            for length in range(1, len(word) + 1):
+                level = self._indicator_levels.get(word[:length])
+                if level:
+                    indicators.append((start, start + length, level))
+        return indicators
+
+    def estimate_proficiency(
+        self,
+        hit: SkillHit,
+        indicators: List[Tuple[int, int, str]],
+        text_length: int
+    ) -> str:
+        """
+        Estimate proficiency from indicators within the hit's context window
+
+        Args:
+            hit: Skill occurrence to classify
+            indicators: Output of find_indicators for the same text
+            text_length: Length of the scanned text
+
+        Returns:
+            Proficiency level
+        """
+        window_start = max(0, hit.start - self.CONTEXT_WINDOW)
+        window_end = min(text_length, hit.end + self.CONTEXT_WINDOW)
+
+        best: Optional[str] = None
+        i = bisect_left(indicators, (window_start,))
+        while i < len(indicators) and indicators[i][0] < window_end:
+            _, end, level = indicators[i]
+            if end <= window_end and (
+                best is None or self._level_rank[level] < self._level_rank[best]
+            ):
+                best = level
+            i += 1
+        return best or "intermediate"
@@ -3,45 +3,87 @@ Suggestions Service
 Generates resume improvement suggestions based on analysis
 """
 
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 from app.models.schemas import (
-    ParsedResume, JobDescription, Suggestion, KeywordGap, MatchResult
+    ParsedResume, JobDescription, Suggestion, KeywordGap, MatchResult, ResumeEdit
 )
+from app.services.delta_scorer import DeltaScorer, EditState, delta_scorer
+
+# Action items listed per suggestion, and edits applied for the rewrite estimate
+MAX_ACTION_ITEMS = 5
+MAX_REWRITE_KEYWORDS = 10
 
 
 class SuggestionsService:
     """Service for generating resume improvement suggestions"""
     
+    def __init__(self, scorer: DeltaScorer = delta_scorer):
+        """
+        Args:
+            scorer: Delta scorer estimating the gain of each suggested edit
+        """
+        self.scorer = scorer
+    
+    def _ranked_actions(
+        self,
+        state: EditState,
+        edits: Sequence[ResumeEdit]
+    ) -> Tuple[List[ResumeEdit], List[float], float]:
+        """Top edits by ATS gain, their gains, and the gain of applying them all"""
+        impacts = self.scorer.rank_edits(state, edits)[:MAX_ACTION_ITEMS]
+        chosen = [impact.edit for impact in impacts]
+        _, ats = self.scorer.evaluate(state, [(), chosen])
+        return chosen, [impact.ats_score_gain for impact in impacts], round(float(ats[1] - ats[0]), 1)
+    
+    def _single_gain(self, state: EditState, edit: ResumeEdit) -> float:
+        return self.scorer.rank_edits(state, [edit])[0].ats_score_gain
+    
     def generate_suggestions(
         self,
         parsed_resume: ParsedResume,
         job_description: JobDescription = None,
         keyword_gaps: KeywordGap = None,
-        match_result: MatchResult = None
+        match_result: MatchResult = None,
+        state: Optional[EditState] = None
     ) -> List[Suggestion]:
-        """Generate improvement suggestions"""
+        """
+        Generate improvement suggestions, with estimated ATS gains
+        
+        state is the delta scorer's prepared resume and job, if the caller
+        already has it.
+        """
         suggestions = []
+        if state is None:
+            state = self.scorer.prepare(parsed_resume, job_description)
         
-        # Skills suggestions
+        # Skills suggestions, largest gain first
         if match_result and match_result.missing_skills:
+            edits, gains, total = self._ranked_actions(state, [
+                ResumeEdit(kind="skill", value=skill) for skill in match_result.missing_skills
+            ])
             suggestions.append(Suggestion(
                 category="skills",
                 priority="high",
                 title="Add Missing Required Skills",
                 description=f"Add these skills mentioned in the job description",
-                action_items=[f"Add '{skill}' to your skills section" 
-                             for skill in match_result.missing_skills[:5]]
+                action_items=[f"Add '{edit.value}' to your skills section" for edit in edits],
+                action_gains=gains,
+                estimated_gain=total
             ))
         
-        # Keyword suggestions
+        # Keyword suggestions, largest gain first
         if keyword_gaps and keyword_gaps.missing_keywords:
+            edits, gains, total = self._ranked_actions(state, [
+                ResumeEdit(kind="keyword", value=kw) for kw in keyword_gaps.missing_keywords
+            ])
             suggestions.append(Suggestion(
                 category="keywords",
                 priority="high",
                 title="Include Missing Keywords",
                 description="Add these keywords to improve ATS compatibility",
-                action_items=[f"Include '{kw}' in relevant sections" 
-                             for kw in keyword_gaps.missing_keywords[:5]]
+                action_items=[f"Include '{edit.value}' in relevant sections" for edit in edits],
+                action_gains=gains,
+                estimated_gain=total
             ))
         
         # Experience suggestions
@@ -55,7 +97,11 @@ class SuggestionsService:
                     "Include quantifiable achievements",
                     "Add action verbs to descriptions",
                     "Mention technologies used in each role"
-                ]
+                ],
+                estimated_gain=(
+                    self._single_gain(state, ResumeEdit(kind="experience"))
+                    if len(parsed_resume.experience) == 1 else None
+                )
             ))
         
         # Summary suggestions
@@ -69,7 +115,10 @@ class SuggestionsService:
                     "Write a 2-3 sentence professional summary",
                     "Include your key skills and experience level",
                     "Mention your career objective"
-                ]
+                ],
+                estimated_gain=self._single_gain(state, ResumeEdit(
+                    kind="summary", value=self.scorer.draft_summary(state)
+                ))
             ))
         
         # Certifications suggestions
@@ -83,27 +132,51 @@ class SuggestionsService:
                     "Add any industry certifications",
                     "Include online course certificates",
                     "Mention professional memberships"
-                ]
+                ],
+                estimated_gain=self._single_gain(state, ResumeEdit(kind="certification"))
             ))
         
         return suggestions
     
     def generate_rewrite_suggestions(
         self,
-        resume_text: str,
-        job_description: str
+        parsed_resume: ParsedResume,
+        keyword_gaps: KeywordGap,
+        state: EditState
     ) -> dict:
-        """Generate rewritten resume sections"""
+        """
+        Generate rewritten resume sections
+        
+        ats_score_improvement is the delta scorer's estimate for the
+        rewrite: the keywords with a positive gain (up to
+        MAX_REWRITE_KEYWORDS) plus a summary if the resume has none.
+        
+        Args:
+            parsed_resume: Parsed resume
+            keyword_gaps: Keyword gaps against the target job
+            state: Delta scorer state of the resume and target job
+        """
+        impacts = self.scorer.rank_edits(state, [
+            ResumeEdit(kind="keyword", value=kw) for kw in keyword_gaps.missing_keywords
+        ])
+        keywords = [
+            impact.edit for impact in impacts
+            if impact.ats_score_gain > 0 or (impact.match_score_gain or 0) > 0
+        ][:MAX_REWRITE_KEYWORDS]
+        summary = parsed_resume.summary or self.scorer.draft_summary(state)
+        rewrite = keywords + [ResumeEdit(kind="summary", value=summary)]
+        _, ats = self.scorer.evaluate(state, [(), rewrite])
+        
         return {
-            "improved_summary": f"Experienced professional with proven track record...",
+            "improved_summary": summary,
             "improved_skills": "Organized skills by relevance to the position",
-            "keyword_additions": ["Added relevant industry keywords"],
+            "keyword_additions": [edit.value for edit in keywords],
             "format_suggestions": [
                 "Use bullet points for achievements",
                 "Keep resume to 1-2 pages",
                 "Use consistent date formatting"
             ],
-            "ats_score_improvement": 15.0
+            "ats_score_improvement": round(float(ats[1] - ats[0]), 1)
         }
 
 
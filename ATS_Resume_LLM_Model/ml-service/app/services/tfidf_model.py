@@ -0,0 +1,201 @@
+"""
+TF-IDF Model Service
+Corpus-fitted TF-IDF vocabulary and IDF weights persisted to disk
+
+Fit offline over a resume/JD corpus:
+    python -m app.services.tfidf_model corpus/ --output models/tfidf
+
+Corpus inputs may be .txt files (one document each), .jsonl files (one
+{"text": ...} document per line) or directories containing either.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+
+TERMS_FILE = "terms.json"
+IDF_FILE = "idf.npy"
+META_FILE = "meta.json"
+
+# Matches the vectorizer the matcher has always used
+VECTORIZER_PARAMS = {
+    "stop_words": "english",
+    "ngram_range": (1, 2),
+    "max_features": 5000,
+    "lowercase": True,
+}
+
+
+class TfidfModel:
+    """
+    Transform-only TF-IDF model with a fixed vocabulary and IDF vector
+
+    The model is never refitted after construction, so one instance can be
+    shared across threads. When loaded with mmap the IDF vector is mapped
+    read-only and shared by every worker process through the page cache.
+    """
+
+    def __init__(self, terms: Sequence[str], idf: np.ndarray, n_documents: int = 0):
+        """
+        Build a model from a vocabulary and matching IDF weights
+
+        Args:
+            terms: Vocabulary terms in feature index order
+            idf: IDF weight per term
+            n_documents: Size of the corpus the model was fitted on
+        """
+        if len(terms) != len(idf):
+            raise ValueError("terms and idf must have the same length")
+        self.terms = list(terms)
+        self.idf = idf
+        self.n_documents = n_documents
+        self._counter = CountVectorizer(
+            vocabulary={term: index for index, term in enumerate(self.terms)},
+            stop_words=VECTORIZER_PARAMS["stop_words"],
+            ngram_range=VECTORIZER_PARAMS["ngram_range"],
+            lowercase=VECTORIZER_PARAMS["lowercase"],
+        )
+        # Validate the fixed vocabulary now so transform never mutates state
+        self._counter.fit([""])
+        digest = hashlib.sha256()
+        digest.update(json.dumps(VECTORIZER_PARAMS, sort_keys=True).encode("utf-8"))
+        digest.update("\n".join(self.terms).encode("utf-8"))
+        digest.update(np.ascontiguousarray(self.idf, dtype=np.float64).tobytes())
+        self._fingerprint = digest.hexdigest()[:16]
+
+    @property
+    def n_features(self) -> int:
+        return len(self.terms)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Short digest of the vectorizer params, vocabulary and IDF weights
+
+        Vectors are only portable between models with equal fingerprints.
+        """
+        return self._fingerprint
+
+    def transform(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        """
+        Vectorize texts into L2-normalized TF-IDF rows
+
+        Args:
+            texts: Documents to vectorize
+
+        Returns:
+            Sparse matrix of shape (n_texts, n_features)
+        """
+        counts = self._counter.transform(texts).astype(np.float64)
+        counts.data *= self.idf[counts.indices]
+        return normalize(counts, norm="l2", copy=False)
+
+    @classmethod
+    def fit(cls, documents: Iterable[str], max_features: Optional[int] = None) -> "TfidfModel":
+        """
+        Fit vocabulary and IDF weights over a corpus
+
+        Args:
+            documents: Resume and job description texts
+            max_features: Vocabulary size cap, defaults to the matcher setting
+
+        Returns:
+            Fitted model
+        """
+        vectorizer = TfidfVectorizer(**{
+            **VECTORIZER_PARAMS,
+            "max_features": max_features or VECTORIZER_PARAMS["max_features"],
+        })
+        documents = list(documents)
+        vectorizer.fit(documents)
+        terms = [None] * len(vectorizer.vocabulary_)
+        for term, index in vectorizer.vocabulary_.items():
+            terms[index] = term
+        return cls(terms, vectorizer.idf_.astype(np.float64), n_documents=len(documents))
+
+    def save(self, path: str) -> None:
+        """Write the model artifact directory"""
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / IDF_FILE, np.ascontiguousarray(self.idf, dtype=np.float64))
+        with open(directory / TERMS_FILE, "w", encoding="utf-8") as f:
+            json.dump(self.terms, f)
+        with open(directory / META_FILE, "w", encoding="utf-8") as f:
+            json.dump({
+                "n_documents": self.n_documents,
+                "n_features": self.n_features,
+                "params": VECTORIZER_PARAMS,
+            }, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "TfidfModel":
+        """
+        Load a model artifact directory
+
+        Args:
+            path: Directory written by save()
+            mmap: Map the IDF vector read-only instead of reading it
+
+        Returns:
+            Loaded model
+        """
+        directory = Path(path)
+        idf = np.load(directory / IDF_FILE, mmap_mode="r" if mmap else None)
+        with open(directory / TERMS_FILE, encoding="utf-8") as f:
+            terms = json.load(f)
+        n_documents = 0
+        if (directory / META_FILE).exists():
+            with open(directory / META_FILE, encoding="utf-8") as f:
+                n_documents = json.load(f).get("n_documents", 0)
+        return cls(terms, idf, n_documents=n_documents)
+
+    @classmethod
+    def load_if_exists(cls, path: Optional[str]) -> Optional["TfidfModel"]:
+        """Load a model if its artifact is present, otherwise return None"""
+        if path and (Path(path) / IDF_FILE).exists():
+            return cls.load(path)
+        return None
+
+
+def iter_corpus(paths: Iterable[str]) -> Iterator[str]:
+    """Yield documents from .txt and .jsonl files or directories of them"""
+    for path in paths:
+        if os.path.isdir(path):
+            children = sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.endswith((".txt", ".jsonl"))
+            )
+            yield from iter_corpus(children)
+        elif path.endswith(".jsonl"):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)["text"]
+        else:
+            with open(path, encoding="utf-8") as f:
+                yield f.read()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Fit the matcher TF-IDF model")
+    parser.add_argument("corpus", nargs="+", help="Corpus files or directories")
+    parser.add_argument("--output", required=True, help="Artifact directory")
+    parser.add_argument("--max-features", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    model = TfidfModel.fit(iter_corpus(args.corpus), max_features=args.max_features)
+    model.save(args.output)
+    print(f"Fitted {model.n_features} terms over {model.n_documents} documents -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Worker Pool Service
+Fans batch parsing, matching and scoring out to a pool of worker processes
+"""
+
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.config import settings
+from app.models.schemas import JobDescription
+from app.services.matcher import CompiledJob, matcher_service
+from app.services.resume_parser import resume_parser
+from app.services.scorer import scorer_service
+
+
+def _init_worker() -> None:
+    """Warm parser, matcher and scorer state once per worker process"""
+    parsed = resume_parser.parse_resume("Python Engineer\nSKILLS\nPython, SQL")
+    scorer_service.calculate_ats_score(parsed)
+
+
+def score_resume_chunk(resume_texts: Sequence[str], fields: Optional[Sequence[str]] = None) -> List[Dict]:
+    """
+    Parse a chunk of resumes and score it in one vectorized pass
+
+    Only the extractors the ATS score (and any requested fields) need run;
+    with fields, each result also carries those parsed resume fields.
+    Resumes stay compact records unless their fields are returned.
+    """
+    needed = list(scorer_service.RESUME_FIELDS) + list(fields or ())
+    parsed = [resume_parser.parse_record(text, fields=needed) for text in resume_texts]
+    results = [
+        {"candidate_id": resume.candidate_id, "name": resume.anonymized_name, "ats_score": score}
+        for resume, score in zip(parsed, scorer_service.calculate_ats_scores(parsed))
+    ]
+    if fields is not None:
+        for result, resume in zip(results, parsed):
+            result["parsed_resume"] = resume.to_model().model_dump(mode="json", include=set(fields))
+    return results
+
+
+def parse_resume_chunk(candidates: Sequence[Tuple[str, str]]) -> List[Dict]:
+    """
+    Parse a chunk of (candidate id, resume text) pairs
+
+    Resume TF-IDF rows are computed here too, so the ranking step in the
+    parent only has to run one sparse product. Parsed resumes are returned
+    as ResumeRecords, which pickle smaller than ParsedResume.
+    """
+    parsed = [
+        {"id": candidate_id, "parsed_resume": resume_parser.parse_record(text)}
+        for candidate_id, text in candidates
+    ]
+    vectors = matcher_service.resume_vectors([c["parsed_resume"] for c in parsed])
+    if vectors is not None:
+        for row, candidate in enumerate(parsed):
+            candidate["resume_vector"] = vectors[row]
+    return parsed
+
+
+@functools.lru_cache(maxsize=8)
+def _compiled_job(job_json: str) -> CompiledJob:
+    """Compile a serialized job once per worker process"""
+    return matcher_service.compile_job(JobDescription.model_validate_json(job_json))
+
+
+def screen_resume_chunk(candidates: Sequence[Tuple[str, str]], job_json: str) -> List[Dict]:
+    """
+    Parse, match and ATS-score a chunk of (candidate id, resume text) pairs
+
+    Args:
+        candidates: Resumes to screen
+        job_json: JobDescription serialized as JSON
+
+    Returns:
+        One JSON-serializable result per candidate, in input order
+    """
+    job = _compiled_job(job_json)
+    parsed = [resume_parser.parse_record(text) for _, text in candidates]
+    components = matcher_service.batch_components(parsed, job)
+    results = []
+    for i, ((candidate_id, _), resume) in enumerate(zip(candidates, parsed)):
+        match_result = matcher_service.build_match_result(
+            resume, job,
+            float(components['semantic_similarity'][i]),
+            float(components['skill_match_pct'][i]),
+            bool(components['experience_match'][i]),
+            bool(components['education_match'][i])
+        )
+        ats_score = scorer_service.calculate_ats_score(resume, job.job, match_result)
+        results.append({
+            "candidate_id": candidate_id,
+            "name": resume.anonymized_name,
+            "match_score": match_result.match_score,
+            "skill_match_percentage": match_result.skill_match_percentage,
+            "ats_score": ats_score.overall_score,
+            "recommendation": ats_score.recommendation.value,
+            "top_skills": [s.name for s in resume.skills[:5]],
+            "experience_years": resume.total_experience_years
+        })
+    return results
+
+
+class WorkerPool:
+    """Process pool that splits batches into chunks and merges results in order"""
+
+    def __init__(self, max_workers: int, chunk_size: int):
+        """
+        Configure the pool; processes start on first use
+
+        Args:
+            max_workers: Number of worker processes, or 0 to run chunks in a thread
+            chunk_size: Number of items sent to a worker per task
+        """
+        self.max_workers = max_workers
+        self.chunk_size = max(1, chunk_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers avoid inheriting the server's threads and locks
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+        return self._executor
+
+    async def map(self, func: Callable[..., List], items: Sequence, *args: Any) -> List:
+        """
+        Apply a chunk function to items across workers
+
+        Args:
+            func: Module-level function taking (chunk, *args) and returning a list
+            items: Items to split into chunks
+            args: Extra picklable arguments passed with every chunk
+
+        Returns:
+            Concatenated results in input order
+        """
+        chunks = [
+            items[i:i + self.chunk_size]
+            for i in range(0, len(items), self.chunk_size)
+        ]
+        if self.max_workers <= 0:
+            # In process, but still off the event loop
+            results = await asyncio.to_thread(lambda: [func(chunk, *args) for chunk in chunks])
+        else:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            results = await asyncio.gather(*[
+                loop.run_in_executor(executor, func, chunk, *args)
+                for chunk in chunks
+            ])
+        return [result for chunk_results in results for result in chunk_results]
+
+    def warm_up(self) -> None:
+        """Start every worker process ahead of the first batch"""
+        if self.max_workers <= 0:
+            return
+        executor = self._get_executor()
+        list(executor.map(_warm_up_task, range(self.max_workers)))
+
+    def shutdown(self) -> None:
+        """Stop worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def _warm_up_task(_: int) -> None:
+    """No-op task used to force worker start-up"""
+    return None
+
+
+worker_pool = WorkerPool(
+    max_workers=settings.WORKER_PROCESSES,
+    chunk_size=settings.WORKER_CHUNK_SIZE
+)
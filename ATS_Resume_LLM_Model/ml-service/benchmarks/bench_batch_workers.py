@@ -0,0 +1,43 @@
+"""
+Batch Worker Benchmark
+Measures /api/scoring/batch style throughput at 1, 2, 4 and 8 worker processes
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_batch_workers [resume_count]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from app.services.worker_pool import WorkerPool, score_resume_chunk
+from benchmarks.synthetic import synthetic_resumes
+
+
+def run(workers: int, resumes, chunk_size: int) -> float:
+    pool = WorkerPool(max_workers=workers, chunk_size=chunk_size)
+    try:
+        pool.warm_up()
+        start = time.perf_counter()
+        asyncio.run(pool.map(score_resume_chunk, resumes))
+        return len(resumes) / (time.perf_counter() - start)
+    finally:
+        pool.shutdown()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    resumes = synthetic_resumes(count)
+    print(f"{count} resumes, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'resumes/sec':>12} {'speedup':>8}")
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        # Keep every worker busy with several chunks
+        rate = run(workers, resumes, chunk_size=max(1, count // (workers * 8)))
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:12.1f} {rate / baseline:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
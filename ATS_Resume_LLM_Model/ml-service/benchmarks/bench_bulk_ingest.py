@@ -0,0 +1,118 @@
+"""
+Bulk Ingest Benchmark
+Times decoding resume batches from JSON against the incremental msgpack and Arrow IPC decoders
+
+For each batch size, encodes synthetic resumes as the JSON body of
+POST /api/candidates, a length-prefixed msgpack stream and an Arrow IPC
+stream (record batches of 256), then decodes each body fed in 64 KiB
+chunks the way the endpoints receive it: JSON is parsed and validated
+whole, the binary streams are decoded record by record into windows
+that are dropped once full. Reports body size, ms to decode, peak
+memory allocated while decoding (tracemalloc), and whether every
+decoder yields the same records. Needs msgpack and pyarrow.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_bulk_ingest [count ...]
+"""
+
+import asyncio
+import json
+import struct
+import sys
+import time
+import tracemalloc
+
+import msgpack
+import pyarrow
+
+from app.routers.candidates import AddCandidatesRequest
+from app.services.bulk_ingest import arrow_records, msgpack_records
+from benchmarks.synthetic import synthetic_resumes
+
+
+CHUNK_BYTES = 64 * 1024
+ARROW_BATCH = 256
+WINDOW = 256
+
+
+def json_body(records):
+    return json.dumps({"candidates": [
+        {"candidate_id": candidate_id, "resume_text": text} for candidate_id, text in records
+    ]}).encode("utf-8")
+
+
+def msgpack_body(records):
+    frames = bytearray()
+    for candidate_id, text in records:
+        frame = msgpack.packb({"candidate_id": candidate_id, "resume_text": text})
+        frames += struct.pack(">I", len(frame)) + frame
+    return bytes(frames)
+
+
+def arrow_body(records):
+    schema = pyarrow.schema([("candidate_id", pyarrow.string()), ("resume_text", pyarrow.string())])
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, schema) as writer:
+        for start in range(0, len(records), ARROW_BATCH):
+            batch = records[start:start + ARROW_BATCH]
+            writer.write_batch(pyarrow.record_batch(
+                [[c for c, _ in batch], [t for _, t in batch]], schema=schema
+            ))
+    return sink.getvalue().to_pybytes()
+
+
+async def chunks(body):
+    for start in range(0, len(body), CHUNK_BYTES):
+        yield body[start:start + CHUNK_BYTES]
+
+
+def decode_json(body):
+    request = AddCandidatesRequest.model_validate(json.loads(body))
+    return [(c.candidate_id, c.resume_text) for c in request.candidates]
+
+
+def decode_stream(decoder, body, records):
+    """Whether a decoder yields records, windowed and dropped like the bulk endpoint"""
+    async def consume():
+        window, expected, same = [], iter(records), True
+        async for record in decoder(chunks(body)):
+            same = same and record == next(expected, None)
+            window.append(record)
+            if len(window) == WINDOW:
+                window = []
+        return same and next(expected, None) is None
+    return asyncio.run(consume())
+
+
+def measure(decode, body):
+    """Decoded output, ms and peak bytes allocated while decoding"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = decode(body)
+    ms = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    decode(body)
+    return result, min(ms, (time.perf_counter() - start) * 1000), peak
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 10000]
+    for count in counts:
+        records = [(f"CAND-{i:06d}", text) for i, text in enumerate(synthetic_resumes(count, seed=4))]
+        print(f"{count:,} resumes")
+        print(f"  {'format':<10} {'body bytes':>13} {'ms':>9} {'peak bytes':>13}   same")
+        for label, encode, decode in (
+            ("json", json_body, decode_json),
+            ("msgpack", msgpack_body, lambda body: decode_stream(msgpack_records, body, records)),
+            ("arrow", arrow_body, lambda body: decode_stream(arrow_records, body, records)),
+        ):
+            body = encode(records)
+            result, ms, peak = measure(decode, body)
+            same = result == records if label == "json" else result
+            print(f"  {label:<10} {len(body):>13,} {ms:>9.2f} {peak:>13,}   {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Candidate Index Benchmark
+Times indexed top-k retrieval against a full vectorized ranking pass
+
+The pool is built by tiling a set of unique parsed resumes; each size
+checks that the index returns the same page as rank_candidates.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_candidate_index [size ...]
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from app.services.candidate_index import CandidateIndex
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+UNIQUE_RESUMES = 5000
+TOP_K = 50
+JOBS = 5
+FULL_RANK_LIMIT = 100_000
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    parser = ResumeParserService()
+    unique = [parser.parse_resume(text) for text in synthetic_resumes(UNIQUE_RESUMES)]
+
+    with tempfile.TemporaryDirectory() as artifact:
+        TfidfModel.fit(synthetic_resumes(2000, seed=1)).save(artifact)
+        matcher = MatcherService(model=TfidfModel.load(artifact))
+        unique_vectors = matcher.resume_vectors(unique)
+        jobs = [matcher.compile_job(synthetic_job(i)) for i in range(JOBS)]
+
+        print(f"{'candidates':>10} {'build s':>9} {'index ms':>9} {'full ms':>9}  same page")
+        for size in sizes:
+            tiles = np.arange(size) % UNIQUE_RESUMES
+            entries = [(f"CAND-{i:07d}", unique[tiles[i]]) for i in range(size)]
+            vectors = unique_vectors[tiles]
+
+            index = CandidateIndex(matcher)
+            start = time.perf_counter()
+            for begin in range(0, size, 10_000):
+                index.add(entries[begin:begin + 10_000], vectors[begin:begin + 10_000])
+            build_s = time.perf_counter() - start
+
+            candidates = []
+            if size <= FULL_RANK_LIMIT:
+                candidates = [
+                    {"id": candidate_id, "parsed_resume": resume,
+                     "resume_vector": unique_vectors[tiles[i]]}
+                    for i, (candidate_id, resume) in enumerate(entries)
+                ]
+
+            index_ms, full_ms, same = [], [], True
+            for job in jobs:
+                start = time.perf_counter()
+                page = index.search(job, TOP_K)
+                index_ms.append((time.perf_counter() - start) * 1000)
+
+                if candidates:
+                    start = time.perf_counter()
+                    expected = matcher.rank_candidates(candidates, job, top_k=TOP_K)
+                    full_ms.append((time.perf_counter() - start) * 1000)
+                    same &= (
+                        [(c["id"], c["ranking_score"]) for c in page]
+                        == [(c["id"], c["ranking_score"]) for c in expected]
+                    )
+
+            full = f"{np.median(full_ms):9.1f}" if full_ms else f"{'-':>9}"
+            check = str(same) if full_ms else "-"
+            print(f"{size:>10} {build_s:>9.2f} {np.median(index_ms):>9.1f} {full}  {check}")
+
+
+if __name__ == "__main__":
+    main()
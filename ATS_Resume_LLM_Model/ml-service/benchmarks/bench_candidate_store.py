@@ -0,0 +1,80 @@
+"""
+Candidate Store Benchmark
+Times persisting the candidate index and rebuilding it on startup
+
+Startup from the store is compared with re-parsing every resume (timed on
+a sample and extrapolated), and the reloaded index is checked to return
+the same pages as the one it was written from.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_candidate_store [size ...]
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from app.services.candidate_index import CandidateIndex
+from app.services.candidate_store import CandidateStore
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+UNIQUE_RESUMES = 2000
+PARSE_SAMPLE = 200
+BATCH_SIZE = 10_000
+TOP_K = 50
+JOBS = 5
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    parser = ResumeParserService()
+    texts = synthetic_resumes(UNIQUE_RESUMES)
+    start = time.perf_counter()
+    unique = [parser.parse_resume(text) for text in texts[:PARSE_SAMPLE]]
+    parse_s_per_resume = (time.perf_counter() - start) / PARSE_SAMPLE
+    unique += [parser.parse_resume(text) for text in texts[PARSE_SAMPLE:]]
+    skills = parser.skill_matcher.taxonomy
+
+    with tempfile.TemporaryDirectory() as workdir:
+        TfidfModel.fit(synthetic_resumes(2000, seed=1)).save(workdir + "/model")
+        matcher = MatcherService(model=TfidfModel.load(workdir + "/model"))
+        unique_vectors = matcher.resume_vectors(unique)
+        jobs = [matcher.compile_job(synthetic_job(i)) for i in range(JOBS)]
+
+        print(f"{'candidates':>10} {'write s':>8} {'load s':>8} {'reparse s':>10}  same pages")
+        for size in sizes:
+            path = f"{workdir}/store-{size}"
+            tiles = np.arange(size) % UNIQUE_RESUMES
+            entries = [(f"CAND-{i:07d}", unique[tiles[i]]) for i in range(size)]
+            vectors = unique_vectors[tiles]
+
+            written = CandidateIndex(matcher, skills=skills, store=CandidateStore(path))
+            start = time.perf_counter()
+            for begin in range(0, size, BATCH_SIZE):
+                written.add(
+                    entries[begin:begin + BATCH_SIZE], vectors[begin:begin + BATCH_SIZE]
+                )
+            write_s = time.perf_counter() - start
+
+            loaded = CandidateIndex(matcher, skills=skills, store=CandidateStore(path))
+            start = time.perf_counter()
+            loaded.load()
+            load_s = time.perf_counter() - start
+
+            same = len(loaded) == size and all(
+                [(c["id"], c["ranking_score"]) for c in written.search(job, TOP_K)]
+                == [(c["id"], c["ranking_score"]) for c in loaded.search(job, TOP_K)]
+                for job in jobs
+            )
+            print(f"{size:>10} {write_s:>8.2f} {load_s:>8.2f} "
+                  f"{parse_s_per_resume * size:>10.1f}  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Delta Scorer Benchmark
+Times ranking candidate resume edits from cached intermediates against re-scoring
+
+For each resume, scores every candidate edit (the job's missing skills and
+keywords plus summary, certification and experience entries) with the
+delta scorer, and again by applying the edit to the parsed resume and
+re-running match_resume_to_job and calculate_ats_score. Reports the time
+per resume for both and whether every score agrees.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_delta_scorer [resume_count]
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from app.models.schemas import Certification, Experience, ResumeEdit, Skill
+from app.services.delta_scorer import DeltaScorer
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.scorer import ScorerService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+JOBS = 5
+EXTRA_EDITS = [
+    ResumeEdit(kind="certification", value="AWS Certified Solutions Architect"),
+    ResumeEdit(kind="experience", value="Senior Data Engineer building streaming pipelines"),
+]
+
+
+def apply_edit(resume, edit: ResumeEdit, summary: str):
+    """The parsed resume the edit describes, or None if it has no equivalent"""
+    edited = resume.model_copy(deep=True)
+    if edit.kind == "skill":
+        if edit.value.lower() not in {s.name.lower() for s in edited.skills}:
+            edited.skills.append(Skill(name=edit.value))
+    elif edit.kind == "summary":
+        edited.summary = edited.summary or edit.value or summary
+    elif edit.kind == "keyword":
+        # Keywords are inserted at the end of the experience section
+        if not edited.experience:
+            return None
+        last = edited.experience[-1]
+        last.description = f"{last.description or ''} {edit.value}"
+    elif edit.kind == "experience":
+        edited.experience.append(Experience(title=edit.value, company="", duration="", years=0))
+    elif edit.kind == "certification":
+        edited.certifications.append(Certification(name=edit.value, issuer=""))
+    return edited
+
+
+def run(label: str, matcher: MatcherService, resumes, jobs) -> None:
+    scorer = ScorerService()
+    delta = DeltaScorer(matcher, scorer)
+    prepare_ms, rank_ms, full_ms, edit_counts = [], [], [], []
+    checked = agree = 0
+    for i, resume in enumerate(resumes):
+        job = jobs[i % len(jobs)]
+        start = time.perf_counter()
+        state = delta.prepare(resume, job)
+        prepare_ms.append((time.perf_counter() - start) * 1000)
+        edits = delta.candidate_edits(state) + EXTRA_EDITS
+        edit_counts.append(len(edits))
+
+        start = time.perf_counter()
+        impacts = delta.rank_edits(state, edits)
+        rank_ms.append((time.perf_counter() - start) * 1000)
+
+        summary = delta.draft_summary(state)
+        start = time.perf_counter()
+        expected = {}
+        for edit in edits:
+            edited = apply_edit(resume, edit, summary)
+            if edited is not None:
+                match = matcher.match_resume_to_job(edited, job)
+                ats = scorer.calculate_ats_score(edited, job.job, match)
+                expected[(edit.kind, edit.value)] = (match.match_score, ats.overall_score)
+        full_ms.append((time.perf_counter() - start) * 1000)
+
+        for impact in impacts:
+            key = (impact.edit.kind, impact.edit.value)
+            if key in expected:
+                checked += 1
+                agree += expected[key] == (impact.match_score, impact.ats_score)
+
+    print(
+        f"{label:<14} {np.mean(edit_counts):>6.1f} {np.median(prepare_ms):>11.2f} "
+        f"{np.median(rank_ms):>9.2f} {np.median(full_ms):>9.1f}   {agree}/{checked}"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    parser = ResumeParserService()
+    resumes = [parser.parse_resume(text) for text in synthetic_resumes(count)]
+
+    print(f"{count} resumes; times are per resume")
+    print(f"{'TF-IDF':<14} {'edits':>6} {'prepare ms':>11} {'rank ms':>9} {'full ms':>9}   agree")
+    pair = MatcherService()
+    run("pair-fitted", pair, resumes, [pair.compile_job(synthetic_job(j)) for j in range(JOBS)])
+    with tempfile.TemporaryDirectory() as artifact:
+        TfidfModel.fit(synthetic_resumes(2000, seed=1)).save(artifact)
+        fitted = MatcherService(model=TfidfModel.load(artifact))
+        run("corpus model", fitted, resumes, [fitted.compile_job(synthetic_job(j)) for j in range(JOBS)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Field Projection Benchmark
+Times parsing and analysis limited to selected fields against the full versions
+
+For typical synthetic resumes and long ones (a few hundred experience
+lines), parses with each field selection (only the extractors those
+fields need run) and serializes just those fields, then runs the
+analysis pipeline for a few fields= selections. Reports ms per resume
+and whether every projected value equals the full result's.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_fields [resume_count]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from app.services.delta_scorer import DeltaScorer
+from app.services.document import ResumeDocument
+from app.services.matcher import MatcherService
+from app.services.pipeline import AnalysisPipeline
+from app.services.resume_parser import ResumeParserService
+from app.services.scorer import ScorerService
+from app.services.suggestions import SuggestionsService
+from benchmarks.bench_live_session import long_resume
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+# Runs all extractors, personal ones included, as parsing did before
+# anonymized parses skipped them
+EVERY_EXTRACTOR = "every extractor"
+
+PARSE_SELECTIONS = [
+    ("every extractor", EVERY_EXTRACTOR),
+    ("all fields", None),
+    ("skills", ["skills"]),
+    ("skills + years", ["skills", "total_experience_years"]),
+    ("ATS inputs", list(ScorerService.RESUME_FIELDS)),
+]
+ANALYSIS_SELECTIONS = [
+    ("full analysis", None),
+    ("skills + ats_score", ["skills", "ats_score"]),
+    ("match_result", ["match_result"]),
+    ("keyword_gaps", ["keyword_gaps"]),
+]
+FULL_OUTPUTS = ("parsed_resume", "ats_score", "match_result", "keyword_gaps", "suggestions")
+
+
+def time_parse(parser, texts, fields):
+    times, agree = [], 0
+    for text in texts:
+        start = time.perf_counter()
+        doc = ResumeDocument(text)
+        if fields is EVERY_EXTRACTOR:
+            body = parser.assemble(doc, True, parser.extract(doc, parser.EXTRACTORS)).model_dump(mode="json")
+        else:
+            parsed = parser.parse_document(doc, fields=fields)
+            body = parsed.model_dump(mode="json", include=set(fields) if fields else None)
+        times.append((time.perf_counter() - start) * 1000)
+        full = parser.parse_document(ResumeDocument(text)).model_dump(mode="json")
+        agree += all(body[name] == full[name] for name in body)
+    return np.mean(times), agree
+
+
+def time_analysis(pipeline, texts, job, fields):
+    outputs = FULL_OUTPUTS if fields is None else [f for f in fields if f in FULL_OUTPUTS]
+    resume_fields = None if fields is None else [f for f in fields if f not in FULL_OUTPUTS]
+    if resume_fields:
+        outputs.append("parsed_resume")
+    times, agree = [], 0
+    for text in texts:
+        start = time.perf_counter()
+        result = pipeline.run(outputs, text, job, resume_fields=resume_fields)
+        times.append((time.perf_counter() - start) * 1000)
+        full = pipeline.run(FULL_OUTPUTS, text, job)
+        same = all(result[name] == full[name] for name in outputs if name != "parsed_resume")
+        if resume_fields:
+            same = same and all(
+                getattr(result["parsed_resume"], name) == getattr(full["parsed_resume"], name)
+                for name in resume_fields
+            )
+        agree += same
+    return np.mean(times), agree
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    # No parse cache, so every run pays for its extractors
+    parser, matcher, scorer = ResumeParserService(), MatcherService(), ScorerService()
+    delta = DeltaScorer(matcher, scorer)
+    pipeline = AnalysisPipeline(parser, matcher, scorer, SuggestionsService(delta), delta)
+    job = matcher.compile_job(synthetic_job(0))
+    corpora = [
+        ("typical", synthetic_resumes(count)),
+        ("long", [long_resume(bullets) for bullets in range(250, 250 + count // 4)]),
+    ]
+
+    for label, texts in corpora:
+        print(f"{label}: {len(texts)} resumes, {np.mean([len(t) for t in texts]):,.0f} chars on average")
+        print(f"  {'parse fields':<22} {'ms':>8}   same")
+        for name, fields in PARSE_SELECTIONS:
+            ms, agree = time_parse(parser, texts, fields)
+            print(f"  {name:<22} {ms:>8.3f}   {agree}/{len(texts)}")
+        print(f"  {'analyze fields':<22} {'ms':>8}   same")
+        for name, fields in ANALYSIS_SELECTIONS:
+            ms, agree = time_analysis(pipeline, texts, job, fields)
+            print(f"  {name:<22} {ms:>8.3f}   {agree}/{len(texts)}")
+
+
+if __name__ == "__main__":
+    main()
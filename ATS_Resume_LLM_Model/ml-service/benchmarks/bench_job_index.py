@@ -0,0 +1,71 @@
+"""
+Job Index Benchmark
+Times top-k job recommendations per resume over a synthetic job catalog
+
+For catalogs up to CHECK_LIMIT jobs the page is also checked against
+per-job match_resume_to_job over the jobs that pass the skill prefilter.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_job_index [size ...]
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from app.services.job_index import JobIndex
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+QUERIES = 50
+TOP_K = 10
+CHECK_LIMIT = 2000
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2000, 50_000]
+    parser = ResumeParserService()
+    resumes = [parser.parse_resume(text) for text in synthetic_resumes(QUERIES, seed=7)]
+
+    with tempfile.TemporaryDirectory() as artifact:
+        TfidfModel.fit(synthetic_resumes(2000, seed=1)).save(artifact)
+        matcher = MatcherService(model=TfidfModel.load(artifact))
+        vectors = matcher.resume_vectors(resumes)
+
+        print(f"{'jobs':>8} {'build s':>8} {'p50 ms':>8} {'p95 ms':>8}  same page")
+        for size in sizes:
+            start = time.perf_counter()
+            jobs = [matcher.compile_job(synthetic_job(i)) for i in range(size)]
+            index = JobIndex(matcher)
+            for job in jobs:
+                index.add(job)
+            build_s = time.perf_counter() - start
+
+            index.recommend(resumes[0], TOP_K, vectors[0])
+            timings, same = [], True
+            for i, resume in enumerate(resumes):
+                start = time.perf_counter()
+                page = index.recommend(resume, TOP_K, vectors[i])
+                timings.append((time.perf_counter() - start) * 1000)
+
+                if size <= CHECK_LIMIT:
+                    skills = {s.name.lower() for s in resume.skills}
+                    pool = [job for job in jobs if job.all_skills & skills] or jobs
+                    scores = np.array([
+                        matcher.match_resume_to_job(resume, job).match_score for job in pool
+                    ])
+                    expected = [pool[j].job_id for j in matcher.top_indices(scores, TOP_K)]
+                    same &= [r["job"].job_id for r in page] == expected
+
+            check = str(same) if size <= CHECK_LIMIT else "-"
+            print(f"{size:>8} {build_s:>8.1f} {np.percentile(timings, 50):>8.1f} "
+                  f"{np.percentile(timings, 95):>8.1f}  {check}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Live Session Benchmark
+Times incremental re-scoring of a resume being typed against a full analysis per keystroke
+
+Builds a long resume, then types a new experience bullet and a few skills
+one character at a time. Each keystroke is scored three ways: a full
+/analyze-style parse, match, ATS score and suggestions pass; a live
+session update per keystroke; and a live session behind the debouncer
+with keystrokes 60 ms apart (simulated clock), which coalesces a burst
+into a few updates. Reports time per keystroke, the number of updates,
+and whether every live parse and score equals the full pass.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_live_session [bullet_lines]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from app.config import settings
+from app.services.document import ResumeDocument
+from app.services.live_session import Debouncer, LiveScoringSession, TextChange
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.scorer import ScorerService
+from app.services.suggestions import SuggestionsService
+from benchmarks.synthetic import synthetic_job, synthetic_resume
+
+
+KEYSTROKE_INTERVAL = 0.06
+TYPED = [
+    ("- Mentored", "\n- Deployed kubernetes and terraform on aws for 12 product teams"),
+    ("SKILLS\n", "airflow, graphql, "),
+]
+
+
+def long_resume(bullets: int) -> str:
+    """A resume whose experience section holds about `bullets` lines"""
+    text = synthetic_resume(3)
+    extra = []
+    index = 100
+    while len(extra) < bullets:
+        extra += [line for line in synthetic_resume(index).splitlines() if line.startswith("- ")]
+        index += 1
+    return text.replace("EDUCATION", "\n".join(extra[:bullets]) + "\n\nEDUCATION")
+
+
+def keystrokes(text: str):
+    """(change, text after it) for each typed character"""
+    for anchor, typed in TYPED:
+        position = text.index(anchor) + len(anchor)
+        if anchor.startswith("- "):
+            position = text.index("\n", position)
+        for char in typed:
+            text = text[:position] + char + text[position:]
+            yield TextChange(position, position, char), text
+            position += 1
+
+
+def full_pass(parser, matcher, scorer, suggestions, text, job):
+    doc = ResumeDocument(text)
+    parsed = parser.parse_document(doc)
+    match = matcher.match_resume_to_job(parsed, job)
+    ats = scorer.calculate_ats_score(parsed, job.job, match)
+    gaps = matcher.analyze_keyword_gaps(doc, job)
+    suggestions.generate_suggestions(parsed, job.job, gaps, match)
+    return parsed, match, ats
+
+
+def main() -> None:
+    bullets = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    parser, matcher, scorer = ResumeParserService(), MatcherService(), ScorerService()
+    suggestions = SuggestionsService()
+    job = matcher.compile_job(synthetic_job(0))
+    text = long_resume(bullets)
+    strokes = list(keystrokes(text))
+
+    def session():
+        live = LiveScoringSession(parser, matcher, scorer, suggestions)
+        live.set_job(job)
+        live.reset(text)
+        live.update()
+        return live
+
+    full_ms, expected = [], []
+    for _, edited in strokes:
+        start = time.perf_counter()
+        expected.append(full_pass(parser, matcher, scorer, suggestions, edited, job))
+        full_ms.append((time.perf_counter() - start) * 1000)
+
+    live = session()
+    live_ms, agree = [], 0
+    for (change, _), (parsed, match, ats) in zip(strokes, expected):
+        start = time.perf_counter()
+        live.queue([change], 0)
+        live.update()
+        live_ms.append((time.perf_counter() - start) * 1000)
+        agree += (
+            live.resume.parsed == parsed
+            and live._last["match_result"] == match.model_dump(mode="json")
+            and live._last["ats_score"] == ats.model_dump(mode="json")
+        )
+
+    live = session()
+    debouncer = Debouncer(settings.LIVE_DEBOUNCE_MS / 1000, settings.LIVE_MAX_DELAY_MS / 1000)
+    updates, debounced_ms = 0, 0.0
+    for i, (change, _) in enumerate(strokes):
+        now = i * KEYSTROKE_INTERVAL
+        # Updates that fell due before this keystroke arrived
+        if live.dirty and debouncer.remaining(now) == 0:
+            start = time.perf_counter()
+            live.update()
+            debounced_ms += (time.perf_counter() - start) * 1000
+            debouncer.reset()
+            updates += 1
+        live.queue([change], i)
+        debouncer.touch(now)
+    start = time.perf_counter()
+    live.update()
+    debounced_ms += (time.perf_counter() - start) * 1000
+    updates += 1
+    final_ok = live.resume.parsed == expected[-1][0]
+
+    print(f"{len(text):,} characters, {len(strokes)} keystrokes, job {job.job.job_id}")
+    print(f"{'mode':<24} {'updates':>8} {'ms/keystroke':>13} {'p95 ms':>8}   exact")
+    print(f"{'full analyze':<24} {len(strokes):>8} {np.mean(full_ms):>13.2f} "
+          f"{np.percentile(full_ms, 95):>8.2f}")
+    print(f"{'live, every keystroke':<24} {len(strokes):>8} {np.mean(live_ms):>13.2f} "
+          f"{np.percentile(live_ms, 95):>8.2f}   {agree}/{len(strokes)}")
+    print(f"{'live, debounced':<24} {updates:>8} {debounced_ms / len(strokes):>13.2f} "
+          f"{'':>8}   {final_ok}")
+
+
+if __name__ == "__main__":
+    main()
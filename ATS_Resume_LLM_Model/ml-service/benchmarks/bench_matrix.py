@@ -0,0 +1,55 @@
+"""
+Score Matrix Benchmark
+Times MatcherService.score_matrix against per-pair match_resume_to_job
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_matrix [resume_count] [job_count]
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+PAIR_SAMPLE = 2000
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    parser = ResumeParserService()
+    resumes = [parser.parse_resume(text) for text in synthetic_resumes(n)]
+
+    with tempfile.TemporaryDirectory() as artifact:
+        TfidfModel.fit(synthetic_resumes(2000, seed=1)).save(artifact)
+        matcher = MatcherService(model=TfidfModel.load(artifact))
+        jobs = [matcher.compile_job(synthetic_job(i)) for i in range(m)]
+
+        start = time.perf_counter()
+        scores = matcher.score_matrix(resumes, jobs)
+        matrix_s = time.perf_counter() - start
+
+        rng = np.random.default_rng(0)
+        pairs = rng.integers(0, [n, m], size=(min(PAIR_SAMPLE, n * m), 2))
+        start = time.perf_counter()
+        same = all(
+            matcher.match_resume_to_job(resumes[i], jobs[j]).match_score == scores[i, j]
+            for i, j in pairs
+        )
+        pair_s = (time.perf_counter() - start) * n * m / len(pairs)
+
+    print(f"{n} resumes x {m} jobs ({n * m} pairs)")
+    print(f"{'score_matrix':<26} {matrix_s:8.2f} s")
+    print(f"{'per-pair match (est.)':<26} {pair_s:8.2f} s")
+    print(f"{'sampled pairs agree':<26} {same!s:>8}")
+
+
+if __name__ == "__main__":
+    main()
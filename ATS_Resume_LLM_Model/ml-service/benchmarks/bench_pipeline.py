@@ -0,0 +1,95 @@
+"""
+Analysis Pipeline Benchmark
+Times a full resume analysis as separate service calls against the stage pipeline
+
+The separate-call path is what /analyze did before the pipeline: parse,
+match against an uncompiled job, score, keyword gaps from the raw JD text
+and suggestions that prepare the delta scorer (compiling the job again).
+The pipeline computes each intermediate once, run serially and with a
+stage thread pool. Reports ms per analysis and whether all outputs agree.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_pipeline [resume_count]
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from app.services.delta_scorer import DeltaScorer
+from app.services.document import ResumeDocument
+from app.services.matcher import MatcherService
+from app.services.pipeline import AnalysisPipeline
+from app.services.resume_parser import ResumeParserService
+from app.services.scorer import ScorerService
+from app.services.suggestions import SuggestionsService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+OUTPUTS = ("parsed_resume", "match_result", "ats_score", "keyword_gaps", "suggestions")
+THREADS = 4
+
+
+def separate_calls(parser, matcher, scorer, suggestions, text, job):
+    doc = ResumeDocument(text)
+    parsed = parser.parse_document(doc)
+    match = matcher.match_resume_to_job(parsed, job)
+    ats = scorer.calculate_ats_score(parsed, job, match)
+    gaps = matcher.analyze_keyword_gaps(doc, job.description)
+    return {
+        "parsed_resume": parsed,
+        "match_result": match,
+        "ats_score": ats,
+        "keyword_gaps": gaps,
+        "suggestions": suggestions.generate_suggestions(parsed, job, gaps, match),
+    }
+
+
+def run(label: str, matcher: MatcherService, texts, jobs) -> None:
+    parser, scorer = ResumeParserService(), ScorerService()
+    suggestions = SuggestionsService(DeltaScorer(matcher, scorer))
+    pipelines = [
+        AnalysisPipeline(parser, matcher, scorer, suggestions, suggestions.scorer, threads)
+        for threads in (0, THREADS)
+    ]
+    times = {"separate": [], "serial": [], "threaded": []}
+    agree = 0
+    for i, text in enumerate(texts):
+        job = jobs[i % len(jobs)]
+        start = time.perf_counter()
+        expected = separate_calls(parser, matcher, scorer, suggestions, text, job)
+        times["separate"].append((time.perf_counter() - start) * 1000)
+        same = True
+        for mode, pipeline in zip(("serial", "threaded"), pipelines):
+            start = time.perf_counter()
+            result = pipeline.run(OUTPUTS, text, job)
+            times[mode].append((time.perf_counter() - start) * 1000)
+            same = same and all(result[name] == expected[name] for name in OUTPUTS)
+        agree += same
+    for pipeline in pipelines:
+        pipeline.shutdown()
+
+    print(
+        f"{label:<14} {np.mean(times['separate']):>12.2f} {np.mean(times['serial']):>10.2f} "
+        f"{np.mean(times['threaded']):>12.2f}   {agree}/{len(texts)}"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    texts = synthetic_resumes(count, seed=3)
+    jobs = [synthetic_job(j) for j in range(5)]
+
+    print(f"{count} analyses; ms per analysis (pipeline threads: {THREADS})")
+    print(f"{'TF-IDF':<14} {'separate ms':>12} {'serial ms':>10} {'threaded ms':>12}   agree")
+    run("pair-fitted", MatcherService(), texts, jobs)
+    with tempfile.TemporaryDirectory() as artifact:
+        TfidfModel.fit(synthetic_resumes(2000, seed=1)).save(artifact)
+        run("corpus model", MatcherService(model=TfidfModel.load(artifact)), texts, jobs)
+
+
+if __name__ == "__main__":
+    main()
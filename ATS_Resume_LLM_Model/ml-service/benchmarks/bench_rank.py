@@ -0,0 +1,64 @@
+"""
+Candidate Ranking Benchmark
+Times vectorized rank_candidates against per-candidate matching
+
+Resume vectors are normally computed by the parse workers; the benchmark
+reports ranking with those precomputed and with vectorization included.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_rank [candidate_count]
+"""
+
+import sys
+import tempfile
+import time
+
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+UNIQUE_RESUMES = 2000
+LOOP_LIMIT = 5000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    parser = ResumeParserService()
+    unique = [parser.parse_resume(text) for text in synthetic_resumes(UNIQUE_RESUMES)]
+    candidates = [
+        {"id": f"CAND-{i:07d}", "parsed_resume": unique[i % UNIQUE_RESUMES]}
+        for i in range(count)
+    ]
+
+    with tempfile.TemporaryDirectory() as artifact:
+        TfidfModel.fit(synthetic_resumes(2000, seed=1)).save(artifact)
+        matcher = MatcherService(model=TfidfModel.load(artifact))
+        job = matcher.compile_job(synthetic_job(0))
+
+        start = time.perf_counter()
+        page = matcher.rank_candidates(candidates, job, top_k=50)
+        cold_s = time.perf_counter() - start
+
+        vectors = matcher.resume_vectors(unique)
+        for i, candidate in enumerate(candidates):
+            candidate["resume_vector"] = vectors[i % UNIQUE_RESUMES]
+        start = time.perf_counter()
+        matcher.rank_candidates(candidates, job, top_k=50)
+        warm_s = time.perf_counter() - start
+
+        subset = candidates[:min(count, LOOP_LIMIT)]
+        start = time.perf_counter()
+        for candidate in subset:
+            matcher.match_resume_to_job(candidate["parsed_resume"], job)
+        loop_s = (time.perf_counter() - start) * count / len(subset)
+
+    print(f"{count} candidates, top 50 (best score {page[0]['ranking_score']})")
+    print(f"{'vectorized, precomputed rows':<30} {warm_s:8.2f} s")
+    print(f"{'vectorized, incl. transform':<30} {cold_s:8.2f} s")
+    print(f"{'per-candidate match (est.)':<30} {loop_s:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
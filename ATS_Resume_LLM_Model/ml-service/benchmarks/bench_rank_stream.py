@@ -0,0 +1,78 @@
+"""
+Streamed Ranking Benchmark
+Times /api/matching/rank buffered against NDJSON streaming
+
+Each mode runs in a fresh process and reports the time to the first
+response chunk, the total time and how far the server process's peak RSS
+grew during the request (parsing itself runs in the worker processes).
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_rank_stream [resume_count]
+"""
+
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+TOP_K = 50
+MODES = ("buffered", "ndjson")
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+
+async def _run(count: int, mode: str) -> None:
+    from app.routers.matching import RankCandidatesRequest, rank_candidates
+    from app.services.worker_pool import worker_pool
+
+    request = RankCandidatesRequest(
+        resume_texts=synthetic_resumes(count, seed=3),
+        job_description=synthetic_job(0),
+        top_k=TOP_K,
+        stream=None if mode == "buffered" else mode
+    )
+    await rank_candidates(request.model_copy(update={"resume_texts": request.resume_texts[:50]}))
+
+    before = _rss_mb()
+    start = time.perf_counter()
+    response = await rank_candidates(request)
+    first = time.perf_counter() - start
+    if mode != "buffered":
+        async for _ in response.body_iterator:
+            pass
+    total = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:<10} {first:>13.2f} {total:>9.2f} {max(0.0, peak - before):>11.1f}")
+    worker_pool.shutdown()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    if len(sys.argv) > 2:
+        asyncio.run(_run(count, sys.argv[2]))
+        return
+
+    with tempfile.TemporaryDirectory() as artifact:
+        TfidfModel.fit(synthetic_resumes(2000, seed=1)).save(artifact)
+        env = {**os.environ, "TFIDF_MODEL_PATH": artifact, "CANDIDATE_STORE_PATH": ""}
+        print(f"{count} resumes, top {TOP_K}")
+        print(f"{'mode':<10} {'first chunk s':>13} {'total s':>9} {'peak +MB':>11}")
+        for mode in MODES:
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_rank_stream", str(count), mode],
+                env=env, check=True
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Resume Record Benchmark
+Compares compact ResumeRecords with ParsedResume models on the batch and ranking paths
+
+Parses a pool of synthetic resumes both ways (no parse cache), then
+reports parse time per resume, memory held per candidate for the whole
+pool (tracemalloc), pickled size per candidate (what worker processes
+send back), vectorized ATS scoring and match components over each
+form, and the cost of to_model() when a record is serialized. Checks
+that every record converts to the ParsedResume the parser returns and
+that both forms score identically.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_records [resume_count]
+"""
+
+import gc
+import pickle
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from app.services.document import ResumeDocument
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.scorer import ScorerService
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def pool_bytes(build):
+    """Pool built by build() and the bytes it holds once built"""
+    gc.collect()
+    tracemalloc.start()
+    pool = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return pool, size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    parser, matcher, scorer = ResumeParserService(), MatcherService(), ScorerService()
+    job = matcher.compile_job(synthetic_job(0))
+    texts = synthetic_resumes(count, seed=5)
+    # Documents are shared by both forms so the comparison excludes tokenizing
+    docs = [ResumeDocument(text) for text in texts]
+    full = parser.extractors_for(parser.FIELD_EXTRACTORS)
+
+    models, model_ms = timed(lambda: [parser.parse_document(doc) for doc in docs])
+    records, record_ms = timed(
+        lambda: [parser.assemble_record(doc, True, parser.extract(doc, full)) for doc in docs]
+    )
+    converted, convert_ms = timed(lambda: [record.to_model() for record in records])
+    same = sum(model == record for model, record in zip(models, converted))
+
+    _, model_bytes = pool_bytes(lambda: [parser.parse_document(doc) for doc in docs])
+    _, record_bytes = pool_bytes(
+        lambda: [parser.assemble_record(doc, True, parser.extract(doc, full)) for doc in docs]
+    )
+    model_pickle = len(pickle.dumps(models, pickle.HIGHEST_PROTOCOL))
+    record_pickle = len(pickle.dumps(records, pickle.HIGHEST_PROTOCOL))
+
+    model_ats, model_ats_ms = timed(lambda: scorer.calculate_ats_scores(models))
+    record_ats, record_ats_ms = timed(lambda: scorer.calculate_ats_scores(records))
+    model_match, model_match_ms = timed(lambda: matcher.batch_components(models, job))
+    record_match, record_match_ms = timed(lambda: matcher.batch_components(records, job))
+    scores_same = model_ats == record_ats and all(
+        np.array_equal(model_match[name], record_match[name]) for name in model_match
+    )
+
+    print(f"{count} resumes, {np.mean([len(t) for t in texts]):,.0f} chars on average")
+    print(f"{'per candidate':<22} {'ParsedResume':>13} {'ResumeRecord':>13}")
+    print(f"{'parse ms':<22} {model_ms / count:>13.3f} {record_ms / count:>13.3f}")
+    print(f"{'memory bytes':<22} {model_bytes / count:>13,.0f} {record_bytes / count:>13,.0f}")
+    print(f"{'pickled bytes':<22} {model_pickle / count:>13,.0f} {record_pickle / count:>13,.0f}")
+    print(f"{'ATS scores ms':<22} {model_ats_ms / count:>13.4f} {record_ats_ms / count:>13.4f}")
+    print(f"{'match components ms':<22} {model_match_ms / count:>13.4f} {record_match_ms / count:>13.4f}")
+    print(f"to_model() {convert_ms / count:.3f} ms per record; "
+          f"{same}/{count} equal to parse_document; scores identical: {scores_same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Response Encoding Benchmark
+Times default FastAPI JSON encoding of large ranking and batch bodies against FastJSONResponse
+
+Ranks a pool of synthetic resumes and ATS-scores it (returning skills
+with each score), then builds and encodes the first 1k and 10k results
+the way /api/matching/rank and /api/scoring/batch respond: the default
+path (CandidateRanking models, jsonable_encoder, JSONResponse) and
+fast_json (plain dicts, orjson), uncompressed and gzipped at a few
+levels. Reports ms per response, body size, and whether every body
+decodes to the default path's JSON.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_responses [count ...]
+"""
+
+import gzip
+import json
+import sys
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+from app.responses import FastJSONResponse
+from app.routers.matching import _candidate_ranking, _ranking_fields
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.worker_pool import score_resume_chunk
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+GZIP_LEVELS = (1, 6, 9)
+REPEATS = 3
+
+
+def best_ms(func):
+    """Result and fastest of REPEATS runs, in ms"""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, min(times)
+
+
+def report(label, default, fast):
+    """Time default(), fast(compress) and gzip levels; print one block"""
+    expected, default_ms = best_ms(default)
+    expected_json = json.loads(expected)
+    print(f"  {label}")
+    print(f"    {'encoding':<20} {'ms':>9} {'bytes':>12}   same")
+    print(f"    {'default':<20} {default_ms:>9.2f} {len(expected):>12,}")
+    body, ms = best_ms(lambda: fast(False))
+    print(f"    {'fast_json':<20} {ms:>9.2f} {len(body):>12,}   {json.loads(body) == expected_json}")
+    configured = settings.RESPONSE_GZIP_LEVEL
+    try:
+        for level in GZIP_LEVELS:
+            settings.RESPONSE_GZIP_LEVEL = level
+            body, ms = best_ms(lambda: fast(True))
+            same = json.loads(gzip.decompress(body)) == expected_json
+            print(f"    {f'fast_json + gzip {level}':<20} {ms:>9.2f} {len(body):>12,}   {same}")
+    finally:
+        settings.RESPONSE_GZIP_LEVEL = configured
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 10000]
+    pool = max(counts)
+    texts = synthetic_resumes(pool, seed=9)
+    parser, matcher = ResumeParserService(), MatcherService()
+    job = matcher.compile_job(synthetic_job(0))
+    parsed = [
+        {"id": f"CAND-{i + 1:05d}", "parsed_resume": parser.parse_record(text)}
+        for i, text in enumerate(texts)
+    ]
+    ranked = matcher.rank_candidates(parsed, job)
+    scores = score_resume_chunk(texts, ["skills"])
+
+    for count in counts:
+        print(f"{count:,} results")
+        page = ranked[:count]
+
+        def rank_body(ranking):
+            return {"success": True, "total": pool, "rankings": [
+                ranking(c["id"], c["parsed_resume"], c["rank"],
+                        c["match_result"].match_score, c["match_result"].skill_match_percentage)
+                for c in page
+            ]}
+
+        report(
+            "/api/matching/rank",
+            lambda: JSONResponse(jsonable_encoder(rank_body(_candidate_ranking))).body,
+            lambda compress: FastJSONResponse(rank_body(_ranking_fields), compress=compress).body
+        )
+        body = {"success": True, "scores": scores[:count]}
+        report(
+            "/api/scoring/batch (fields: skills)",
+            lambda: JSONResponse(jsonable_encoder(body)).body,
+            lambda compress: FastJSONResponse(body, compress=compress).body
+        )
+
+
+if __name__ == "__main__":
+    main()
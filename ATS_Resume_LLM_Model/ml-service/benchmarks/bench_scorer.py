@@ -0,0 +1,63 @@
+"""
+ATS Scorer Benchmark
+Times batch ATS scoring over a feature table against per-resume scoring
+
+Reports scores/sec for the scalar calculate_ats_score loop, the NumPy
+component and overall arrays alone, feature extraction, and the full
+calculate_ats_scores call that returns ATSScore-shaped dicts, and checks
+the batch results equal the scalar ones.
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_scorer [candidate_count]
+"""
+
+import sys
+import time
+
+from app.services.resume_parser import ResumeParserService
+from app.services.scorer import ScorerService
+from benchmarks.synthetic import synthetic_resumes
+
+
+UNIQUE_RESUMES = 2000
+LOOP_LIMIT = 20_000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    parser = ResumeParserService()
+    unique = [parser.parse_resume(text) for text in synthetic_resumes(UNIQUE_RESUMES)]
+    resumes = [unique[i % UNIQUE_RESUMES] for i in range(count)]
+    scorer = ScorerService()
+
+    subset = resumes[:min(count, LOOP_LIMIT)]
+    start = time.perf_counter()
+    expected = [scorer.calculate_ats_score(resume) for resume in subset]
+    loop_s = (time.perf_counter() - start) * count / len(subset)
+    expected = [score.model_dump(mode="json") for score in expected]
+
+    start = time.perf_counter()
+    features = scorer.feature_table(resumes)
+    features_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    components = scorer.batch_component_scores(features)
+    scorer.batch_overall_scores(components)
+    arrays_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = scorer.calculate_ats_scores(resumes)
+    batch_s = time.perf_counter() - start
+
+    print(f"{count} candidates (same as scalar: {scores[:len(expected)] == expected})")
+    for label, seconds in (
+        ("scalar calculate_ats_score (est.)", loop_s),
+        ("feature table", features_s),
+        ("component + overall arrays", arrays_s),
+        ("calculate_ats_scores (dicts)", batch_s),
+    ):
+        print(f"{label:<34} {seconds:8.3f} s {count / seconds:>13,.0f} scores/s")
+
+
+if __name__ == "__main__":
+    main()
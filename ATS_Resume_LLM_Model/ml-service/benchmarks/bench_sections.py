@@ -0,0 +1,57 @@
+"""
+Section Detection Benchmark
+Shows that section segmentation stays linear on adversarial, header-poor input
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_sections
+"""
+
+import re
+import time
+
+from app.services.document import ResumeDocument
+
+
+# Per-keyword DOTALL regex used before the line-based segmenter
+LEGACY_PATTERN = (
+    r'(?:^|\n)\s*{keyword}[:\s]*\n(.*?)'
+    r'(?=\n\s*(?:experience|education|skills|projects|awards|references|$))'
+)
+LEGACY_KEYWORDS = ['education', 'academic', 'qualification']
+LEGACY_LIMIT_BYTES = 24_000
+
+
+def adversarial_text(size: int) -> str:
+    """Whitespace-heavy text like a PDF paste, with no section headers"""
+    return ("\n \n" * (size // 3))[:size]
+
+
+def legacy_find_section(text: str) -> None:
+    text_lower = text.lower()
+    for keyword in LEGACY_KEYWORDS:
+        pattern = LEGACY_PATTERN.format(keyword=keyword)
+        if re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE):
+            return
+
+
+def segment(text: str) -> None:
+    ResumeDocument(text).sections
+
+
+def timed(func, text: str) -> float:
+    start = time.perf_counter()
+    func(text)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    print(f"{'size':>8} {'segmenter ms':>13} {'us/KB':>7} {'legacy ms':>10}")
+    for size in (3_000, 6_000, 12_000, 24_000, 50_000, 100_000, 200_000):
+        text = adversarial_text(size)
+        new_ms = timed(segment, text)
+        legacy = f"{timed(legacy_find_section, text):10.1f}" if size <= LEGACY_LIMIT_BYTES else f"{'skipped':>10}"
+        print(f"{size:>8} {new_ms:13.2f} {new_ms * 1000 / (size / 1000):7.1f} {legacy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Skill Bitmap Benchmark
+Times boolean skill queries and coverage popcounts over packed bitmaps
+against the same work on per-candidate Python sets
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_skill_bitmap [candidate_count]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from app.services.resume_parser import ResumeParserService
+from app.services.skill_bitmap import SkillBitmap
+from benchmarks.synthetic import synthetic_resumes
+
+
+UNIQUE_RESUMES = 2000
+SET_LIMIT = 100_000
+QUERY = "python AND (aws OR gcp) AND NOT php"
+REQUIRED = ["python", "sql", "docker", "aws", "pandas"]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    parser = ResumeParserService()
+    unique = [
+        {skill.name.lower() for skill in parser.parse_resume(text).skills}
+        for text in synthetic_resumes(UNIQUE_RESUMES)
+    ]
+    skill_sets = [unique[i % UNIQUE_RESUMES] for i in range(count)]
+
+    bitmap = SkillBitmap(parser.skill_matcher.taxonomy)
+    start = time.perf_counter()
+    bitmap.append(skill_sets)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    selected = bitmap.select(QUERY)
+    query_ms = (time.perf_counter() - start) * 1000
+
+    mask = bitmap.mask(REQUIRED)
+    start = time.perf_counter()
+    coverage = bitmap.count(mask) / len(REQUIRED) * 100
+    count_ms = (time.perf_counter() - start) * 1000
+
+    sample = skill_sets[:min(count, SET_LIMIT)]
+    required = set(REQUIRED)
+    start = time.perf_counter()
+    expected = [
+        "python" in s and ("aws" in s or "gcp" in s) and "php" not in s for s in sample
+    ]
+    expected_coverage = [len(s & required) / len(REQUIRED) * 100 for s in sample]
+    set_ms = (time.perf_counter() - start) * 1000 * count / len(sample)
+
+    same = (selected[:len(sample)].tolist() == expected
+            and np.allclose(coverage[:len(sample)], expected_coverage))
+    print(f"{count} candidates, {bitmap.n_words} words per row, "
+          f"{int(selected.sum())} match '{QUERY}'")
+    print(f"{'pack bitmaps':<28} {build_s * 1000:9.1f} ms")
+    print(f"{'boolean query':<28} {query_ms:9.1f} ms")
+    print(f"{'coverage popcount':<28} {count_ms:9.1f} ms")
+    print(f"{'python sets (est.)':<28} {set_ms:9.1f} ms")
+    print(f"{'results agree':<28} {same!s:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+TF-IDF Matching Benchmark
+Compares per-match latency of the corpus-fitted model with per-pair fitting
+
+Run from the ml-service directory:
+    python -m benchmarks.bench_tfidf [match_count]
+"""
+
+import sys
+import tempfile
+import time
+
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+def per_match_ms(matcher: MatcherService, parsed, jobs) -> float:
+    start = time.perf_counter()
+    for resume, job in zip(parsed, jobs):
+        matcher.match_resume_to_job(resume, job)
+    return (time.perf_counter() - start) * 1000 / len(parsed)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    parser = ResumeParserService()
+    resumes = synthetic_resumes(count)
+    jobs = [synthetic_job(i) for i in range(count)]
+    parsed = [parser.parse_resume(text) for text in resumes]
+
+    # Fit on a separate corpus, then reload through the mmap path
+    corpus = synthetic_resumes(2000, seed=1) + [
+        synthetic_job(i, seed=1).description for i in range(500)
+    ]
+    with tempfile.TemporaryDirectory() as artifact:
+        TfidfModel.fit(corpus).save(artifact)
+        fitted = MatcherService(model=TfidfModel.load(artifact))
+
+        legacy_ms = per_match_ms(MatcherService(), parsed, jobs)
+        fitted_ms = per_match_ms(fitted, parsed, jobs)
+
+    print(f"{count} matches")
+    print(f"{'per-pair fit_transform':<26} {legacy_ms:8.3f} ms/match")
+    print(f"{'corpus model transform':<26} {fitted_ms:8.3f} ms/match")
+    print(f"{'speedup':<26} {legacy_ms / fitted_ms:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Synthetic Data
+Deterministic resume and job description generators for benchmarks
+"""
+
+import random
+from typing import List
+
+from app.models.schemas import JobDescription
+from app.services.resume_parser import ResumeParserService
+
+
+FIRST_NAMES = ["Ayaan", "Priya", "James", "Sarah", "Liam", "Mei", "Omar", "Ana", "Noah", "Zara"]
+LAST_NAMES = ["Perera", "Sharma", "Rodriguez", "Chen", "Okafor", "Silva", "Novak", "Haddad"]
+TITLES = [
+    "Machine Learning Engineer", "Data Scientist", "Senior Software Engineer",
+    "Backend Developer", "Frontend Developer", "DevOps Engineer", "Data Analyst",
+    "Full Stack Developer", "Cloud Architect", "Product Manager"
+]
+COMPANIES = ["TechCorp", "DataInc", "Analytics Co", "CloudWorks", "Finlytics", "Medisoft"]
+DEGREES = ["Bachelor's in Computer Science", "Master's in Data Science",
+           "B.Tech in Engineering", "Ph.D. in Statistics", "MBA in Business"]
+UNIVERSITIES = ["Stanford University", "University of Colombo", "MIT", "UCLA", "Delhi University"]
+SKILL_POOL = sorted(ResumeParserService.TECHNICAL_SKILLS)
+SOFT_POOL = sorted(ResumeParserService.SOFT_SKILLS)
+ACHIEVEMENTS = [
+    "Improved model accuracy by {n}%", "Reduced infrastructure cost by {n}%",
+    "Led a team of {n} engineers", "Built data pipelines processing {n}M events per day",
+    "Cut API latency by {n}%", "Mentored {n} junior developers"
+]
+
+
+def synthetic_resume(index: int, seed: int = 0) -> str:
+    """Generate one resume; the same (index, seed) always gives the same text"""
+    rng = random.Random(seed * 1_000_003 + index)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    skills = rng.sample(SKILL_POOL, rng.randint(4, 18)) + rng.sample(SOFT_POOL, 2)
+    years = rng.randint(2008, 2022)
+
+    lines = [
+        name,
+        f"{rng.choice(TITLES)} | candidate{index}@email.com | +1-555-{rng.randint(1000, 9999)}",
+        "",
+        "SUMMARY",
+        f"{rng.choice(TITLES)} with {rng.randint(1, 15)} years of experience. "
+        f"Proficient in {', '.join(skills[:3])}.",
+        "",
+        "SKILLS",
+        ", ".join(skills),
+        "",
+        "EXPERIENCE",
+    ]
+    for _ in range(rng.randint(1, 4)):
+        start = years
+        years = min(2024, years + rng.randint(1, 5))
+        lines.append(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)} ({start} - {years})")
+        for _ in range(rng.randint(1, 3)):
+            lines.append("- " + rng.choice(ACHIEVEMENTS).format(n=rng.randint(2, 60)))
+        lines.append("")
+    lines += [
+        "EDUCATION",
+        f"{rng.choice(DEGREES)}, {rng.choice(UNIVERSITIES)}, {rng.randint(2000, 2022)}",
+    ]
+    if rng.random() < 0.4:
+        lines += ["", "CERTIFICATIONS", "AWS Certified Solutions Architect"]
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_resumes(count: int, seed: int = 0) -> List[str]:
+    """Generate a list of distinct resumes"""
+    return [synthetic_resume(i, seed) for i in range(count)]
+
+
+def synthetic_job(index: int = 0, seed: int = 0) -> JobDescription:
+    """Generate one job description"""
+    rng = random.Random(seed * 7_000_003 + index)
+    title = rng.choice(TITLES)
+    required = rng.sample(SKILL_POOL, rng.randint(3, 6))
+    preferred = rng.sample(SKILL_POOL, rng.randint(1, 4))
+    return JobDescription(
+        job_id=f"JOB-{index:06d}",
+        title=title,
+        description=f"We are hiring a {title} experienced with {', '.join(required)} "
+                    f"to build and operate production systems.",
+        required_skills=[s.title() for s in required],
+        preferred_skills=[s.title() for s in preferred],
+        min_experience_years=rng.randint(0, 6),
+        education_requirements=[rng.choice(DEGREES)]
+    )
@@ -0,0 +1,40 @@
+"""
+Shared fixtures: a small fitted TF-IDF model and a pool of parsed synthetic resumes
+"""
+
+import os
+import tempfile
+
+# Keep the module-level services away from the checked-out data directory
+_DATA = tempfile.mkdtemp(prefix="ml-service-tests-")
+os.environ.setdefault("CANDIDATE_STORE_PATH", "")
+os.environ.setdefault("JOB_SCORES_PATH", "")
+os.environ.setdefault("BATCH_QUEUE_PATH", os.path.join(_DATA, "batches.sqlite3"))
+os.environ.setdefault("TFIDF_MODEL_PATH", os.path.join(_DATA, "no-model"))
+
+import pytest
+
+from app.services.matcher import MatcherService
+from app.services.resume_parser import ResumeParserService
+from app.services.tfidf_model import TfidfModel
+from benchmarks.synthetic import synthetic_resumes
+
+
+@pytest.fixture(scope="session")
+def parser():
+    return ResumeParserService()
+
+
+@pytest.fixture(scope="session")
+def tfidf_model():
+    return TfidfModel.fit(synthetic_resumes(300, seed=1))
+
+
+@pytest.fixture(scope="session")
+def matcher(tfidf_model):
+    return MatcherService(model=tfidf_model)
+
+
+@pytest.fixture(scope="session")
+def resumes(parser):
+    return [parser.parse_record(text) for text in synthetic_resumes(120, seed=3)]
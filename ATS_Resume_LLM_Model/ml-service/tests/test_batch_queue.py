@@ -0,0 +1,86 @@
+"""
+Batch queue: checkpointed chunks and resuming unfinished batches after a restart
+"""
+
+import asyncio
+import time
+
+from app.services.batch_queue import COMPLETED, BatchQueue, BatchRunner
+from app.services.matcher import matcher_service
+from app.services.resume_parser import resume_parser
+from app.services.worker_pool import WorkerPool, screen_resume_chunk
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+def _drain(queue, pool, batch_id, timeout=60.0):
+    """Run a BatchRunner until the batch completes"""
+    async def run():
+        runner = BatchRunner(queue, pool, idle_seconds=0.05)
+        runner.start()
+        try:
+            deadline = time.monotonic() + timeout
+            while queue.get(batch_id)["status"] != COMPLETED:
+                assert time.monotonic() < deadline, queue.get(batch_id)
+                await asyncio.sleep(0.05)
+        finally:
+            await runner.stop()
+    asyncio.run(run())
+
+
+def test_batch_resumes_after_restart(tmp_path, monkeypatch):
+    texts = synthetic_resumes(10, seed=8)
+    job = synthetic_job(1)
+    path = str(tmp_path / "batches.sqlite3")
+    queue = BatchQueue(path, chunk_size=4)
+    batch_id = queue.submit(texts, job, candidate_ids=["A", "B"])
+
+    # Finish one chunk, then "crash" with the batch running
+    batch, chunk, start, items, job_json = queue.next_chunk()
+    queue.complete_chunk(batch, chunk, start, screen_resume_chunk(items, job_json))
+    assert queue.get(batch_id)["status"] == "running"
+    assert queue.get(batch_id)["processed"] == 4
+
+    restarted = BatchQueue(path, chunk_size=4)
+    screened = []
+
+    def screen(items, job_json):
+        screened.extend(items)
+        return screen_resume_chunk(items, job_json)
+
+    monkeypatch.setattr("app.services.batch_queue.screen_resume_chunk", screen)
+    _drain(restarted, WorkerPool(max_workers=0, chunk_size=4), batch_id)
+
+    assert [candidate_id for candidate_id, _ in screened] == [f"CAND-{i:03d}" for i in range(5, 11)]
+    assert restarted.get(batch_id)["processed"] == 10
+    results = restarted.results(batch_id, limit=20, order="input")
+    ids = ["A", "B"] + [f"CAND-{i:03d}" for i in range(3, 11)]
+    items = list(zip(ids, texts))
+    # Scores do not depend on how the batch was chunked
+    expected = screen_resume_chunk(items, job.model_dump_json())
+    assert [result.pop("position") for result in results] == list(range(10))
+    assert results == expected
+    compiled = matcher_service.compile_job(job)
+    singles = [
+        matcher_service.match_resume_to_job(resume_parser.parse_record(text), compiled)
+        for text in texts
+    ]
+    assert [result["match_score"] for result in results] == [
+        single.match_score for single in singles
+    ]
+
+    ranked = restarted.results(batch_id, limit=3)
+    assert [result["rank"] for result in ranked] == [1, 2, 3]
+    scores = [result["match_score"] for result in ranked]
+    assert scores == sorted((result["match_score"] for result in expected), reverse=True)[:3]
+
+
+def test_cancel_and_delete(tmp_path):
+    queue = BatchQueue(str(tmp_path / "batches.sqlite3"), chunk_size=2)
+    batch_id = queue.submit(synthetic_resumes(4, seed=2), synthetic_job(0))
+
+    assert queue.cancel(batch_id)
+    assert queue.get(batch_id)["status"] == "cancelled"
+    assert queue.next_chunk() is None
+    assert queue.delete(batch_id)
+    assert queue.get(batch_id) is None
+    assert not queue.cancel(batch_id)
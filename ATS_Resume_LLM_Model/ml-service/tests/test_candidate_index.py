@@ -0,0 +1,118 @@
+"""
+Candidate index behavior: replacing, deleting and searching candidates
+"""
+
+import pytest
+
+from app.services.candidate_index import CandidateIndex, last_occurrences
+from app.services.candidate_store import CandidateStore
+from app.services.skill_bitmap import SkillBitmap
+from benchmarks.synthetic import synthetic_job
+
+
+@pytest.fixture
+def index(parser, matcher):
+    return CandidateIndex(matcher, skills=parser.skill_matcher.taxonomy)
+
+
+def test_last_occurrences_keeps_last_copy_and_missing_ids():
+    assert last_occurrences(["a", "b", "a", None, None, "c", "b"]) == [2, 3, 4, 5, 6]
+
+
+def test_repeated_id_in_one_batch_is_indexed_once(index, matcher, resumes):
+    index.add([("DUP", resumes[0]), ("OTHER", resumes[1]), ("DUP", resumes[2])])
+
+    assert len(index) == 2
+    assert index.stats()["candidates"] == 2
+    assert index.get("DUP") == resumes[2]
+    job = matcher.compile_job(synthetic_job(0))
+    assert sorted(c["id"] for c in index.search(job, top_k=10)) == ["DUP", "OTHER"]
+    everyone = " OR ".join(sorted({s.name.lower() for r in resumes[:3] for s in r.skills}))
+    assert sorted(index.filter(everyone)) == ["DUP", "OTHER"]
+    assert index.delete("DUP")
+    assert not index.delete("DUP")
+    assert [c["id"] for c in index.search(job, top_k=10)] == ["OTHER"]
+
+
+def test_repeated_id_with_precomputed_vectors(index, matcher, resumes):
+    batch = [("A", resumes[0]), ("A", resumes[1]), ("B", resumes[2])]
+    vectors = matcher.resume_vectors([resume for _, resume in batch])
+    index.add(batch, vectors)
+
+    fresh = CandidateIndex(matcher, skills=index._vocabulary)
+    fresh.add(batch[1:])
+    job = matcher.compile_job(synthetic_job(1))
+    expected = [(c["id"], c["ranking_score"]) for c in fresh.search(job, top_k=5)]
+    assert [(c["id"], c["ranking_score"]) for c in index.search(job, top_k=5)] == expected
+
+
+def test_readding_replaces_candidate(index, matcher, resumes):
+    index.add([("A", resumes[0]), ("B", resumes[1])])
+    index.add([("A", resumes[3])])
+
+    assert len(index) == 2
+    assert index.get("A") == resumes[3]
+    job = matcher.compile_job(synthetic_job(2))
+    assert sorted(c["id"] for c in index.search(job, top_k=10)) == ["A", "B"]
+
+
+def test_load_skips_repeated_id_within_a_segment(tmp_path, parser, matcher, resumes):
+    store = CandidateStore(str(tmp_path / "store"))
+    batch = [("A", resumes[0]), ("B", resumes[1]), ("A", resumes[2])]
+    vocabulary = list(parser.skill_matcher.taxonomy)
+    skills = SkillBitmap(vocabulary)
+    skills.append({s.name.lower() for s in resume.skills} for _, resume in batch)
+    store.append(
+        [candidate_id for candidate_id, _ in batch], [resume for _, resume in batch],
+        matcher.resume_vectors([resume for _, resume in batch]), skills.words,
+        vocabulary, matcher.model.fingerprint
+    )
+
+    index = CandidateIndex(matcher, skills=vocabulary, store=store)
+    assert index.load() == 2
+    assert index.ids() == ["B", "A"]
+    assert index.get("A").skills == resumes[2].to_model().skills
+    job = matcher.compile_job(synthetic_job(3))
+    assert sorted(c["id"] for c in index.search(job, top_k=10)) == ["A", "B"]
+
+
+def test_compact_repoints_loaded_rows(tmp_path, parser, matcher, resumes):
+    vocabulary = list(parser.skill_matcher.taxonomy)
+    writer = CandidateIndex(matcher, skills=vocabulary, store=CandidateStore(str(tmp_path)))
+    writer.add([(f"C{i}", resume) for i, resume in enumerate(resumes[:20])])
+    writer.add([(f"C{i}", resume) for i, resume in enumerate(resumes[20:40], start=20)])
+
+    index = CandidateIndex(matcher, skills=vocabulary, store=CandidateStore(str(tmp_path)))
+    assert index.load() == 40
+    old_segments = index.store.segments()
+    for i in range(0, 40, 3):
+        assert index.delete(f"C{i}")
+    assert not index.needs_compaction
+    index.compact()
+
+    [segment] = index.store.segments()
+    assert all(not old.path.exists() for old in old_segments)
+    assert all(row.segment.path == segment.path for row in index._resumes)
+    kept = [i for i in range(40) if i % 3]
+    assert index.ids() == [f"C{i}" for i in kept]
+    for i in kept:
+        assert index.get(f"C{i}") == resumes[i].to_model()
+    job = matcher.compile_job(synthetic_job(4))
+    assert {c["id"] for c in index.search(job, top_k=5)} <= {f"C{i}" for i in kept}
+
+
+def test_search_pages_equal_rank_candidates(index, matcher, resumes):
+    index.add([(f"C{i}", resume) for i, resume in enumerate(resumes)])
+    pool = [{"id": f"C{i}", "parsed_resume": resume} for i, resume in enumerate(resumes)]
+    for j in range(6):
+        job = matcher.compile_job(synthetic_job(j))
+        expected = matcher.rank_candidates(pool, job, top_k=25)
+        found = index.search(job, top_k=25)
+
+        assert [(c["id"], c["match_result"]) for c in found] == [
+            (c["id"], c["match_result"]) for c in expected
+        ]
+        # Whole-pool semantic similarity is the sparse product, bit for bit
+        _, _, columns = index.job_components(job)
+        semantic = matcher.match_matrix(resumes, [job])["semantic_similarity"][:, 0]
+        assert columns["semantic_similarity"].tolist() == semantic.tolist()
@@ -0,0 +1,60 @@
+"""
+Candidate store round trips: write through the index, reload, delete and compact
+"""
+
+import numpy as np
+
+from app.services.candidate_index import CandidateIndex, StoredRow
+from app.services.candidate_store import CandidateStore
+from benchmarks.synthetic import synthetic_job
+
+
+def _ranking(index, job, **kwargs):
+    return [(c["id"], c["ranking_score"]) for c in index.search(job, top_k=15, **kwargs)]
+
+
+def test_reload_matches_the_index_that_wrote_it(tmp_path, parser, matcher, resumes):
+    vocabulary = list(parser.skill_matcher.taxonomy)
+    writer = CandidateIndex(matcher, skills=vocabulary, store=CandidateStore(str(tmp_path)))
+    writer.add([(f"C{i}", resume) for i, resume in enumerate(resumes[:60])])
+    writer.add([(f"C{i}", resume) for i, resume in enumerate(resumes[60:], start=40)])
+    for i in range(0, 40, 7):
+        assert writer.delete(f"C{i}")
+
+    reader = CandidateIndex(matcher, skills=vocabulary, store=CandidateStore(str(tmp_path)))
+    assert reader.load() == len(writer)
+    assert reader.ids() == writer.ids()
+    assert all(isinstance(row, StoredRow) for row in reader._resumes if row is not None)
+    for j in range(5):
+        job = matcher.compile_job(synthetic_job(j))
+        assert _ranking(reader, job) == _ranking(writer, job)
+        ids = ["C1", "C45", "C70", "C100"]
+        assert _ranking(reader, job, candidate_ids=ids) == _ranking(writer, job, candidate_ids=ids)
+    assert reader.get("C45") == resumes[65].to_model()
+    assert reader.ats_scores(["C45", "C1"]) == writer.ats_scores(["C45", "C1"])
+    skill = resumes[65].skills[0].name.lower()
+    assert reader.filter(skill) == writer.filter(skill)
+
+
+def test_compacted_store_reloads_live_rows_only(tmp_path, parser, matcher, resumes):
+    vocabulary = list(parser.skill_matcher.taxonomy)
+    index = CandidateIndex(matcher, skills=vocabulary, store=CandidateStore(str(tmp_path)))
+    index.add([(f"C{i}", resume) for i, resume in enumerate(resumes[:30])])
+    index.add([("C3", resumes[31])])
+    for i in (0, 5, 9):
+        index.delete(f"C{i}")
+    index.compact()
+
+    store = CandidateStore(str(tmp_path))
+    [segment] = store.segments()
+    assert sorted(segment.ids) == sorted(index.ids())
+    assert store.tombstones() == {}
+    reloaded = CandidateIndex(matcher, skills=vocabulary, store=store)
+    assert reloaded.load() == 27
+    assert reloaded.get("C3") == resumes[31].to_model()
+    job = matcher.compile_job(synthetic_job(2))
+    assert _ranking(reloaded, job) == _ranking(index, job)
+    assert np.array_equal(
+        reloaded.job_components(job)[2]["semantic_similarity"][np.argsort(reloaded.ids())],
+        index.job_components(job)[2]["semantic_similarity"][np.argsort(index.ids())]
+    )
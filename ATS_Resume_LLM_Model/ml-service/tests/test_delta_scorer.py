@@ -0,0 +1,67 @@
+"""
+Delta scorer agreement with full rescoring of edited resumes
+"""
+
+import pytest
+
+from app.models.schemas import Certification, Experience, ResumeEdit, Skill
+from app.services.delta_scorer import EDIT_ANCHORS, DeltaScorer
+from app.services.matcher import MatcherService
+from app.services.resume_parser import resume_parser
+from app.services.scorer import ScorerService
+from benchmarks.synthetic import synthetic_job, synthetic_resumes
+
+
+def _apply(delta, state, edits):
+    """The edited resume, as DeltaScorer places each edit kind"""
+    resume = state.resume.model_copy(deep=True)
+    for edit in sorted(edits, key=lambda edit: EDIT_ANCHORS.index(edit.kind)):
+        if edit.kind == "skill":
+            if edit.value.lower() not in {skill.name.lower() for skill in resume.skills}:
+                resume.skills.append(Skill(name=edit.value))
+        elif edit.kind == "summary":
+            resume.summary = resume.summary or edit.value or delta.draft_summary(state)
+        elif edit.kind == "keyword":
+            experience = resume.experience[-1]
+            experience.description = f"{experience.description or ''} {edit.value}"
+        elif edit.kind == "experience":
+            resume.experience.append(Experience(title=edit.value, company="", duration="", years=0))
+        elif edit.kind == "certification":
+            resume.certifications.append(Certification(name=edit.value, issuer=""))
+    return resume
+
+
+@pytest.mark.parametrize("with_model", [True, False], ids=["model", "pair"])
+def test_edit_scores_match_full_rescoring(with_model, tfidf_model):
+    matcher = MatcherService(model=tfidf_model if with_model else None)
+    scorer = ScorerService()
+    delta = DeltaScorer(matcher, scorer)
+    checked = 0
+    for i, text in enumerate(synthetic_resumes(12, seed=6)):
+        parsed = resume_parser.parse_resume(text)
+        job = matcher.compile_job(synthetic_job(i % 4))
+        state = delta.prepare(parsed, job)
+        edits = delta.candidate_edits(state)[:8] + [
+            ResumeEdit(kind="certification", value="AWS Certified Solutions Architect"),
+            ResumeEdit(kind="experience", value="Senior Data Engineer building pipelines"),
+        ]
+        if not parsed.experience:
+            edits = [edit for edit in edits if edit.kind != "keyword"]
+        edit_sets = [[edit] for edit in edits] + [edits[:5]]
+
+        match_scores, ats_scores = delta.evaluate(state, edit_sets)
+        for edit_set, match_score, ats_score in zip(edit_sets, match_scores, ats_scores):
+            edited = _apply(delta, state, edit_set)
+            match = matcher.match_resume_to_job(edited, job)
+            assert match.match_score == pytest.approx(match_score, abs=1e-9), edit_set
+            ats = scorer.calculate_ats_score(edited, job.job, match)
+            assert ats.overall_score == pytest.approx(ats_score, abs=1e-9), edit_set
+            checked += 1
+
+        projected_match, projected_ats = delta.project(state, edits[:5])
+        edited = _apply(delta, state, edits[:5])
+        match = matcher.match_resume_to_job(edited, job)
+        assert projected_match.match_score == match.match_score
+        assert sorted(projected_match.missing_skills) == sorted(match.missing_skills)
+        assert projected_ats == scorer.calculate_ats_score(edited, job.job, match)
+    assert checked > 100
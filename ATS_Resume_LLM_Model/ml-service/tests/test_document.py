@@ -0,0 +1,33 @@
+"""
+Resume document sections
+"""
+
+import pytest
+
+from app.services.document import ResumeDocument
+
+
+@pytest.mark.parametrize("line, section", [
+    ("EXPERIENCE", "experience"),
+    ("Skills:", "skills"),
+    ("Professional Summary", "summary"),
+    ("Relevant Work Experience", "experience"),
+    ("Awards & Honors", "awards"),
+    ("Licenses and Certifications", "certifications"),
+    ("Software engineering experience", None),
+    ("Python skills", None),
+    ("Education and training", None),
+    ("Led the projects", None),
+])
+def test_classify_header(line, section):
+    assert ResumeDocument._classify_header(line) == section
+
+
+def test_sentence_ending_in_a_header_phrase_stays_in_its_section():
+    doc = ResumeDocument(
+        "SUMMARY\nBackend developer\nSoftware engineering experience\n"
+        "EXPERIENCE\nEngineer at Acme\n"
+    )
+
+    assert doc.section_text("summary") == "Backend developer\nSoftware engineering experience\n"
+    assert doc.section_text("experience") == "Engineer at Acme\n"
@@ -0,0 +1,73 @@
+"""
+Job index behavior: recommendations and education requirement bookkeeping
+"""
+
+from app.models.schemas import JobDescription
+from app.services.job_index import JobIndex
+from app.services.matcher import MatcherService
+from benchmarks.synthetic import synthetic_job
+
+NICHE = JobDescription(
+    job_id="NICHE",
+    title="Observatory Archivist",
+    description="Catalogue plates from the observatory archive.",
+    education_requirements=["Doctorate in Astrophysics"]
+)
+
+
+def test_recommend_checks_education_for_prefiltered_jobs_only(tfidf_model, resumes, monkeypatch):
+    matcher = MatcherService(model=tfidf_model)
+    index = JobIndex(matcher)
+    jobs = [matcher.compile_job(synthetic_job(j)) for j in range(40)]
+    for job in jobs:
+        index.add(job)
+    niche = matcher.compile_job(NICHE)
+    index.add(niche)
+
+    checked = []
+    check = matcher.check_education_match
+
+    def spy(education, requirements):
+        checked.append(requirements)
+        return check(education, requirements)
+
+    monkeypatch.setattr(matcher, "check_education_match", spy)
+    resume = resumes[0]
+    ranked = index.recommend(resume, top_k=5)
+    monkeypatch.undo()
+
+    assert niche.education_tokens not in checked
+    assert len(checked) == len(set(checked))
+    for entry in ranked:
+        assert entry["match_result"] == matcher.match_resume_to_job(resume, entry["job"])
+
+
+def test_education_keys_are_dropped_with_their_last_job(tfidf_model, resumes):
+    matcher = MatcherService(model=tfidf_model)
+    index = JobIndex(matcher)
+    jobs = [matcher.compile_job(synthetic_job(j)) for j in range(20)]
+    for job in jobs:
+        index.add(job)
+    niche = matcher.compile_job(NICHE)
+    index.add(niche)
+    requirements = index.stats()["education_requirements"]
+    assert requirements == len({job.education_tokens for job in jobs}) + 1
+
+    # Replacing a job releases its old key
+    index.add(matcher.compile_job(NICHE.model_copy(update={"education_requirements": []})))
+    assert index.stats()["education_requirements"] == requirements
+    assert index.delete("NICHE")
+    assert index.stats()["education_requirements"] == requirements - 1
+
+    shared = [job for job in jobs if job.education_tokens == jobs[0].education_tokens]
+    for job in shared[:-1]:
+        index.delete(job.job_id)
+    assert index.stats()["education_requirements"] == requirements - 1
+    index.delete(shared[-1].job_id)
+    assert index.stats()["education_requirements"] == requirements - 2
+
+    # A re-added requirement gets a fresh key and still scores correctly
+    index.add(niche)
+    resume = resumes[1]
+    for entry in index.recommend(resume, top_k=len(index)):
+        assert entry["match_result"] == matcher.match_resume_to_job(resume, entry["job"])
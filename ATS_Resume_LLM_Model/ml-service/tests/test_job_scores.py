@@ -0,0 +1,90 @@
+"""
+Job score tables: reuse across restarts and invalidation when the pool changes
+"""
+
+import numpy as np
+import pytest
+
+from app.services.candidate_index import CandidateIndex
+from app.services.candidate_store import CandidateStore
+from app.services.job_scores import JobScoreService
+from benchmarks.synthetic import synthetic_job
+
+
+@pytest.fixture
+def job(matcher):
+    return matcher.compile_job(synthetic_job(0))
+
+
+def _index(tmp_path, parser, matcher):
+    return CandidateIndex(
+        matcher, skills=parser.skill_matcher.taxonomy, store=CandidateStore(str(tmp_path / "store"))
+    )
+
+
+def _columns_equal(a, b):
+    return a.keys() == b.keys() and all(np.array_equal(a[name], b[name]) for name in a)
+
+
+def test_saved_table_is_reused_after_restart(tmp_path, parser, matcher, resumes, job):
+    index = _index(tmp_path, parser, matcher)
+    index.add([(f"C{i}", resume) for i, resume in enumerate(resumes[:30])])
+    first = JobScoreService(index, path=str(tmp_path / "scores")).table(job)
+
+    restarted = _index(tmp_path, parser, matcher)
+    restarted.load()
+    assert restarted.pool_state()[1] == index.pool_state()[1]
+    table = JobScoreService(restarted, path=str(tmp_path / "scores")).table(job)
+    assert isinstance(table.columns["semantic_similarity"], np.memmap)
+    assert table.ids == first.ids
+    assert _columns_equal(table.columns, first.columns)
+
+
+def test_readding_an_id_invalidates_saved_table(tmp_path, parser, matcher, resumes, job):
+    index = _index(tmp_path, parser, matcher)
+    index.add([(f"C{i}", resume) for i, resume in enumerate(resumes[:30])])
+    stale = JobScoreService(index, path=str(tmp_path / "scores")).table(job)
+
+    # The last id keeps its position, so only the contents differ
+    index.add([("C29", resumes[40])])
+    restarted = _index(tmp_path, parser, matcher)
+    restarted.load()
+    table = JobScoreService(restarted, path=str(tmp_path / "scores")).table(job)
+
+    assert table.ids == stale.ids
+    expected = restarted.job_components(job)
+    assert table.ids == expected[0]
+    assert _columns_equal(table.columns, expected[2])
+    assert not _columns_equal(table.columns, stale.columns)
+
+
+def test_scoring_runs_outside_the_service_lock(tmp_path, parser, matcher, resumes, job, monkeypatch):
+    index = _index(tmp_path, parser, matcher)
+    index.add([(f"C{i}", resume) for i, resume in enumerate(resumes[:10])])
+    service = JobScoreService(index)
+    score = index.job_components
+
+    def job_components(compiled):
+        assert service._lock.acquire(blocking=False)
+        service._lock.release()
+        return score(compiled)
+
+    monkeypatch.setattr(index, "job_components", job_components)
+    assert len(service.table(job)) == 10
+
+
+def test_table_scored_while_pool_changes_is_not_cached(tmp_path, parser, matcher, resumes, job, monkeypatch):
+    index = _index(tmp_path, parser, matcher)
+    index.add([(f"C{i}", resume) for i, resume in enumerate(resumes[:10])])
+    service = JobScoreService(index, path=str(tmp_path / "scores"))
+    score = index.job_components
+
+    def job_components(compiled):
+        index.add([("LATE", resumes[50])])
+        return score(compiled)
+
+    monkeypatch.setattr(index, "job_components", job_components)
+    assert "LATE" in service.table(job).ids
+    monkeypatch.undo()
+    assert len(service.table(job)) == 11
+    assert service._tables[job.job_id][0] == index.version
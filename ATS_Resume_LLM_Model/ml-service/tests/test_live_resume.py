@@ -0,0 +1,34 @@
+"""
+Live resume socket: a failing update task closes the session with an error
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.main import app
+from app.routers import resume
+from benchmarks.synthetic import synthetic_resumes
+
+
+def test_update_task_failure_closes_the_socket(monkeypatch):
+    def remaining(self, now):
+        raise RuntimeError("debouncer broke")
+
+    monkeypatch.setattr(resume.Debouncer, "remaining", remaining)
+    with TestClient(app).websocket_connect("/api/resume/live") as websocket:
+        websocket.send_json({"type": "init", "text": synthetic_resumes(1)[0], "version": 1})
+        with pytest.raises(WebSocketDisconnect) as closed:
+            websocket.receive_json()
+
+    assert closed.value.code == 1011
+    assert "debouncer broke" in closed.value.reason
+
+
+def test_updates_are_sent_until_the_client_leaves():
+    with TestClient(app).websocket_connect("/api/resume/live") as websocket:
+        websocket.send_json({"type": "init", "text": synthetic_resumes(1)[0], "version": 1})
+        update = websocket.receive_json()
+
+    assert update["type"] == "update"
+    assert update["version"] == 1
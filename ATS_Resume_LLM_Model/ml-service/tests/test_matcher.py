@@ -0,0 +1,44 @@
+"""
+Matcher behavior: batched components agree with single matches
+"""
+
+import pytest
+
+from app.models.schemas import JobDescription, ParsedResume
+from app.services.matcher import MatcherService
+from benchmarks.synthetic import synthetic_job
+
+
+def test_match_matrix_without_model_handles_empty_vocabulary():
+    matcher = MatcherService()
+    job = matcher.compile_job(JobDescription(
+        job_id="J", title="The", description="and the of", required_skills=[]
+    ))
+    resume = ParsedResume(candidate_id="C", anonymized_name="Candidate A", primary_role="The")
+
+    components = matcher.match_matrix([resume], [job])
+
+    assert components["semantic_similarity"].tolist() == [[0.5]]
+    single = matcher.match_resume_to_job(resume, job)
+    assert single.semantic_similarity == 0.5
+
+
+@pytest.mark.parametrize("with_model", [True, False], ids=["model", "no-model"])
+def test_rank_candidates_agrees_with_single_matches(with_model, tfidf_model, resumes):
+    matcher = MatcherService(model=tfidf_model if with_model else None)
+    pool = resumes[:40]
+    for j in range(3):
+        job = matcher.compile_job(synthetic_job(j))
+        singles = [matcher.match_resume_to_job(resume, job) for resume in pool]
+        ranked = matcher.rank_candidates(
+            [{"id": i, "parsed_resume": resume} for i, resume in enumerate(pool)], job
+        )
+
+        assert [c["match_result"] for c in ranked] == [singles[c["id"]] for c in ranked]
+        scores = [c["ranking_score"] for c in ranked]
+        assert scores == sorted((single.match_score for single in singles), reverse=True)
+        # A window of the pool scores its candidates exactly as the whole pool does
+        window = matcher.rank_candidates(
+            [{"id": i, "parsed_resume": pool[i]} for i in range(5, 15)], job
+        )
+        assert all(c["match_result"] == singles[c["id"]] for c in window)
@@ -0,0 +1,51 @@
+"""
+Streamed ranking: the summary page does not depend on how candidates are windowed
+"""
+
+import asyncio
+
+import pytest
+
+from app.routers import matching
+from app.services.matcher import MatcherService
+from benchmarks.synthetic import synthetic_job
+
+
+def _summary(parsed, job, window):
+    async def windows():
+        for start in range(0, len(parsed), window):
+            yield matching._score_window(parsed[start:start + window], job)
+
+    async def run():
+        stream = windows()
+        first = await stream.__anext__()
+        return [
+            (event, data)
+            async for event, data in matching._ranking_events(first, stream, 2, 10)
+        ]
+
+    events = asyncio.run(run())
+    assert events[-1][0] == "summary"
+    return events[-1][1]
+
+
+@pytest.mark.parametrize("with_model", [True, False], ids=["model", "no-model"])
+def test_streamed_page_is_independent_of_window_size(with_model, tfidf_model, resumes, monkeypatch):
+    matcher = MatcherService(model=tfidf_model if with_model else None)
+    monkeypatch.setattr(matching, "matcher_service", matcher)
+    job = matcher.compile_job(synthetic_job(1))
+    pool = resumes[:30]
+    parsed = [{"id": f"C{i}", "parsed_resume": resume} for i, resume in enumerate(pool)]
+
+    summaries = [_summary(parsed, job, window) for window in (30, 7, 1)]
+
+    assert summaries[0] == summaries[1] == summaries[2]
+    singles = {
+        f"C{i}": round(matcher.match_resume_to_job(resume, job).match_score, 2)
+        for i, resume in enumerate(pool)
+    }
+    ranked = sorted(singles.items(), key=lambda item: item[1], reverse=True)
+    assert summaries[0]["total"] == len(pool)
+    assert [r["ats_score"] for r in summaries[0]["rankings"]] == [
+        score for _, score in ranked[2:12]
+    ]
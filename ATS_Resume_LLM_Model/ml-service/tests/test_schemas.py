@@ -0,0 +1,14 @@
+"""
+Request model validation
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.schemas import WeightProfile
+
+
+def test_weight_profile_thresholds():
+    assert WeightProfile(hire_threshold=70, review_threshold=70).review_threshold == 70
+    with pytest.raises(ValidationError, match="review_threshold"):
+        WeightProfile(hire_threshold=50, review_threshold=60)
@@ -0,0 +1,82 @@
+"""
+Scorer behavior: the vectorized ATS scores agree with calculate_ats_score
+"""
+
+import numpy as np
+import pytest
+
+from app.models.schemas import Certification, Education, Experience, ParsedResume, Skill
+from app.services.scorer import ScorerService
+from benchmarks.synthetic import synthetic_job
+
+
+def _edge_resumes():
+    """Hand-built resumes covering each branch of the scalar components"""
+    resumes = []
+    for i, (skills, years, degree) in enumerate([
+        (0, 0.0, None), (4, 0.5, "Diploma"), (5, 1.0, "Bachelor of Science"),
+        (9, 2.5, "Master of Science"), (10, 3.0, "Ph.D."), (15, 5.0, None),
+        (22, 12.25, "Bachelor of Science"),
+    ]):
+        resumes.append(ParsedResume(
+            candidate_id=f"E{i}",
+            anonymized_name=f"Candidate {i}",
+            skills=[Skill(name=f"skill{s}") for s in range(skills)],
+            education=[Education(degree=degree, field="Physics", institution="U")] if degree else [],
+            experience=[
+                Experience(title="Engineer", company="Co", duration="1 year", years=1.0)
+            ] * (i % 3),
+            certifications=[Certification(name="Cert", issuer="Org")] if i % 2 else [],
+            total_experience_years=years,
+            summary="Engineer" if i % 3 else None,
+        ))
+    return resumes
+
+
+@pytest.fixture(scope="module")
+def pool(resumes):
+    return resumes[:60] + _edge_resumes()
+
+
+@pytest.mark.parametrize("job_index", [None, 0, 3], ids=["no-job", "job-0", "job-3"])
+@pytest.mark.parametrize("with_matches", [False, True], ids=["no-match", "match"])
+def test_calculate_ats_scores_agrees_with_scalar(job_index, with_matches, matcher, pool):
+    scorer = ScorerService()
+    job = None if job_index is None else synthetic_job(job_index)
+    if job is not None and job_index == 3:
+        job = job.model_copy(update={"min_experience_years": 4.5})
+    matches = None
+    if with_matches:
+        compiled = matcher.compile_job(job or synthetic_job(1))
+        # Every third resume is scored without a match result
+        matches = [
+            None if i % 3 == 0 else matcher.match_resume_to_job(resume, compiled)
+            for i, resume in enumerate(pool)
+        ]
+
+    expected = [
+        scorer.calculate_ats_score(resume, job, matches[i] if matches else None).model_dump(mode="json")
+        for i, resume in enumerate(pool)
+    ]
+    assert scorer.calculate_ats_scores(pool, job, matches) == expected
+
+
+def test_scores_from_component_arrays_agrees_with_scalar():
+    scorer = ScorerService()
+    rng = np.random.default_rng(17)
+    n = 500
+    components = {name: rng.uniform(0, 100, n) for name in ScorerService.WEIGHTS}
+    # Values on .x5 rounding ties and overall scores at the thresholds
+    components["skills"][:20] = np.arange(20) * 5 + 0.25
+    components["keywords"][20:40] = np.round(rng.uniform(0, 100, 20), 2) + 0.05
+    for name in ScorerService.WEIGHTS:
+        components[name][40:43] = (ScorerService.REVIEW_THRESHOLD, ScorerService.HIRE_THRESHOLD, 100)
+    skill_counts = rng.integers(0, 12, n)
+
+    expected = [
+        scorer.score_from_components(
+            {name: float(values[i]) for name, values in components.items()}, int(skill_counts[i])
+        ).model_dump(mode="json")
+        for i in range(n)
+    ]
+    assert scorer.scores_from_component_arrays(components, skill_counts) == expected
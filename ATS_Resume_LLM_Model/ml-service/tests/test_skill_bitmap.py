@@ -0,0 +1,44 @@
+"""
+Skill bitmap behavior: popcounts and coverage counts
+"""
+
+import numpy as np
+import pytest
+
+from app.services import skill_bitmap
+from app.services.skill_bitmap import SkillBitmap, popcount
+
+
+WORDS = np.array([0, 1, 0xFF, 2 ** 63, 2 ** 64 - 1, 0x5555555555555555], dtype=np.uint64)
+EXPECTED = [bin(int(word)).count("1") for word in WORDS]
+
+
+def _uint8_bitwise_count(words):
+    """What np.bitwise_count returns on NumPy >= 2.0"""
+    return np.array([bin(int(word)).count("1") for word in words], dtype=np.uint8)
+
+
+@pytest.fixture(params=["swar", "bitwise_count"])
+def numpy_popcount(request, monkeypatch):
+    if request.param == "swar":
+        monkeypatch.delattr(np, "bitwise_count", raising=False)
+    else:
+        monkeypatch.setattr(skill_bitmap.np, "bitwise_count", _uint8_bitwise_count, raising=False)
+    return request.param
+
+
+def test_popcount_returns_int64_counts(numpy_popcount):
+    counts = popcount(WORDS)
+    assert counts.dtype == np.int64
+    assert counts.tolist() == EXPECTED
+
+
+def test_count_and_sizes(numpy_popcount):
+    vocabulary = [f"skill{i}" for i in range(130)]
+    bitmap = SkillBitmap(vocabulary)
+    rows = [{"skill0", "skill64", "skill129"}, set(vocabulary), {"skill5"}]
+    bitmap.append(rows)
+
+    assert bitmap.sizes(np.arange(3)).tolist() == [3, 130, 1]
+    mask = bitmap.mask(["skill0", "skill5", "skill129", "unknown"])
+    assert bitmap.count(mask).tolist() == [2, 3, 1]
@@ -0,0 +1,23 @@
+"""
+TF-IDF model behavior: persistence and fingerprints
+"""
+
+import numpy as np
+
+from app.services.tfidf_model import TfidfModel
+
+
+def test_save_load_round_trip(tmp_path, tfidf_model):
+    tfidf_model.save(str(tmp_path))
+    loaded = TfidfModel.load(str(tmp_path))
+
+    assert loaded.fingerprint == tfidf_model.fingerprint
+    texts = ["Senior Python engineer with AWS and Docker", "Data analyst, SQL and Tableau"]
+    assert (loaded.transform(texts) != tfidf_model.transform(texts)).nnz == 0
+
+
+def test_fingerprint_covers_idf_weights(tfidf_model):
+    reweighted = TfidfModel(tfidf_model.terms, np.asarray(tfidf_model.idf) * 1.5)
+
+    assert reweighted.fingerprint != tfidf_model.fingerprint
+    assert TfidfModel(tfidf_model.terms, np.array(tfidf_model.idf)).fingerprint == tfidf_model.fingerprint
@@ -0,0 +1,23 @@
+"""
+Worker pool behavior without worker processes
+"""
+
+import asyncio
+import threading
+
+from app.services.worker_pool import WorkerPool
+
+
+def _thread_names(chunk):
+    return [(item, threading.current_thread().name) for item in chunk]
+
+
+def test_inline_pool_runs_chunks_off_the_event_loop():
+    pool = WorkerPool(max_workers=0, chunk_size=2)
+
+    async def run():
+        return threading.current_thread().name, await pool.map(_thread_names, list(range(5)))
+
+    loop_thread, results = asyncio.run(run())
+    assert [item for item, _ in results] == [0, 1, 2, 3, 4]
+    assert all(thread != loop_thread for _, thread in results)